@@ -1 +1 @@
-from ._factory import get_agent_response
\ No newline at end of file
+from ._factory import get_agent_response, aget_agent_response, stream_agent_response, init_agent, rebuild_agent, is_agent_ready
\ No newline at end of file
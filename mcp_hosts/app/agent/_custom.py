@@ -1,29 +1,95 @@
-from typing import Callable, List
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from langchain.agents import AgentExecutor
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import HumanMessage, BaseMessage, AIMessage
 from langchain_core.load import dumps, loads
 from langchain_core.caches import BaseCache
 from langchain_core.outputs import Generation
+import app.core.config as cfg
+from app.cache.expiry import EXPIRES_AT_KEY
 from app.memory.retriever import MemoryRetriever
+from app.memory.summary import ConversationSummarizer
+from ._router import ToolSubsetExecutors
+
+# Tóm tắt cần một lần gọi LLM: chạy trên vài thread riêng, ngoài luồng xử lý request,
+# dùng chung cho mọi executor (kể cả các executor được tạo lại khi tool thay đổi)
+_SUMMARY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='summary')
 
 class SemanticMemoryAndCacheAgentExecutor:
     def __init__(self,
                  base_agent_exec: AgentExecutor,
                  chat_history_getter: Callable[[str], BaseChatMessageHistory],
                  memory_retriever: MemoryRetriever,
-                 agent_cache: BaseCache
+                 agent_cache: BaseCache,
+                 streaming_agent_exec: Optional[AgentExecutor] = None,
+                 tool_executors: Optional[ToolSubsetExecutors] = None,
+                 summarizer: Optional[ConversationSummarizer] = None
                  ):
         self.base_agent_exec = base_agent_exec
+        # Executor dùng cho chế độ streaming (stream_runnable=True để nhận token của LLM)
+        self.streaming_agent_exec = streaming_agent_exec or base_agent_exec
         self.chat_history_getter = chat_history_getter
         self.memory_retriever = memory_retriever
         self.agent_cache = agent_cache
+        # Nếu bật tool routing: cặp executor (thường, streaming) chỉ gắn các tool liên quan tới câu hỏi.
+        # `base_agent_exec` vẫn giữ toàn bộ tool để tra metadata (TTL) của mọi tool.
+        self.tool_executors = tool_executors
+        # Rolling summary: gộp các lượt cũ vào bản tóm tắt khi session quá dài
+        self.summarizer = summarizer
         
+    def _compact_history(self, session_id: str, chat_history: BaseChatMessageHistory) -> None:
+        """Gộp các lượt cũ của session vào bản tóm tắt nếu lịch sử đã vượt ngưỡng."""
+        try:
+            self.summarizer.compact(session_id, chat_history)
+        except Exception as e:
+            print(f"ERROR:    Could not compact history of session '{session_id}': {e}")
+
+    def _schedule_compaction(self, session_id: str, chat_history: BaseChatMessageHistory) -> None:
+        """Chạy `_compact_history` trên thread pool riêng, không chờ kết quả."""
+        if self.summarizer is not None:
+            _SUMMARY_POOL.submit(self._compact_history, session_id, chat_history)
+
+    def _select_executors(self, input_str: str) -> Tuple[AgentExecutor, AgentExecutor]:
+        """Chọn cặp executor (thường, streaming) cho câu hỏi: theo tool routing nếu bật, ngược lại dùng toàn bộ tool."""
+        if self.tool_executors is None:
+            return self.base_agent_exec, self.streaming_agent_exec
+        try:
+            return self.tool_executors.select(input_str)
+        except Exception as e:
+            print(f"WARNING:  Tool routing failed, binding every tool: {e}")
+            return self.base_agent_exec, self.streaming_agent_exec
+
     def _create_cache_key(self, message: HumanMessage, retrieved_history: List[BaseMessage]) -> str:
         """Tạo một prompt 'sạch' và ổn định để dùng làm key cho cache."""
         context = "\n".join([m.content for m in retrieved_history])
         return f"Context:\n{context}\n\nUser Question:\n{message.content}"
     
+    def _answer_ttl(self, result: dict) -> int:
+        """
+        Tính thời gian sống (giây) của câu trả lời trong cache dựa trên các tool đã tạo ra nó:
+        lấy `cache_ttl_seconds` nhỏ nhất trong các tool đã dùng, hoặc TTL dài nếu không dùng tool nào.
+        """
+        tool_ttls = {tool.name: (tool.metadata or {}).get('cache_ttl_seconds') for tool in self.base_agent_exec.tools}
+        used_tools = {action.tool for action, _ in result.get("intermediate_steps", []) if action.tool != "_Exception"}
+        if not used_tools:
+            return cfg.LLM_CACHE_NO_TOOL_TTL
+        return min(
+            cfg.LLM_CACHE_DEFAULT_TOOL_TTL if tool_ttls.get(tool) is None else tool_ttls[tool]
+            for tool in used_tools
+        )
+
+    def _cache_entry(self, result: dict) -> Optional[List[Generation]]:
+        """Serialize kết quả để lưu vào cache, kèm thời điểm hết hạn; None nếu không được cache."""
+        ttl = self._answer_ttl(result)
+        if ttl <= 0:
+            return None
+        payload = {k: v for k, v in result.items() if k != "intermediate_steps"}
+        return [Generation(text=dumps(payload), generation_info={EXPIRES_AT_KEY: time.time() + ttl})]
+
     def invoke(self, input_str: str, session_id: str):    
         human_message = HumanMessage(content=input_str)
         
@@ -32,31 +98,144 @@ class SemanticMemoryAndCacheAgentExecutor:
         print(f'INFO: Successfully get {len(chat_history.messages)} history.')
         
         # 2. Dùng Retriever để lấy ngữ cảnh liên quan
-        retrieved_memory = self.memory_retriever.retrieve(human_message, chat_history.messages)
+        retrieved_memory = self.memory_retriever.retrieve(human_message, session_id, chat_history.messages)
         print(f'INFO: Successfully retrieved memory with {len(retrieved_memory)}')
         
         # 3. Tạo cache key và kiểm tra cache
         cache_key = self._create_cache_key(human_message, retrieved_memory)
         # `llm_string` không quan trọng với cache tùy chỉnh của chúng ta, có thể để trống
-        cached_result = self.agent_cache.lookup(cache_key, "")
+        cached_result = self.agent_cache.lookup(cache_key, "") if self.agent_cache else None
         print(f'INFO: CACHE RESULTS: {len(cached_result) if cached_result else 0}')
         
         if cached_result:
             # Deserialize kết quả từ cache và trả về
             return loads(cached_result[0].text)
 
-        # 4. Nếu cache miss, thực thi Agent
-        result = self.base_agent_exec.invoke({
+        # 4. Nếu cache miss, thực thi Agent (chỉ với các tool liên quan nếu bật tool routing)
+        agent_exec, _ = self._select_executors(input_str)
+        result = agent_exec.invoke({
             "input": input_str,
             # Prompt của bạn cần được sửa để dùng key này
             "retrieved_chat_history": retrieved_memory, 
         })
 
         # 5. Cập nhật cache và history
-        # Serialize kết quả thành chuỗi để lưu vào cache
-        self.agent_cache.update(cache_key, "", [Generation(text=dumps(result))])
+        # Serialize kết quả thành chuỗi để lưu vào cache, với TTL theo các tool đã dùng
+        cache_entry = self._cache_entry(result) if self.agent_cache else None
+        if cache_entry:
+            self.agent_cache.update(cache_key, "", cache_entry)
+
+        # Cập nhật chat history lâu dài và index vector của session (chỉ embed cặp mới)
+        ai_message = AIMessage(content=result["output"])
+        chat_history.add_messages([human_message, ai_message])
+        self.memory_retriever.add_turn(session_id, human_message, ai_message)
+        self._schedule_compaction(session_id, chat_history)
+        
+        return result
+
+    async def _aprepare(self, human_message: HumanMessage, session_id: str):
+        """
+        Phần chung của `ainvoke` và `astream`: lấy history, truy xuất ngữ cảnh và tra cache
+        mà không chặn event loop.
+        """
+        # 1. Lấy lịch sử chat (tạo đối tượng history và embedding chạy trong thread pool)
+        chat_history = await asyncio.to_thread(self.chat_history_getter, session_id)
+        history_messages = await chat_history.aget_messages()
+        print(f'INFO: Successfully get {len(history_messages)} history.')
+
+        # 2. Dùng Retriever để lấy ngữ cảnh liên quan
+        retrieved_memory = await asyncio.to_thread(
+            self.memory_retriever.retrieve, human_message, session_id, history_messages
+        )
+        print(f'INFO: Successfully retrieved memory with {len(retrieved_memory)}')
+
+        # 3. Tạo cache key và kiểm tra cache
+        cache_key = self._create_cache_key(human_message, retrieved_memory)
+        cached_result = await self.agent_cache.alookup(cache_key, "") if self.agent_cache else None
+        print(f'INFO: CACHE RESULTS: {len(cached_result) if cached_result else 0}')
+        return chat_history, retrieved_memory, cache_key, cached_result
+
+    async def _aremember(self, session_id: str, chat_history: BaseChatMessageHistory,
+                         cache_key: str, human_message: HumanMessage, result: dict) -> None:
+        """Cập nhật cache, history và index vector của session sau một lượt hội thoại."""
+        cache_entry = self._cache_entry(result) if self.agent_cache else None
+        if cache_entry:
+            await self.agent_cache.aupdate(cache_key, "", cache_entry)
+        ai_message = AIMessage(content=result["output"])
+        await chat_history.aadd_messages([human_message, ai_message])
+        await asyncio.to_thread(self.memory_retriever.add_turn, session_id, human_message, ai_message)
+        # Tóm tắt chạy nền để không làm chậm câu trả lời
+        self._schedule_compaction(session_id, chat_history)
+
+    async def ainvoke(self, input_str: str, session_id: str):
+        """
+        Phiên bản async của `invoke`: không chiếm thread nào trong lúc chờ LLM hay tool,
+        nên một process có thể xử lý nhiều cuộc hội thoại đồng thời.
+        """
+        human_message = HumanMessage(content=input_str)
+        chat_history, retrieved_memory, cache_key, cached_result = await self._aprepare(human_message, session_id)
+        if cached_result:
+            # Deserialize kết quả từ cache và trả về
+            return loads(cached_result[0].text)
+
+        # 4. Nếu cache miss, thực thi Agent (tool được gọi qua coroutine của chúng)
+        agent_exec, _ = await asyncio.to_thread(self._select_executors, human_message.content)
+        result = await agent_exec.ainvoke({
+            "input": human_message.content,
+            "retrieved_chat_history": retrieved_memory,
+        })
+
+        # 5. Cập nhật cache và history
+        await self._aremember(session_id, chat_history, cache_key, human_message, result)
+        return result
 
-        # Cập nhật chat history lâu dài
-        chat_history.add_messages([human_message, AIMessage(content=result["output"])])
+    async def astream(self, input_str: str, session_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Chạy agent ở chế độ streaming, trả về lần lượt các sự kiện dạng
+        {"event": ..., "data": ...}:
+        - `tool_start` / `tool_end`: khi một tool bắt đầu / kết thúc
+        - `token`: từng phần nội dung do LLM sinh ra
+        - `final`: câu trả lời cuối cùng (sau khi đã cập nhật cache và history)
         
-        return result
\ No newline at end of file
+        Nếu client ngắt kết nối giữa chừng, generator bị đóng và agent bị huỷ theo;
+        lượt hội thoại dở dang đó không được lưu vào history hay cache.
+        """
+        human_message = HumanMessage(content=input_str)
+        chat_history, retrieved_memory, cache_key, cached_result = await self._aprepare(human_message, session_id)
+        if cached_result:
+            result = loads(cached_result[0].text)
+            yield {"event": "final", "data": {"response": result["output"], "cached": True}}
+            return
+
+        # Thực thi Agent và chuyển tiếp các sự kiện
+        result = None
+        _, streaming_agent_exec = await asyncio.to_thread(self._select_executors, input_str)
+        events = streaming_agent_exec.astream_events({
+            "input": input_str,
+            "retrieved_chat_history": retrieved_memory,
+        }, version="v2")
+        async with aclosing(events):
+            async for event in events:
+                kind = event["event"]
+                if kind == "on_tool_start":
+                    yield {"event": "tool_start", "data": {
+                        "run_id": event["run_id"], "name": event["name"], "input": event["data"].get("input")
+                    }}
+                elif kind == "on_tool_end":
+                    yield {"event": "tool_end", "data": {
+                        "run_id": event["run_id"], "name": event["name"], "output": event["data"].get("output")
+                    }}
+                elif kind == "on_chat_model_stream":
+                    content = event["data"]["chunk"].content
+                    if isinstance(content, str) and content:
+                        yield {"event": "token", "data": {"content": content}}
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    # Sự kiện kết thúc của chính AgentExecutor (run gốc)
+                    result = event["data"]["output"]
+
+        if result is None:
+            yield {"event": "error", "data": {"detail": "Agent finished without producing an output."}}
+            return
+
+        await self._aremember(session_id, chat_history, cache_key, human_message, result)
+        yield {"event": "final", "data": {"response": result["output"], "cached": False}}
@@ -4,60 +4,196 @@ Agent factory module for the MCP Financial Agent.
 This module creates and configures the LangChain agent that serves as the
 core of the financial assistant. It sets up the agent with tools, prompts,
 and memory management to handle financial queries.
+
+The agent is built by `init_agent` during application startup rather than at
+import time, so importing this module does not load LangChain, the LLM client
+or the embedding model.
 """
-from langchain.agents import AgentExecutor, create_tool_calling_agent
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.globals import set_llm_cache, get_llm_cache
+import threading
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
 import app.core.config as cfg
-from app.llms import llm_client
-from app.clients.tools_discovery import discover_tools
-from app.prompts.loader import load_prompt
-from app.cache import get_agent_cache
-from app.memory import get_chat_message_history
-from app.memory.retriever import MemoryRetriever
-
-from ._custom import SemanticMemoryAndCacheAgentExecutor
-
-# Load the system prompt that defines the agent's behavior
-SYSTEM_PROMPT = load_prompt(cfg.SYSTEM_PROMPT_ID, cfg.PROMPT_FILE)
-
-# Define the prompt template that structures the conversation
-# This template includes system instructions, chat history, user input, and agent scratchpad
-prompt = ChatPromptTemplate.from_messages([
-    ("system", SYSTEM_PROMPT),
-    MessagesPlaceholder(variable_name='retrieved_chat_history'),
-    ("user", "{input}"),
-    MessagesPlaceholder(variable_name='agent_scratchpad')
-])
-
-# Initialize all available tools for the agent by discovering them from the registry
-tools = discover_tools()
-
-set_llm_cache(get_agent_cache())
-
-# Create the agent using LangChain's tool calling agent
-# This agent can understand when to use tools and how to use them properly
-agent = create_tool_calling_agent(llm_client, tools, prompt)
-
-# Create the agent executor which handles the agent's execution loop
-# The executor manages the interaction between the agent, tools, and memory
-agent_executor = AgentExecutor(
-    agent=agent,
-    tools=tools,
-    verbose=True,
-    handle_parsing_errors=True,
-    stream_runnable=False
-)
-
-final_executor = SemanticMemoryAndCacheAgentExecutor(
-    base_agent_exec=agent_executor,
-    chat_history_getter=get_chat_message_history,
-    memory_retriever=MemoryRetriever(top_k=4),
-    agent_cache=get_agent_cache()
-)
-
-print(f'INFO: LLM Cache enables: {llm_client.cache}')
+
+# The agent executor, built by `init_agent` and replaced by `rebuild_agent` when tools change.
+# Each request takes one reference to it, so in-flight conversations finish on the executor
+# they started with while new requests use the replacement.
+_FINAL_EXECUTOR = None
+_FINAL_EXECUTOR_LOCK = threading.Lock()
+_LLM_CLIENT = None
+# Memory retriever and summarizer, built once and shared by every rebuilt executor, so the
+# executors of old and new tool lists never compact the same session concurrently
+_MEMORY_RETRIEVER = None
+_SUMMARIZER = None
+
+def _create_memory(llm_client) -> Tuple[Any, Any]:
+    """
+    Build the memory retriever and, if rolling summaries are enabled, the conversation summarizer.
+    
+    Args:
+        llm_client (BaseChatModel): The chat model writing the summaries
+        
+    Returns:
+        Tuple[MemoryRetriever, Optional[ConversationSummarizer]]: The retriever and the summarizer
+    """
+    from app.prompts.loader import load_prompt
+    from app.memory import get_session_vector_index, get_session_summary_store
+    from app.memory.retriever import MemoryRetriever
+    from app.memory.summary import ConversationSummarizer
+
+    # Optionally fold the oldest turns of long sessions into a running summary
+    summarizer = None
+    if cfg.MEMORY_SUMMARY_ENABLED:
+        summarizer = ConversationSummarizer(
+            llm_client, get_session_summary_store(), load_prompt(cfg.SUMMARY_PROMPT_ID, cfg.PROMPT_FILE),
+            max_turns=cfg.MEMORY_SUMMARY_MAX_TURNS, keep_turns=cfg.MEMORY_SUMMARY_KEEP_TURNS
+        )
+    memory_retriever = MemoryRetriever(
+        index_getter=get_session_vector_index, top_k=4,
+        summary_getter=summarizer.get_summary if summarizer else None
+    )
+    return memory_retriever, summarizer
+
+def _create_final_executor(llm_client, tools: List):
+    """
+    Build the complete agent executor from an LLM client and the discovered tools.
+    
+    Only the tool-dependent parts are built here; the memory retriever and the
+    summarizer created by `init_agent` are reused.
+    
+    Args:
+        llm_client (BaseChatModel): The chat model driving the agent
+        tools (List[BaseTool]): Tools available to the agent
+        
+    Returns:
+        SemanticMemoryAndCacheAgentExecutor: The executor with memory and caching
+    """
+    from langchain.agents import create_tool_calling_agent
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain_core.globals import set_llm_cache
+
+    from app.prompts.loader import load_prompt
+    from app.cache import get_agent_cache, get_llm_cache
+    from app.embeddings import get_embedding_service
+    from app.memory import get_chat_message_history
+    from ._custom import SemanticMemoryAndCacheAgentExecutor
+    from ._parallel import ParallelToolAgentExecutor
+    from ._router import ToolRouter, ToolSubsetExecutors
+
+    # Load the system prompt that defines the agent's behavior
+    system_prompt = load_prompt(cfg.SYSTEM_PROMPT_ID, cfg.PROMPT_FILE)
+
+    # Define the prompt template that structures the conversation
+    # This template includes system instructions, chat history, user input, and agent scratchpad
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", system_prompt),
+        MessagesPlaceholder(variable_name='retrieved_chat_history'),
+        ("user", "{input}"),
+        MessagesPlaceholder(variable_name='agent_scratchpad')
+    ])
+
+    set_llm_cache(get_llm_cache())
+
+    def _create_agent_executor(agent, agent_tools: List, stream_runnable: bool) -> ParallelToolAgentExecutor:
+        """
+        Create the agent executor which handles the agent's execution loop.
+        
+        The executor manages the interaction between the agent, tools, and memory,
+        and runs the independent tool calls of one step concurrently.
+        
+        Args:
+            agent (Runnable): The tool calling agent bound to `agent_tools`
+            agent_tools (List[BaseTool]): Tools the executor may call
+            stream_runnable (bool): Whether the LLM is streamed, required to emit tokens as they arrive
+            
+        Returns:
+            ParallelToolAgentExecutor: The configured agent executor
+        """
+        return ParallelToolAgentExecutor(
+            agent=agent,
+            tools=agent_tools,
+            verbose=True,
+            handle_parsing_errors=True,
+            stream_runnable=stream_runnable,
+            # Tools used by a turn determine how long its answer may be cached
+            return_intermediate_steps=True,
+            max_tool_concurrency=cfg.TOOL_MAX_CONCURRENCY
+        )
+
+    def _create_agent_executors(agent_tools: List) -> Tuple[ParallelToolAgentExecutor, ParallelToolAgentExecutor]:
+        """
+        Create the regular and the streaming executor of an agent bound to `agent_tools`.
+        
+        Args:
+            agent_tools (List[BaseTool]): Tools whose schemas are sent to the LLM
+            
+        Returns:
+            Tuple[ParallelToolAgentExecutor, ParallelToolAgentExecutor]: The regular and the streaming executor
+        """
+        # Create the agent using LangChain's tool calling agent
+        # This agent can understand when to use tools and how to use them properly
+        agent = create_tool_calling_agent(llm_client, agent_tools, prompt)
+        return (_create_agent_executor(agent, agent_tools, stream_runnable=False),
+                _create_agent_executor(agent, agent_tools, stream_runnable=True))
+
+    base_agent_exec, streaming_agent_exec = _create_agent_executors(tools)
+
+    # Optionally bind only the tools relevant to each message instead of every tool
+    tool_executors = None
+    if cfg.TOOL_ROUTING_ENABLED:
+        router = ToolRouter(tools, get_embedding_service(), cfg.TOOL_ROUTING_TOP_K, cfg.TOOL_ROUTING_ALWAYS_INCLUDE)
+        if router.enabled:
+            tool_executors = ToolSubsetExecutors(router, _create_agent_executors, cfg.TOOL_ROUTING_MAX_EXECUTORS)
+
+    final_executor = SemanticMemoryAndCacheAgentExecutor(
+        base_agent_exec=base_agent_exec,
+        streaming_agent_exec=streaming_agent_exec,
+        chat_history_getter=get_chat_message_history,
+        memory_retriever=_MEMORY_RETRIEVER,
+        agent_cache=get_agent_cache(),
+        tool_executors=tool_executors,
+        summarizer=_SUMMARIZER
+    )
+    print(f'INFO: LLM Cache enables: {llm_client.cache}')
+    return final_executor
+
+def init_agent(llm_client, tools: List) -> None:
+    """
+    Build the agent executor; called once the LLM client and tools are ready.
+    
+    Args:
+        llm_client (BaseChatModel): The chat model driving the agent
+        tools (List[BaseTool]): Tools available to the agent
+    """
+    global _FINAL_EXECUTOR, _LLM_CLIENT, _MEMORY_RETRIEVER, _SUMMARIZER
+    with _FINAL_EXECUTOR_LOCK:
+        if _FINAL_EXECUTOR is None:
+            _LLM_CLIENT = llm_client
+            _MEMORY_RETRIEVER, _SUMMARIZER = _create_memory(llm_client)
+            _FINAL_EXECUTOR = _create_final_executor(llm_client, tools)
+
+def rebuild_agent(tools: List) -> None:
+    """
+    Build an agent executor with a new tool list and swap it in atomically.
+    
+    Args:
+        tools (List[BaseTool]): The refreshed tools
+    """
+    global _FINAL_EXECUTOR
+    with _FINAL_EXECUTOR_LOCK:
+        if _LLM_CLIENT is None:
+            raise RuntimeError("The agent must be initialized before it can be rebuilt.")
+        new_executor = _create_final_executor(_LLM_CLIENT, tools)
+        _FINAL_EXECUTOR = new_executor
+    print(f"INFO:     Agent rebuilt with {len(tools)} tools.")
+
+def is_agent_ready() -> bool:
+    """Tell whether the agent executor has been built."""
+    return _FINAL_EXECUTOR is not None
+
+def _get_final_executor():
+    if _FINAL_EXECUTOR is None:
+        raise RuntimeError("The agent is still initializing.")
+    return _FINAL_EXECUTOR
 
 def get_agent_response(session_id: str, user_message: str) -> dict:
     """
@@ -73,5 +209,41 @@ def get_agent_response(session_id: str, user_message: str) -> dict:
     Returns:
         dict: Contains the agent's response with the key "response"
     """
-    result = final_executor.invoke(user_message, session_id)
-    return {"response": result["output"]}
\ No newline at end of file
+    result = _get_final_executor().invoke(user_message, session_id)
+    return {"response": result["output"]}
+
+async def aget_agent_response(session_id: str, user_message: str) -> dict:
+    """
+    Async version of `get_agent_response`.
+    
+    History loading, memory retrieval, cache access, LLM calls and tool calls are
+    all awaited or run off the event loop, so many conversations can be in flight
+    in one process without holding a worker thread each.
+    
+    Args:
+        session_id (str): Unique identifier for the conversation session
+        user_message (str): The user's input message
+        
+    Returns:
+        dict: Contains the agent's response with the key "response"
+    """
+    result = await _get_final_executor().ainvoke(user_message, session_id)
+    return {"response": result["output"]}
+
+async def stream_agent_response(session_id: str, user_message: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Process a user message through the financial agent, streaming progress events.
+    
+    Yields tool-call start/finish events and LLM tokens as they arrive, then a
+    final event with the complete response once the turn has been written into
+    the chat history and the agent cache.
+    
+    Args:
+        session_id (str): Unique identifier for the conversation session
+        user_message (str): The user's input message
+        
+    Yields:
+        Dict[str, Any]: Events with the keys "event" and "data"
+    """
+    async for event in _get_final_executor().astream(user_message, session_id):
+        yield event
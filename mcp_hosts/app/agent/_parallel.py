@@ -0,0 +1,161 @@
+"""
+Parallel tool execution for the MCP Financial Agent.
+
+When the LLM emits several tool calls in one step (e.g. technical, forecasting
+and news analysis for the same ticker), LangChain's `AgentExecutor` runs them
+one after another on the sync path and without any bound on the async path.
+This module provides an executor that dispatches all calls of a step
+concurrently, capped per step, and returns the observations in the order the
+agent emitted the calls.
+"""
+import asyncio
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from langchain.agents import AgentExecutor
+from langchain.agents.agent import ExceptionTool
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import AsyncCallbackManagerForChainRun, CallbackManagerForChainRun
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.tools import BaseTool
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor running the independent tool calls of one step concurrently.
+
+    Planning and parsing-error handling follow `AgentExecutor`; only the
+    tool-execution stage differs. Step latency becomes the slowest call of the
+    step instead of the sum of all calls.
+    """
+    max_tool_concurrency: int = 4
+    """Maximum number of tool calls of one step running at the same time."""
+
+    def _parsing_error_action(self, e: OutputParserException) -> AgentAction:
+        """Build the `_Exception` action sent back to the agent for an unparsable LLM output."""
+        if isinstance(self.handle_parsing_errors, bool):
+            raise_error = not self.handle_parsing_errors
+        else:
+            raise_error = False
+        if raise_error:
+            raise ValueError(
+                "An output parsing error occurred. "
+                "In order to pass this error back to the agent and have it try "
+                "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
+                f"This is the error: {str(e)}"
+            )
+        text = str(e)
+        if isinstance(self.handle_parsing_errors, bool):
+            if e.send_to_llm:
+                observation = str(e.observation)
+                text = str(e.llm_output)
+            else:
+                observation = "Invalid or incomplete response"
+        elif isinstance(self.handle_parsing_errors, str):
+            observation = self.handle_parsing_errors
+        elif callable(self.handle_parsing_errors):
+            observation = self.handle_parsing_errors(e)
+        else:
+            raise ValueError("Got unexpected type of `handle_parsing_errors`")
+        return AgentAction("_Exception", observation, text)
+
+    def _iter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Iterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        try:
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+            # Call the LLM to see what to do.
+            output = self._action_agent.plan(
+                intermediate_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
+            )
+        except OutputParserException as e:
+            output = self._parsing_error_action(e)
+            if run_manager:
+                run_manager.on_agent_action(output, color="green")
+            observation = ExceptionTool().run(
+                output.tool_input,
+                verbose=self.verbose,
+                color=None,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **self._action_agent.tool_run_logging_kwargs(),
+            )
+            yield AgentStep(action=output, observation=observation)
+            return
+
+        # If the tool chosen is the finishing tool, then we end and return.
+        if isinstance(output, AgentFinish):
+            yield output
+            return
+
+        actions: List[AgentAction] = [output] if isinstance(output, AgentAction) else output
+        for agent_action in actions:
+            yield agent_action
+
+        def _perform(agent_action: AgentAction) -> AgentStep:
+            return self._perform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+
+        if len(actions) <= 1 or self.max_tool_concurrency <= 1:
+            for agent_action in actions:
+                yield _perform(agent_action)
+            return
+
+        # `map` returns the results in the order the agent emitted the calls
+        with ContextThreadPoolExecutor(max_workers=min(self.max_tool_concurrency, len(actions))) as pool:
+            steps = list(pool.map(_perform, actions))
+        for step in steps:
+            yield step
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        try:
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+            # Call the LLM to see what to do.
+            output = await self._action_agent.aplan(
+                intermediate_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
+            )
+        except OutputParserException as e:
+            output = self._parsing_error_action(e)
+            if run_manager:
+                await run_manager.on_agent_action(output, color="green")
+            observation = await ExceptionTool().arun(
+                output.tool_input,
+                verbose=self.verbose,
+                color=None,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **self._action_agent.tool_run_logging_kwargs(),
+            )
+            yield AgentStep(action=output, observation=observation)
+            return
+
+        # If the tool chosen is the finishing tool, then we end and return.
+        if isinstance(output, AgentFinish):
+            yield output
+            return
+
+        actions: List[AgentAction] = [output] if isinstance(output, AgentAction) else output
+        for agent_action in actions:
+            yield agent_action
+
+        semaphore = asyncio.Semaphore(max(1, self.max_tool_concurrency))
+
+        async def _aperform(agent_action: AgentAction) -> AgentStep:
+            async with semaphore:
+                return await self._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+
+        # `gather` returns the results in the order the agent emitted the calls
+        for step in await asyncio.gather(*[_aperform(agent_action) for agent_action in actions]):
+            yield step
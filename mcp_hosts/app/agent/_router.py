@@ -0,0 +1,115 @@
+"""
+Relevance-based tool routing for the MCP Financial Agent.
+
+Every tool bound to the agent sends its name, description and argument schema
+to the LLM on each iteration, so the prompt grows with the registry. When
+routing is enabled, the tool descriptions are embedded once when the agent is
+built and each user message only binds the `top_k` most similar tools plus a
+configurable always-include list. An agent executor is built per distinct tool
+subset and reused by later messages selecting the same subset.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.tools import BaseTool
+
+ExecutorT = TypeVar('ExecutorT')
+
+def _tool_document(tool: BaseTool) -> str:
+    return f"{tool.name}: {tool.description}"
+
+class ToolRouter:
+    """
+    Select the tools relevant to a user message by embedding similarity.
+
+    Args:
+        tools (List[BaseTool]): Every tool available to the agent, in registry order
+        embedding_model (Embeddings): Model used for the tool descriptions and the messages
+        top_k (int): Number of most similar tools to bind
+        always_include (Sequence[str]): Names of tools bound to every message
+    """
+    def __init__(self, tools: List[BaseTool], embedding_model: Embeddings, top_k: int,
+                 always_include: Sequence[str] = ()):
+        self.tools = list(tools)
+        self.embedding_model = embedding_model
+        self.top_k = top_k
+        self.always_include = {name for name in always_include if any(tool.name == name for tool in self.tools)}
+        self._matrix = None
+        if self.enabled:
+            # Descriptions are embedded once here; unchanged tools hit the embedding cache on rebuilds
+            vectors = np.asarray(embedding_model.embed_documents([_tool_document(tool) for tool in self.tools]), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            self._matrix = vectors / np.where(norms == 0, 1.0, norms)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether routing can drop any tool at all."""
+        return len(self.tools) > self.top_k + len(self.always_include)
+
+    def select(self, message: str) -> List[BaseTool]:
+        """
+        Return the tools to bind for a user message.
+
+        Args:
+            message (str): The user's input message
+
+        Returns:
+            List[BaseTool]: The selected tools in registry order, or every tool if routing cannot drop any
+        """
+        if not self.enabled:
+            return self.tools
+        query = np.asarray(self.embedding_model.embed_query(message), dtype=np.float32)
+        scores = self._matrix @ (query / (np.linalg.norm(query) or 1.0))
+
+        selected = set(self.always_include)
+        for i in np.argsort(-scores):
+            if len(selected) >= self.top_k + len(self.always_include):
+                break
+            selected.add(self.tools[i].name)
+        return [tool for tool in self.tools if tool.name in selected]
+
+class ToolSubsetExecutors(Generic[ExecutorT]):
+    """
+    Agent executors built per selected tool subset, kept in a bounded LRU.
+
+    Args:
+        router (ToolRouter): Selects the tools of each message
+        build (Callable[[List[BaseTool]], ExecutorT]): Builds the executor(s) bound to a tool list
+        max_entries (int): Maximum number of tool subsets whose executors are kept
+    """
+    def __init__(self, router: ToolRouter, build: Callable[[List[BaseTool]], ExecutorT], max_entries: int = 32):
+        self.router = router
+        self.build = build
+        self.max_entries = max_entries
+        self._executors: "OrderedDict[Tuple[str, ...], ExecutorT]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def select(self, message: str) -> ExecutorT:
+        """
+        Return the executor(s) bound to the tools relevant to a user message.
+
+        Args:
+            message (str): The user's input message
+
+        Returns:
+            ExecutorT: The executor(s) built for the selected tool subset
+        """
+        tools = self.router.select(message)
+        key = tuple(tool.name for tool in tools)
+        print(f"INFO:     Tools routed for message: {list(key)}")
+        with self._lock:
+            executor = self._executors.get(key)
+            if executor is not None:
+                self._executors.move_to_end(key)
+                return executor
+        # Built outside the lock; two messages racing on a new subset both build, one is kept
+        executor = self.build(tools)
+        with self._lock:
+            executor = self._executors.setdefault(key, executor)
+            self._executors.move_to_end(key)
+            while len(self._executors) > self.max_entries:
+                self._executors.popitem(last=False)
+        return executor
@@ -1,9 +1,12 @@
 """
 Health check API endpoint for the MCP Financial Agent.
 
-This module provides a simple health check endpoint to monitor application status.
+This module provides a simple health check endpoint to monitor application status,
+and a readiness endpoint telling whether the agent can serve requests.
 """
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.core.startup import STARTUP_STATE
 
 router = APIRouter()
 
@@ -17,4 +20,21 @@ def health_check():
     Returns:
         dict: Contains the status of the application
     """
-    return {'status': 'ok'}
\ No newline at end of file
+    return {'status': 'ok'}
+
+@router.get('/ready', status_code=200)
+def readiness_check():
+    """
+    Readiness endpoint.
+    
+    Unlike `/health`, which only tells that the process is up, this endpoint
+    returns 503 until the embedding model, LLM client, tools, caches and agent
+    have all been initialized.
+    
+    Returns:
+        dict: Overall readiness plus the status and init time of each component
+    """
+    state = STARTUP_STATE.snapshot()
+    if not state['ready']:
+        return JSONResponse(status_code=503, content=state)
+    return state
\ No newline at end of file
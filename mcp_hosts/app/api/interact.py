@@ -3,19 +3,29 @@ Interaction API endpoint for the MCP Financial Agent.
 
 This module defines the FastAPI router and endpoint for user-agent interactions.
 """
-from fastapi import APIRouter
-from app.agent import get_agent_response
+import json
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from app.agent import aget_agent_response, stream_agent_response, is_agent_ready
 from app.schemas.interact import InteractionRequest, InteractionResponse
 
 router = APIRouter()
 
+def _ensure_agent_ready() -> None:
+    """Reject requests with 503 while the agent is still being initialized at startup."""
+    if not is_agent_ready():
+        raise HTTPException(status_code=503, detail="The agent is still initializing, retry shortly.")
+
 @router.post('/interact', response_model=InteractionResponse)
-def interact(request: InteractionRequest):
+async def interact(request: InteractionRequest):
     """
     Main endpoint for interacting with the financial agent.
     
     This endpoint receives user messages and processes them through the agent,
     which may use various tools to gather information and formulate responses.
+    The whole request path is async, so a conversation does not hold a worker
+    thread while waiting for the LLM or tools.
     
     Example request:
     ```
@@ -31,8 +41,56 @@ def interact(request: InteractionRequest):
     Returns:
         InteractionResponse: Contains the agent's response to the user message
     """
-    result = get_agent_response(
+    _ensure_agent_ready()
+    result = await aget_agent_response(
         session_id=request.session_id,
         user_message=request.message
     )
-    return InteractionResponse.model_validate(result)
\ No newline at end of file
+    return InteractionResponse.model_validate(result)
+
+def _format_sse(event: Dict[str, Any]) -> str:
+    """Serialize an agent event as a Server-Sent Events message."""
+    data = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+@router.post('/interact/stream')
+async def interact_stream(request: InteractionRequest, http_request: Request):
+    """
+    Streaming variant of the interaction endpoint, using Server-Sent Events.
+    
+    Emits `tool_start` and `tool_end` events when the agent calls a tool, `token`
+    events with LLM output as it is generated, and a `final` event containing the
+    complete response. An `error` event is sent if the agent fails. The final turn
+    is written into the chat history and the agent cache on completion; if the client
+    disconnects mid-stream, the agent run is cancelled and the turn is discarded.
+    
+    Args:
+        request (InteractionRequest): Contains the session ID and user message
+        http_request (Request): The incoming HTTP request, used to detect client disconnects
+        
+    Returns:
+        StreamingResponse: A `text/event-stream` response
+    """
+    _ensure_agent_ready()
+
+    async def event_source():
+        events = stream_agent_response(
+            session_id=request.session_id,
+            user_message=request.message
+        )
+        try:
+            async for event in events:
+                if await http_request.is_disconnected():
+                    break
+                yield _format_sse(event)
+        except Exception as e:
+            yield _format_sse({"event": "error", "data": {"detail": str(e)}})
+        finally:
+            # Closing the generator cancels the agent run if it is still in progress
+            await events.aclose()
+
+    return StreamingResponse(
+        event_source(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
@@ -0,0 +1,36 @@
+"""
+Statistics API endpoint for the MCP Financial Agent.
+
+This module exposes runtime counters of the caches, such as the hit rates of
+each tier of the agent answer cache and of the LLM call cache, of the tool response cache and of the shared
+embedding cache, and the gauges of the in-memory session store.
+"""
+from fastapi import APIRouter
+from app.core.startup import STARTUP_STATE
+from app.cache import get_agent_cache, get_llm_cache, get_tool_response_cache
+from app.embeddings import get_embedding_service, is_embedding_service_loaded
+
+router = APIRouter()
+
+@router.get('/stats', status_code=200)
+def get_stats():
+    """
+    Runtime statistics endpoint.
+    
+    Returns:
+        dict: Counters of the agent and LLM cache tiers, the tool response cache, the embedding cache and the sessions held
+    """
+    # Imported here: the memory backends pull in LangChain, which startup loads in the background
+    from app.memory import get_memory_stats
+
+    # Only report what exists: the agent cache and embedding model may still be loading
+    agent_cache = get_agent_cache() if STARTUP_STATE.ready else None
+    llm_cache = get_llm_cache() if STARTUP_STATE.ready else None
+    tool_cache = get_tool_response_cache()
+    return {
+        'agent_cache': agent_cache.stats() if hasattr(agent_cache, 'stats') else None,
+        'llm_cache': llm_cache.stats() if hasattr(llm_cache, 'stats') else None,
+        'tool_cache': tool_cache.stats() if tool_cache else None,
+        'embedding_cache': get_embedding_service().stats() if is_embedding_service_loaded() else None,
+        'memory': get_memory_stats(),
+    }
\ No newline at end of file
@@ -1 +1 @@
-from ._factory import get_agent_cache
\ No newline at end of file
+from ._factory import get_agent_cache, get_llm_cache, get_tool_response_cache
\ No newline at end of file
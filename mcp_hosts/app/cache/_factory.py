@@ -1,15 +1,68 @@
-from . import gptcache, redis, in_memory
+import importlib
+from langchain_core.caches import BaseCache
+import redis as redis_lib
+from .tiered import TieredAgentCache
+from .tool_response import ToolResponseCache, InMemoryToolResponseStore, RedisToolResponseStore
 import app.core.config as cfg
 
+# Whole agent answers, looked up by the agent executor
+_AGENT_CACHE: BaseCache = None
+# Single LLM calls, looked up by LangChain through the global LLM cache; a separate
+# instance of the same backend, so the statistics of each kind of lookup stay apart
+_LLM_CACHE: BaseCache = None
+
+# Tool responses are shared by every session of the process (or of all processes with Redis)
+_TOOL_RESPONSE_CACHE: ToolResponseCache = None
+
+def _create_agent_cache() -> BaseCache:
+    # Backends are imported on demand: gptcache pulls in chromadb and the embedding model
+    backend_modules = {'gptcache': '.gptcache', 'redis': '.redis', 'in-memory': '.in_memory'}
+    if cfg.LLM_CACHE_TYPE not in backend_modules:
+        raise TypeError(f'Not supported agent cache with cache type {cfg.LLM_CACHE_TYPE}')
+    module_to_load = importlib.import_module(backend_modules[cfg.LLM_CACHE_TYPE], __package__)
+    cache = module_to_load.get_cache()
+
+    # The in-memory cache is already an exact-match lookup, so it needs no extra tier
+    if cache is not None and cfg.LLM_CACHE_EXACT_TIER_ENABLED and cfg.LLM_CACHE_TYPE != 'in-memory':
+        redis_client = redis_lib.from_url(cfg.REDIS_URL) if cfg.LLM_CACHE_EXACT_TIER_REDIS_ENABLED else None
+        cache = TieredAgentCache(
+            semantic_cache=cache,
+            max_entries=cfg.LLM_CACHE_EXACT_TIER_MAX_ENTRIES,
+            redis_client=redis_client,
+            redis_ttl=cfg.LLM_CACHE_EXACT_TIER_REDIS_TTL
+        )
+    return cache
+
 def get_agent_cache():
+    global _AGENT_CACHE
+    if not cfg.LLM_CACHE_ENABLED:
+        return None
+    if _AGENT_CACHE is None:
+        _AGENT_CACHE = _create_agent_cache()
+    return _AGENT_CACHE
+
+def get_llm_cache():
+    global _LLM_CACHE
     if not cfg.LLM_CACHE_ENABLED:
         return None
-    if cfg.LLM_CACHE_TYPE == 'gptcache':
-        module_to_load = gptcache
-    elif cfg.LLM_CACHE_TYPE == 'redis':
-        module_to_load = redis
-    elif cfg.LLM_CACHE_TYPE == 'in-memory':
-        module_to_load = in_memory
+    if _LLM_CACHE is None:
+        _LLM_CACHE = _create_agent_cache()
+    return _LLM_CACHE
+
+def _create_tool_response_cache() -> ToolResponseCache:
+    if cfg.TOOL_CACHE_TYPE == 'redis':
+        print(f"INFO:     Enabling tool response caching with Redis at {cfg.REDIS_URL}")
+        store = RedisToolResponseStore(redis_lib.from_url(cfg.REDIS_URL))
+    elif cfg.TOOL_CACHE_TYPE == 'in-memory':
+        store = InMemoryToolResponseStore(max_entries=cfg.TOOL_CACHE_MAX_ENTRIES)
     else:
-        raise TypeError(f'Not supported agent cache with cache type {cfg.LLM_CACHE_TYPE}')
-    return module_to_load.get_cache()
\ No newline at end of file
+        raise TypeError(f'Not supported tool response cache with cache type {cfg.TOOL_CACHE_TYPE}')
+    return ToolResponseCache(store)
+
+def get_tool_response_cache():
+    global _TOOL_RESPONSE_CACHE
+    if not cfg.TOOL_CACHE_ENABLED:
+        return None
+    if _TOOL_RESPONSE_CACHE is None:
+        _TOOL_RESPONSE_CACHE = _create_tool_response_cache()
+    return _TOOL_RESPONSE_CACHE
\ No newline at end of file
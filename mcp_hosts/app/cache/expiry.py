@@ -0,0 +1,35 @@
+"""
+Per-entry expiry helpers for the agent cache.
+
+Cached agent answers carry their own expiry time in the `generation_info` of
+the cached `Generation` (key `expires_at`, a UNIX timestamp), derived from the
+tools that produced the answer. Every cache backend uses these helpers to stop
+serving an entry once it is stale. Entries without `expires_at` never expire.
+"""
+import time
+from typing import Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE
+
+EXPIRES_AT_KEY = 'expires_at'
+
+def get_expires_at(return_val: RETURN_VAL_TYPE) -> Optional[float]:
+    """Return the earliest expiry time among the cached generations, or None if they never expire."""
+    expiries = [
+        generation.generation_info[EXPIRES_AT_KEY]
+        for generation in return_val or []
+        if generation.generation_info and generation.generation_info.get(EXPIRES_AT_KEY) is not None
+    ]
+    return min(expiries) if expiries else None
+
+def is_expired(return_val: RETURN_VAL_TYPE) -> bool:
+    """Tell whether a cached value has passed its expiry time."""
+    expires_at = get_expires_at(return_val)
+    return expires_at is not None and expires_at <= time.time()
+
+def remaining_ttl(return_val: RETURN_VAL_TYPE) -> Optional[int]:
+    """Return the number of seconds the value stays fresh (at least 1), or None if it never expires."""
+    expires_at = get_expires_at(return_val)
+    if expires_at is None:
+        return None
+    return max(1, int(expires_at - time.time()))
\ No newline at end of file
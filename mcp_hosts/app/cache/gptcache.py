@@ -1,36 +1,36 @@
 import hashlib
-from langchain_core.caches import BaseCache
+from typing import Optional
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
 from gptcache import Cache
 from gptcache.adapter.api import init_similar_cache, manager_factory
 from langchain_community.cache import GPTCache
 from gptcache.similarity_evaluation import SearchDistanceEvaluation
-from gptcache.embedding.huggingface import Huggingface
 from gptcache.processor.pre import get_prompt
 import app.core.config as cfg
-from transformers import AutoConfig
+from app.embeddings import get_embedding_service
+from .expiry import is_expired
 
 def get_hashed_name(name: str):
     return hashlib.sha256(name.encode()).hexdigest()
 
 def init_gptcache(cache_obj: Cache, llm: str) -> None:
     """
-    Initialize GPTCache with ChromaDB + HuggingFace embeddings.
+    Initialize GPTCache with ChromaDB + the shared HuggingFace embedding service.
 
     Args:
         cache_obj (Cache): GPTCache instance
         llm (str): LLM identifier (used to namespace cache)
     """
     hashed_llm = get_hashed_name(llm)
-    model_name = cfg.EMBEDDING_MODEL
     
-    # HuggingFace embedding model
-    embedding = Huggingface(model=model_name)
+    # Shared embedding service (same model weights and cache as the memory retriever)
+    embedding = get_embedding_service()
 
     # Chroma as vector store backend
     manager = manager_factory(
         "sqlite,chromadb",
         data_dir=f"similar_cache_{hashed_llm}",
-        vector_params={"dimension": 384, 'host': cfg.CHROMA_HOST, 'port': cfg.CHROMA_PORT},
+        vector_params={"dimension": embedding.dimension, 'host': cfg.CHROMA_HOST, 'port': cfg.CHROMA_PORT},
     )
 
     cache_obj.init(
@@ -41,5 +41,13 @@ def init_gptcache(cache_obj: Cache, llm: str) -> None:
         
     )
 
+class ExpiringGPTCache(GPTCache):
+    """GPTCache that treats entries past their `expires_at` as misses."""
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        value = super().lookup(prompt, llm_string)
+        if value is not None and is_expired(value):
+            return None
+        return value
+
 def get_cache() -> BaseCache:
-    return GPTCache(init_gptcache)
\ No newline at end of file
+    return ExpiringGPTCache(init_gptcache)
\ No newline at end of file
@@ -1,5 +1,16 @@
 from langchain_community.cache import InMemoryCache
-from langchain_core.caches import BaseCache
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from typing import Optional
+from .expiry import is_expired
+
+class ExpiringInMemoryCache(InMemoryCache):
+    """InMemoryCache that drops entries past their `expires_at`."""
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        value = super().lookup(prompt, llm_string)
+        if value is not None and is_expired(value):
+            self._cache.pop((prompt, llm_string), None)
+            return None
+        return value
 
 def get_cache() -> BaseCache:
-    return InMemoryCache()
\ No newline at end of file
+    return ExpiringInMemoryCache()
\ No newline at end of file
@@ -1,12 +1,28 @@
-from langchain_core.caches import BaseCache
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
 from langchain_community.cache import RedisCache
+from typing import Optional
 import redis
 import app.core.config as cfg
+from .expiry import is_expired, remaining_ttl
+
+class ExpiringRedisCache(RedisCache):
+    """RedisCache that sets each key's Redis TTL from the `expires_at` of its entry."""
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        value = super().lookup(prompt, llm_string)
+        if value is not None and is_expired(value):
+            return None
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        super().update(prompt, llm_string, return_val)
+        ttl = remaining_ttl(return_val)
+        if ttl is not None:
+            self.redis.expire(self._key(prompt, llm_string), ttl)
 
 def get_cache() -> BaseCache:
     try:
         print(f"INFO:     Enabling LLM Caching with Redis at {cfg.REDIS_URL}")
         redis_client = redis.from_url(cfg.REDIS_URL)
-        return RedisCache(redis_client)
+        return ExpiringRedisCache(redis_client)
     except Exception as e:
         print(f"WARNING:  Could not enable LLM Caching: {e}")
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Two-tier agent cache for the MCP Financial Agent.
+
+The semantic cache (GPTCache) embeds every key and runs a vector search even
+for byte-identical repeated questions. This module puts an exact-match tier in
+front of it: the prompt is normalized and hashed, looked up in an in-process
+LRU (optionally backed by Redis), and only on a miss does the lookup fall
+through to the semantic tier. Both tiers are populated on update and hit
+counters are kept per tier. Entries past their `expires_at` are dropped from
+the exact tier and expire from Redis with their own TTL.
+"""
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import redis
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from .expiry import is_expired, remaining_ttl
+
+def normalize_cache_key(prompt: str, llm_string: str) -> str:
+    """Hash the prompt after collapsing whitespace and case, namespaced by `llm_string`."""
+    normalized = " ".join(prompt.split()).casefold()
+    return hashlib.sha256(f"{llm_string}\x00{normalized}".encode('utf-8')).hexdigest()
+
+class TieredAgentCache(BaseCache):
+    """
+    Exact-match hash tier checked before a semantic cache.
+
+    Args:
+        semantic_cache (BaseCache): The slower similarity-based tier
+        max_entries (int): Size of the in-process LRU
+        redis_client (Optional[redis.Redis]): Enables the shared Redis exact tier if given
+        redis_ttl (Optional[int]): Expiry in seconds of exact-tier entries in Redis
+    """
+    def __init__(self,
+                 semantic_cache: BaseCache,
+                 max_entries: int = 1000,
+                 redis_client: Optional[redis.Redis] = None,
+                 redis_ttl: Optional[int] = None):
+        self.semantic_cache = semantic_cache
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        self._lru: "OrderedDict[str, RETURN_VAL_TYPE]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'lookups': 0, 'memory_hits': 0, 'redis_hits': 0, 'semantic_hits': 0}
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _memory_get(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None and is_expired(value):
+                del self._lru[key]
+                return None
+            if value is not None:
+                self._lru.move_to_end(key)
+            return value
+
+    def _memory_put(self, key: str, value: RETURN_VAL_TYPE) -> None:
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def _redis_get(self, key: str) -> Optional[RETURN_VAL_TYPE]:
+        if not self.redis_client:
+            return None
+        try:
+            raw = self.redis_client.get(f'agent_cache:exact:{key}')
+            value = loads(raw.decode('utf-8')) if raw else None
+            return None if value is None or is_expired(value) else value
+        except Exception as e:
+            print(f"WARNING:  Exact-match cache Redis lookup failed: {e}")
+            return None
+
+    def _redis_put(self, key: str, value: RETURN_VAL_TYPE) -> None:
+        if not self.redis_client:
+            return
+        try:
+            ttl = remaining_ttl(value)
+            if self.redis_ttl:
+                ttl = min(ttl, self.redis_ttl) if ttl else self.redis_ttl
+            self.redis_client.set(f'agent_cache:exact:{key}', dumps(list(value)), ex=ttl)
+        except Exception as e:
+            print(f"WARNING:  Exact-match cache Redis update failed: {e}")
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        self._count('lookups')
+        key = normalize_cache_key(prompt, llm_string)
+
+        value = self._memory_get(key)
+        if value is not None:
+            self._count('memory_hits')
+            return value
+
+        value = self._redis_get(key)
+        if value is not None:
+            self._count('redis_hits')
+            self._memory_put(key, value)
+            return value
+
+        value = self.semantic_cache.lookup(prompt, llm_string)
+        if value:
+            self._count('semantic_hits')
+            # Promote so the next identical question skips the vector search
+            self._memory_put(key, value)
+        return value
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        self._count('lookups')
+        key = normalize_cache_key(prompt, llm_string)
+
+        # The in-process tier is answered inline, without leaving the event loop
+        value = self._memory_get(key)
+        if value is not None:
+            self._count('memory_hits')
+            return value
+
+        if self.redis_client:
+            value = await asyncio.to_thread(self._redis_get, key)
+            if value is not None:
+                self._count('redis_hits')
+                self._memory_put(key, value)
+                return value
+
+        value = await self.semantic_cache.alookup(prompt, llm_string)
+        if value:
+            self._count('semantic_hits')
+            self._memory_put(key, value)
+        return value
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = normalize_cache_key(prompt, llm_string)
+        self._memory_put(key, return_val)
+        self._redis_put(key, return_val)
+        self.semantic_cache.update(prompt, llm_string, return_val)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = normalize_cache_key(prompt, llm_string)
+        self._memory_put(key, return_val)
+        if self.redis_client:
+            await asyncio.to_thread(self._redis_put, key, return_val)
+        await self.semantic_cache.aupdate(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._lru.clear()
+        if self.redis_client:
+            keys = list(self.redis_client.scan_iter(match='agent_cache:exact:*'))
+            if keys:
+                self.redis_client.delete(*keys)
+        self.semantic_cache.clear(**kwargs)
+
+    def stats(self) -> dict:
+        """Return lookup counts and hit rates per tier."""
+        with self._lock:
+            counters = dict(self._counters)
+            size = len(self._lru)
+        lookups = counters['lookups']
+        rate = lambda hits: hits / lookups if lookups else 0.0
+        return {
+            'lookups': lookups,
+            'exact_memory': {'hits': counters['memory_hits'], 'hit_rate': rate(counters['memory_hits']), 'size': size},
+            'exact_redis': {'enabled': self.redis_client is not None, 'hits': counters['redis_hits'], 'hit_rate': rate(counters['redis_hits'])},
+            'semantic': {'hits': counters['semantic_hits'], 'hit_rate': rate(counters['semantic_hits'])},
+            'miss_rate': rate(lookups - counters['memory_hits'] - counters['redis_hits'] - counters['semantic_hits']),
+        }
@@ -0,0 +1,248 @@
+"""
+Tool-level response cache for the MCP Financial Agent.
+
+The agent cache only matches whole answers, so two sessions asking different
+questions about the same ticker still call the provider twice for the same
+analysis. This module caches the responses of individual tool calls, keyed by
+the tool name and its canonicalized arguments, for the `cache_ttl_seconds`
+declared by each tool in the registry. Concurrent identical calls share one
+upstream request, and error responses are never cached.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import redis
+
+# Argument names holding ticker symbols, which are case-insensitive
+TICKER_ARG_NAMES = {'ticker', 'tickers'}
+
+def _canonicalize(value: Any, ticker: bool = False) -> Any:
+    if isinstance(value, dict):
+        return {k: _canonicalize(v, k in TICKER_ARG_NAMES) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(v, ticker) for v in value]
+    if ticker and isinstance(value, str):
+        return value.strip().upper()
+    return value
+
+def make_tool_cache_key(tool_name: str, args: Dict[str, Any]) -> str:
+    """
+    Build the cache key of a tool call.
+
+    Args:
+        tool_name (str): Name of the tool
+        args (Dict[str, Any]): Call arguments with defaults filled in, as JSON-compatible values
+
+    Returns:
+        str: `<tool_name>:<sha256 of the canonical arguments>`
+    """
+    canonical = json.dumps(_canonicalize(args), sort_keys=True, separators=(',', ':'), default=str)
+    return f"{tool_name}:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+def is_error_response(response: Any) -> bool:
+    """Tell whether a tool response reports an error, in which case it must not be cached."""
+    return isinstance(response, dict) and response.get('error') is not None
+
+class ToolResponseStore(ABC):
+    """Storage backend of the tool response cache."""
+    # Whether `get`/`set` do network I/O and must run off the event loop
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the fresh response stored under `key`, or None."""
+
+    @abstractmethod
+    def set(self, key: str, response: Any, ttl: int) -> None:
+        """Store a response for `ttl` seconds."""
+
+    @abstractmethod
+    def size(self) -> Optional[int]:
+        """Return the number of stored responses, or None if unknown."""
+
+class InMemoryToolResponseStore(ToolResponseStore):
+    """Process-local LRU of tool responses with per-entry expiry."""
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (response, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def size(self) -> Optional[int]:
+        with self._lock:
+            return len(self._entries)
+
+class RedisToolResponseStore(ToolResponseStore):
+    """Tool responses stored as JSON in Redis (`tool_cache:<key>`), shared between processes."""
+    blocking = True
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis_client = redis_client
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self.redis_client.get(f'tool_cache:{key}')
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            print(f"WARNING:  Tool cache Redis lookup failed: {e}")
+            return None
+
+    def set(self, key: str, response: Any, ttl: int) -> None:
+        try:
+            self.redis_client.set(f'tool_cache:{key}', json.dumps(response, default=str), ex=ttl)
+        except Exception as e:
+            print(f"WARNING:  Tool cache Redis update failed: {e}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+class ToolResponseCache:
+    """
+    Cache of tool responses with single-flight request coalescing.
+
+    Args:
+        store (ToolResponseStore): Where responses are kept
+    """
+    def __init__(self, store: ToolResponseStore):
+        self.store = store
+        self._inflight: Dict[str, Future] = {}
+        self._ainflight: Dict[str, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._counters = {'lookups': 0, 'hits': 0, 'coalesced': 0}
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _store(self, key: str, response: Any, ttl: int) -> None:
+        if not is_error_response(response):
+            self.store.set(key, response, ttl)
+
+    async def _aget(self, key: str) -> Any:
+        return await asyncio.to_thread(self.store.get, key) if self.store.blocking else self.store.get(key)
+
+    def get_or_call(self, key: str, ttl: int, call: Callable[[], Any]) -> Any:
+        """
+        Return the cached response of a tool call, or make the call once for all concurrent callers.
+
+        Args:
+            key (str): Key from `make_tool_cache_key`
+            ttl (int): Freshness of the response in seconds
+            call (Callable[[], Any]): Function calling the provider
+
+        Returns:
+            Any: The tool response
+        """
+        self._count('lookups')
+        response = self.store.get(key)
+        if response is not None:
+            self._count('hits')
+            return response
+
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            self._count('coalesced')
+            return future.result()
+
+        try:
+            # A previous leader may have stored the response between the lookup and the lock
+            response = self.store.get(key)
+            if response is not None:
+                self._count('hits')
+                future.set_result(response)
+                return response
+            response = call()
+            self._store(key, response, ttl)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    async def _acall_and_store(self, key: str, ttl: int, acall: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            # A previous leader may have stored the response between the lookup and the registration
+            response = await self._aget(key)
+            if response is not None:
+                self._count('hits')
+                return response
+            response = await acall()
+            if self.store.blocking:
+                await asyncio.to_thread(self._store, key, response, ttl)
+            else:
+                self._store(key, response, ttl)
+            return response
+        finally:
+            self._ainflight.pop(key, None)
+
+    async def aget_or_call(self, key: str, ttl: int, acall: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async version of `get_or_call`, coalescing concurrent calls on the same event loop.
+
+        The upstream call runs in its own task, which every caller (the first one
+        included) awaits through `asyncio.shield`: a caller being cancelled, e.g.
+        because its client disconnected, does not cancel the call for the others.
+        """
+        self._count('lookups')
+        response = await self._aget(key)
+        if response is not None:
+            self._count('hits')
+            return response
+
+        task = self._ainflight.get(key)
+        if task is not None:
+            self._count('coalesced')
+        else:
+            task = asyncio.ensure_future(self._acall_and_store(key, ttl, acall))
+            # Every caller may be gone by the time it fails: mark its error retrieved
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._ainflight[key] = task
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        """Return lookup counts and the hit rate of the tool cache."""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters['lookups']
+        return {
+            'backend': type(self.store).__name__,
+            'lookups': lookups,
+            'hits': counters['hits'],
+            'coalesced': counters['coalesced'],
+            'hit_rate': (counters['hits'] + counters['coalesced']) / lookups if lookups else 0.0,
+            'size': self.store.size(),
+        }
@@ -0,0 +1,112 @@
+"""
+Pooled HTTP clients for the MCP Financial Agent.
+
+This module keeps one sync and one async HTTP client per provider, shared by
+every tool of that provider, so tool calls reuse keep-alive connections instead
+of opening a new TCP connection each time. Timeouts and connection limits come
+from the `http` section of each provider in the registry's `providers.yaml`,
+falling back to the defaults in the application configuration.
+"""
+import threading
+from typing import Any, Dict, List
+
+import httpx
+
+import app.core.config as cfg
+
+# Per-provider `http` settings received from the registry
+_PROVIDER_HTTP_CONFIGS: Dict[str, Dict[str, Any]] = {}
+
+# Lazily created clients, keyed by provider name
+_SYNC_CLIENTS: Dict[str, httpx.Client] = {}
+_ASYNC_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+# Clients replaced after a settings change; calls started on them may still be running,
+# so they are only closed at shutdown
+_RETIRED_CLIENTS: List[Any] = []
+_LOCK = threading.Lock()
+
+def configure_providers(providers: List[Dict[str, Any]]) -> None:
+    """
+    Register the HTTP settings of each provider.
+
+    When the settings of a provider changed, its clients are dropped, so the
+    next tool call creates clients with the new settings. The dropped clients
+    are not closed right away, since calls started on them may still be
+    running, but when the application shuts down.
+
+    Args:
+        providers (List[Dict[str, Any]]): Provider configurations from the registry
+    """
+    with _LOCK:
+        for provider in providers:
+            name = provider.get('name')
+            if not name:
+                continue
+            http_cfg = provider.get('http') or {}
+            if name in _PROVIDER_HTTP_CONFIGS and _PROVIDER_HTTP_CONFIGS[name] != http_cfg:
+                for clients in (_SYNC_CLIENTS, _ASYNC_CLIENTS):
+                    if name in clients:
+                        _RETIRED_CLIENTS.append(clients.pop(name))
+                print(f"INFO:     HTTP settings of provider '{name}' changed, its clients will be recreated.")
+            _PROVIDER_HTTP_CONFIGS[name] = http_cfg
+
+def _client_options(provider: str) -> Dict[str, Any]:
+    http_cfg = _PROVIDER_HTTP_CONFIGS.get(provider, {})
+    connect_timeout = float(http_cfg.get('connect_timeout', cfg.HTTP_CONNECT_TIMEOUT))
+    read_timeout = float(http_cfg.get('read_timeout', cfg.HTTP_READ_TIMEOUT))
+    return {
+        'timeout': httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=read_timeout,
+            pool=connect_timeout
+        ),
+        'limits': httpx.Limits(
+            max_connections=int(http_cfg.get('max_connections', cfg.HTTP_MAX_CONNECTIONS)),
+            max_keepalive_connections=int(http_cfg.get('max_keepalive_connections', cfg.HTTP_MAX_KEEPALIVE_CONNECTIONS)),
+            keepalive_expiry=float(http_cfg.get('keepalive_expiry', cfg.HTTP_KEEPALIVE_EXPIRY))
+        )
+    }
+
+def get_http_client(provider: str) -> httpx.Client:
+    """
+    Get the shared sync HTTP client of a provider.
+
+    Args:
+        provider (str): The provider name (e.g., 'itapia', 'yf')
+
+    Returns:
+        httpx.Client: Pooled client configured for the provider
+    """
+    with _LOCK:
+        if provider not in _SYNC_CLIENTS:
+            _SYNC_CLIENTS[provider] = httpx.Client(**_client_options(provider))
+        return _SYNC_CLIENTS[provider]
+
+def get_async_http_client(provider: str) -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client of a provider.
+
+    Args:
+        provider (str): The provider name (e.g., 'itapia', 'yf')
+
+    Returns:
+        httpx.AsyncClient: Pooled client configured for the provider
+    """
+    with _LOCK:
+        if provider not in _ASYNC_CLIENTS:
+            _ASYNC_CLIENTS[provider] = httpx.AsyncClient(**_client_options(provider))
+        return _ASYNC_CLIENTS[provider]
+
+async def aclose_http_clients() -> None:
+    """Close every pooled client, releasing their connections."""
+    with _LOCK:
+        clients = list(_SYNC_CLIENTS.values()) + list(_ASYNC_CLIENTS.values()) + _RETIRED_CLIENTS
+        _SYNC_CLIENTS.clear()
+        _ASYNC_CLIENTS.clear()
+        _RETIRED_CLIENTS.clear()
+    for client in clients:
+        if isinstance(client, httpx.AsyncClient):
+            await client.aclose()
+        else:
+            client.close()
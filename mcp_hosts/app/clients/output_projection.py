@@ -0,0 +1,107 @@
+"""
+Tool output compaction for the MCP Financial Agent.
+
+Tool observations are written into the agent scratchpad and resent to the LLM
+on every later iteration of the turn, so a full analysis report costs its size
+in input tokens several times. Each tool may declare an `output_projection` in
+the registry which is applied to its responses before they reach the agent:
+
+- `fields`: dotted paths of the fields to keep (lists are traversed), everything else is dropped
+- `exclude_fields`: dotted paths of fields to drop
+- `max_list_items`: lists longer than this keep their first items and a note of how many were cut
+- `float_digits`: floats are rounded to this number of decimals
+- `max_tokens`: size budget of the serialized output; lists are shortened further and, as a
+  last resort, the text is truncated to fit
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+from app.core.tokens import count_tokens, truncate_to_tokens
+
+def _path_tree(paths: List[str]) -> Dict[str, Any]:
+    """Turn dotted paths into a nested dict; a None leaf selects the whole subtree."""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        parts = path.split('.')
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[parts[-1]] = None
+    return tree
+
+def _select(data: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(data, list):
+        return [_select(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: value if tree[key] is None else _select(value, tree[key])
+            for key, value in data.items() if key in tree}
+
+def _drop(data: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(data, list):
+        return [_drop(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    return {key: value if key not in tree else _drop(value, tree[key])
+            for key, value in data.items() if key not in tree or tree[key] is not None}
+
+def _compact(data: Any, max_list_items: Optional[int], float_digits: Optional[int]) -> Any:
+    if isinstance(data, dict):
+        return {key: _compact(value, max_list_items, float_digits) for key, value in data.items()}
+    if isinstance(data, list):
+        items = [_compact(item, max_list_items, float_digits) for item in data[:max_list_items]]
+        if max_list_items is not None and len(data) > max_list_items:
+            items.append(f"... {len(data) - max_list_items} more items omitted")
+        return items
+    if isinstance(data, float) and float_digits is not None:
+        return round(data, float_digits)
+    return data
+
+def _longest_list(data: Any) -> int:
+    if isinstance(data, dict):
+        return max((_longest_list(value) for value in data.values()), default=0)
+    if isinstance(data, list):
+        return max([len(data)] + [_longest_list(item) for item in data])
+    return 0
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+def project_output(data: Any, projection: Optional[Dict[str, Any]]) -> Any:
+    """
+    Compact a tool response according to the tool's `output_projection`.
+
+    Args:
+        data (Any): The JSON response of the tool
+        projection (Optional[Dict[str, Any]]): The projection from the tool specification
+
+    Returns:
+        Any: The compacted response, or a truncated JSON string if it still exceeds `max_tokens`
+    """
+    if not projection:
+        return data
+    if projection.get('fields'):
+        data = _select(data, _path_tree(projection['fields']))
+    if projection.get('exclude_fields'):
+        data = _drop(data, _path_tree(projection['exclude_fields']))
+
+    max_list_items = projection.get('max_list_items')
+    float_digits = projection.get('float_digits')
+    compacted = _compact(data, max_list_items, float_digits)
+
+    max_tokens = projection.get('max_tokens')
+    if not max_tokens or count_tokens(_dumps(compacted)) <= max_tokens:
+        return compacted
+
+    # Over budget: halve the list limit until the output fits or every list keeps one item
+    limit = min(max_list_items or _longest_list(data), _longest_list(data))
+    while limit > 1:
+        limit //= 2
+        compacted = _compact(data, limit, float_digits)
+        if count_tokens(_dumps(compacted)) <= max_tokens:
+            return compacted
+    return truncate_to_tokens(_dumps(compacted), max_tokens) + " ... [output truncated]"
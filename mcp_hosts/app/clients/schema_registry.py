@@ -0,0 +1,93 @@
+"""
+Provider schema registry for the MCP Financial Agent.
+
+Complex tool parameters are typed with Pydantic models generated into
+`app.mcp_schemas.<provider>` by the schema sync scripts. This module imports
+each provider module once and resolves classes from it, reloading the module
+only when the content of the generated file has changed since it was loaded,
+so every tool of a provider shares the same class objects.
+"""
+import hashlib
+import importlib
+import os
+import sys
+import threading
+from typing import Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+def _file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class SchemaRegistry:
+    """
+    Cache of generated provider schema modules.
+
+    Args:
+        package (str): Package containing one generated module per provider
+    """
+    def __init__(self, package: str = 'app.mcp_schemas'):
+        self.package = package
+        # provider -> (module, (mtime_ns, size) of the file when checked, sha256 of the file)
+        self._modules: Dict[str, Tuple[object, Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, provider: str):
+        """Return the provider module, importing it on first use and reloading it if the file changed."""
+        module_path = f"{self.package}.{provider}"
+        entry = self._modules.get(provider)
+        if entry is None:
+            module = sys.modules.get(module_path) or importlib.import_module(module_path)
+            stat = os.stat(module.__file__)
+            self._modules[provider] = (module, (stat.st_mtime_ns, stat.st_size), _file_hash(module.__file__))
+            return module
+
+        module, signature, content_hash = entry
+        stat = os.stat(module.__file__)
+        new_signature = (stat.st_mtime_ns, stat.st_size)
+        # The file is only hashed again when its stat changed, e.g. after a schema sync
+        if new_signature != signature:
+            new_hash = _file_hash(module.__file__)
+            if new_hash != content_hash:
+                print(f"INFO:     Schema module '{module_path}' changed, reloading it.")
+                module = importlib.reload(module)
+            self._modules[provider] = (module, new_signature, new_hash)
+        return module
+
+    def get_schema_class(self, provider: str, class_name: str) -> Optional[Type[BaseModel]]:
+        """
+        Resolve a Pydantic class of a provider.
+
+        Args:
+            provider (str): The provider name (e.g., 'itapia', 'yf')
+            class_name (str): The name of the Pydantic class
+
+        Returns:
+            Optional[Type[BaseModel]]: The Pydantic class or None if it cannot be resolved
+        """
+        if not class_name or not provider:
+            return None
+        try:
+            with self._lock:
+                module = self._load(provider)
+            return getattr(module, class_name)
+        except (ImportError, AttributeError, OSError) as e:
+            print(f"WARNING:  Cannot dynamically import schema '{class_name}' from module '{self.package}.{provider}': {e}")
+            return None
+
+# Shared by every tool creation of the process
+_SCHEMA_REGISTRY = SchemaRegistry()
+
+def get_schema_class(provider: str, class_name: str) -> Optional[Type[BaseModel]]:
+    """
+    Resolve a Pydantic class of a provider from the shared schema registry.
+
+    Args:
+        provider (str): The provider name (e.g., 'itapia', 'yf')
+        class_name (str): The name of the Pydantic class
+
+    Returns:
+        Optional[Type[BaseModel]]: The Pydantic class or None if it cannot be resolved
+    """
+    return _SCHEMA_REGISTRY.get_schema_class(provider, class_name)
@@ -5,39 +5,20 @@ This module handles the dynamic discovery and creation of tools that the
 financial agent can use. It connects to an MCP Servers registry to fetch
 tool specifications and creates LangChain tools from them.
 """
+import hashlib
+import json
 import requests
-import sys
-import importlib
+import threading
+import time
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, create_model, Field
-from typing import Dict, Any, Literal, Type
+from typing import Dict, Any, List, Literal, Optional, Tuple
 import app.core.config as cfg
-
-def _get_schema_class(provider: str, class_name: str) -> Type[BaseModel]:
-    """
-    Dynamically import a Pydantic class, ensuring the schema has been synced.
-    
-    Args:
-        provider (str): The provider name (e.g., 'itapia', 'yf')
-        class_name (str): The name of the Pydantic class to import
-        
-    Returns:
-        Type[BaseModel]: The Pydantic class or None if import fails
-    """
-    if not class_name or not provider: 
-        return None
-
-    try:
-        module_path = f"app.mcp_schemas.{provider}"
-        # Clear module cache if it was previously imported to reload
-        if module_path in sys.modules:
-            importlib.reload(sys.modules[module_path])
-        
-        schema_module = importlib.import_module(module_path)
-        return getattr(schema_module, class_name)
-    except (ImportError, AttributeError, ModuleNotFoundError) as e:
-        print(f"WARNING:  Cannot dynamically import schema '{class_name}' from module '{module_path}': {e}")
-        return None
+from app.clients.http_pool import configure_providers, get_http_client, get_async_http_client
+from app.clients.output_projection import project_output
+from app.clients.schema_registry import get_schema_class
+from app.cache import get_tool_response_cache
+from app.cache.tool_response import is_error_response, make_tool_cache_key
 
 def create_api_calling_tool_from_spec(spec: dict):
     """
@@ -51,6 +32,9 @@ def create_api_calling_tool_from_spec(spec: dict):
         
     Returns:
         StructuredTool: A LangChain tool ready to be used by the agent
+
+    Raises:
+        ValueError: If a `schemas_name` class is missing from the provider's generated schemas
     """
     name = spec['name']
     tool_description = spec['description']
@@ -71,7 +55,9 @@ def create_api_calling_tool_from_spec(spec: dict):
         # Handle complex schema objects
         if 'schemas_name' in details:
             body_param_name = param_name
-            schema_class = _get_schema_class(provider, details['schemas_name'])
+            schema_class = get_schema_class(provider, details['schemas_name'])
+            if schema_class is None:
+                raise ValueError(f"Schema '{details['schemas_name']}' of provider '{provider}' cannot be resolved")
             
             # Complex object parameters are typically required
             field_value = Field(..., description=details.get('description'))
@@ -100,36 +86,88 @@ def create_api_calling_tool_from_spec(spec: dict):
 
     ArgsModel = create_model(f"{name.title().replace('_', '')}Input", **fields_for_model)
 
-    def _execute_api_call(*args, **kwargs):
+    # Responses are cached for the tool's TTL from the registry; 0 disables caching this tool
+    cache_ttl = spec.get('cache_ttl_seconds')
+    if cache_ttl is None:
+        cache_ttl = cfg.TOOL_CACHE_DEFAULT_TTL
+
+    # Responses are compacted before they reach the agent; the cache keeps them in full
+    output_projection = spec.get('output_projection') if cfg.TOOL_OUTPUT_PROJECTION_ENABLED else None
+
+    def _project(response):
+        if is_error_response(response):
+            return response
+        try:
+            return project_output(response, output_projection)
+        except Exception as e:
+            print(f"WARNING:  Cannot project the output of tool '{name}', returning it in full: {e}")
+            return response
+
+    def _merge_args(args: tuple, kwargs: dict) -> dict:
         """
-        Execute the API call for this tool.
+        Merge positional and keyword arguments into a single dict for consistent processing.
+        """
+        # For example, if the tool only has 1 arg 'ticker', LangChain might call: 
+        # _execute_api_call('FPT') which this code converts to {'ticker': 'FPT'}
+        all_args = dict(kwargs)
+        if args:
+            # Get field names from the created Pydantic model
+            arg_names = list(ArgsModel.model_fields.keys())
+            for i, arg_val in enumerate(args):
+                if i < len(arg_names):
+                    all_args[arg_names[i]] = arg_val
+        return all_args
+
+    def _build_request(all_args: dict):
+        """
+        Turn the tool call arguments into the request URL, query parameters and JSON body.
+        """
+        all_args = dict(all_args)
+        request_body = None
+        if body_param_name and body_param_name in all_args:
+            body = all_args.pop(body_param_name)
+            request_body = body.model_dump() if isinstance(body, BaseModel) else body
+
+        # Now all_args only contains path and query parameters
+        formatted_endpoint = endpoint_template.format(**all_args)
+        query_params = {k: v for k, v in all_args.items() if v is not None}
+        return formatted_endpoint, query_params, request_body
+
+    def _cache_key(all_args: dict):
+        """
+        Build the response cache key of a call, or None if this call is not cached.
         
-        This function handles parameter processing, API request execution,
-        and error handling for the tool.
+        Arguments are validated through `ArgsModel` first, so omitted optional
+        arguments and their explicit defaults map to the same key.
         """
+        if cache_ttl <= 0 or get_tool_response_cache() is None:
+            return None
+        try:
+            return make_tool_cache_key(name, ArgsModel.model_validate(all_args).model_dump(mode='json'))
+        except Exception:
+            return None
+
+    def _call_api(all_args: dict):
+        try:
+            url, query_params, request_body = _build_request(all_args)
+            response = get_http_client(provider).request(
+                method=method,
+                url=url,
+                params=query_params,
+                json=request_body,
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            return {"error": f"Error calling tool '{name}': {e}"}
+
+    async def _acall_api(all_args: dict):
         try:
-            # Merge args and kwargs into a single dict for consistent processing
-            # For example, if the tool only has 1 arg 'ticker', LangChain might call: 
-            # _execute_api_call('FPT') which this code converts to {'ticker': 'FPT'}
-            all_args = kwargs
-            if args:
-                # Get field names from the created Pydantic model
-                arg_names = list(ArgsModel.model_fields.keys())
-                for i, arg_val in enumerate(args):
-                    if i < len(arg_names):
-                        all_args[arg_names[i]] = arg_val
-
-            request_body = None
-            if body_param_name and body_param_name in all_args:
-                request_body = all_args.pop(body_param_name).model_dump()
-
-            # Now all_args only contains path and query parameters
-            formatted_endpoint = endpoint_template.format(**all_args)
-            query_params = {k: v for k, v in all_args.items()}
-
-            response = requests.request(
+            url, query_params, request_body = _build_request(all_args)
+            response = await get_async_http_client(provider).request(
                 method=method,
-                url=formatted_endpoint,
+                url=url,
                 params=query_params,
                 json=request_body,
                 headers={"Content-Type": "application/json"}
@@ -139,41 +177,188 @@ def create_api_calling_tool_from_spec(spec: dict):
         except Exception as e:
             return {"error": f"Error calling tool '{name}': {e}"}
 
+    def _execute_api_call(*args, **kwargs):
+        """
+        Execute the API call for this tool.
+        
+        This function handles parameter processing, API request execution,
+        and error handling for the tool, using the provider's pooled HTTP client.
+        Successful responses are served from the tool response cache while fresh,
+        and compacted by the tool's output projection.
+        """
+        all_args = _merge_args(args, kwargs)
+        cache_key = _cache_key(all_args)
+        if cache_key is None:
+            return _project(_call_api(all_args))
+        return _project(get_tool_response_cache().get_or_call(cache_key, cache_ttl, lambda: _call_api(all_args)))
+
+    async def _aexecute_api_call(*args, **kwargs):
+        """
+        Execute the API call for this tool without blocking the event loop.
+        
+        Same as `_execute_api_call`, but uses the provider's pooled async HTTP client.
+        """
+        all_args = _merge_args(args, kwargs)
+        cache_key = _cache_key(all_args)
+        if cache_key is None:
+            return _project(await _acall_api(all_args))
+        return _project(await get_tool_response_cache().aget_or_call(cache_key, cache_ttl, lambda: _acall_api(all_args)))
+
     return StructuredTool.from_function(
         name=name,
         description=tool_description,
         func=_execute_api_call,
-        args_schema=ArgsModel
+        coroutine=_aexecute_api_call,
+        args_schema=ArgsModel,
+        metadata={'provider': provider, 'cache_ttl_seconds': spec.get('cache_ttl_seconds')}
     )
 
+def get_tool_filters() -> dict:
+    """
+    Registry query filters restricting which tools this host fetches and builds.
+    
+    Returns:
+        dict: Query parameters (`provider`, `name`, `tag`) for the non-empty filters
+    """
+    filters = {'provider': cfg.TOOL_FILTER_PROVIDERS, 'name': cfg.TOOL_FILTER_NAMES, 'tag': cfg.TOOL_FILTER_TAGS}
+    return {key: value for key, value in filters.items() if value}
+
+def _spec_hash(spec: dict) -> str:
+    """Content hash of one tool specification, used to detect changed tools."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+class ToolCatalog:
+    """
+    Tools built from the registry, refreshed with conditional requests.
+    
+    The ETags of `/providers` and `/tools` are remembered, so an unchanged
+    registry answers with an empty 304. When the tool list changed, only the
+    tools whose specification changed are rebuilt; the others are reused.
+
+    Argument models come from the schemas generated by `scripts/sync_schemas.py`
+    when the container starts. A tool referencing a model that is not in them
+    yet is skipped (or keeps its previous version) until the schemas are
+    synced again, i.e. until the host restarts.
+    """
+    def __init__(self):
+        self._tools_etag: Optional[str] = None
+        self._providers_etag: Optional[str] = None
+        # tool name -> (specification hash, tool)
+        self._tools: Dict[str, Tuple[str, StructuredTool]] = {}
+        self._order: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def tools(self) -> List[StructuredTool]:
+        """The current tools, in registry order."""
+        return [self._tools[name][1] for name in self._order]
+
+    def _get(self, path: str, etag: Optional[str], params: Optional[dict] = None) -> requests.Response:
+        headers = {'If-None-Match': etag} if etag else {}
+        response = requests.get(f"{cfg.MCP_SERVERS_REGISTRY_URL}{path}", params=params, headers=headers, timeout=cfg.HTTP_READ_TIMEOUT)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _refresh_providers(self) -> None:
+        # Providers carry the HTTP settings (timeouts, pool sizes) used by their tools
+        try:
+            response = self._get('/providers', self._providers_etag)
+            if response.status_code == 304:
+                return
+            configure_providers(response.json())
+            self._providers_etag = response.headers.get('ETag')
+        except Exception as e:
+            print(f"WARNING:  Cannot load provider configurations, using current HTTP settings: {e}")
+
+    def refresh(self) -> bool:
+        """
+        Fetch the tool specifications if they changed and rebuild the changed tools.
+        
+        Returns:
+            bool: True if the set of tools changed
+            
+        Raises:
+            requests.RequestException: If the registry cannot be reached
+        """
+        with self._lock:
+            self._refresh_providers()
+            response = self._get('/tools', self._tools_etag, params=get_tool_filters())
+            if response.status_code == 304:
+                return False
+            tool_specs = response.json()
+
+            build_start_time = time.perf_counter()
+            tools: Dict[str, Tuple[str, StructuredTool]] = {}
+            rebuilt, failed = [], []
+            for spec in tool_specs:
+                spec_hash = _spec_hash(spec)
+                current = self._tools.get(spec['name'])
+                if current is not None and current[0] == spec_hash:
+                    tools[spec['name']] = current
+                    continue
+                try:
+                    tools[spec['name']] = (spec_hash, create_api_calling_tool_from_spec(spec))
+                    rebuilt.append(spec['name'])
+                except ValueError as e:
+                    failed.append(spec['name'])
+                    if current is not None:
+                        # Keep the previous version, still stored under its old hash so it is retried
+                        tools[spec['name']] = current
+                    print(f"WARNING:  Cannot build tool '{spec['name']}', "
+                          f"{'keeping its previous version' if current else 'skipping it'}: {e}")
+            order = [spec['name'] for spec in tool_specs if spec['name'] in tools]
+            removed = [name for name in self._order if name not in tools]
+
+            # Forget the ETag while some tools failed, so the next poll retries them
+            self._tools_etag = None if failed else response.headers.get('ETag')
+            changed = bool(rebuilt or removed or order != self._order)
+            self._tools, self._order = tools, order
+            if changed:
+                print(f"INFO:     Tools refreshed in {time.perf_counter() - build_start_time:.3f}s: "
+                      f"rebuilt {rebuilt}, removed {removed}, {len(order)} tools in total.")
+            return changed
+
+# Tools of this host, shared by the initial discovery and the periodic refresh
+_TOOL_CATALOG = ToolCatalog()
+
+def refresh_tools() -> Optional[List[StructuredTool]]:
+    """
+    Poll the registry and rebuild the tools whose specification changed.
+    
+    Returns:
+        Optional[List[StructuredTool]]: The new tool list, or None if nothing changed
+    """
+    if _TOOL_CATALOG.refresh():
+        return _TOOL_CATALOG.tools
+    return None
+
 def discover_tools():
     """
     Discover and build a list of tools by calling the Registry Service.
     
     This function connects to the MCP Servers registry to fetch tool specifications
-    and creates LangChain tools from them.
+    and creates LangChain tools from them. Later changes are picked up by `refresh_tools`.
     
     Returns:
         list: List of StructuredTool objects
         
     Raises:
         ValueError: If MCP_SERVERS_REGISTRY_URL is not configured
+        requests.RequestException: If the registry cannot be reached, so startup can retry
     """
     if not cfg.MCP_SERVERS_REGISTRY_URL:
         raise ValueError("MCP_SERVERS_REGISTRY_URL is not configured.")
+    start_time = time.perf_counter()
     try:
         print(f"INFO:     Discovering tools from Registry...")
-        tools_response = requests.get(f"{cfg.MCP_SERVERS_REGISTRY_URL}/tools")
-        tools_response.raise_for_status()
-        tool_specs = tools_response.json()
-        print(tool_specs)
-
-        # Create tools from specifications
-        tools = [create_api_calling_tool_from_spec(spec) for spec in tool_specs]
+        _TOOL_CATALOG.refresh()
+        tools = _TOOL_CATALOG.tools
         for tool in tools:
             print(tool.description)
-        print(f"INFO:     Successfully discovered and created {len(tools)} tools.")
+        print(f"INFO:     Successfully discovered and created {len(tools)} tools "
+              f"in {time.perf_counter() - start_time:.3f}s.")
         return tools
     except Exception as e:
         print(f"ERROR:    Cannot discover tools from Registry: {e}")
-        return []
\ No newline at end of file
+        raise
\ No newline at end of file
@@ -43,6 +43,16 @@ REDIS_DB = os.getenv("REDIS_DB", '0')
 REDIS_TTL = int(os.getenv('REDIS_TTL', '3600'))
 REDIS_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'
 
+# In-memory session store: maximum number of sessions held (least recently used evicted first, 0 for
+# no limit), idle seconds before a session expires like the Redis TTL (0 never expires) and maximum
+# messages kept per session (0 for no limit)
+MEMORY_MAX_SESSIONS = int(os.getenv('MEMORY_MAX_SESSIONS', '10000'))
+MEMORY_SESSION_TTL = int(os.getenv('MEMORY_SESSION_TTL', str(REDIS_TTL)))
+MEMORY_MAX_MESSAGES_PER_SESSION = int(os.getenv('MEMORY_MAX_MESSAGES_PER_SESSION', '200'))
+# Number of most recent messages loaded from the Redis chat history on each turn (0 loads all of them);
+# keep it above twice MEMORY_SUMMARY_MAX_TURNS so rolling summaries see the whole hot history
+MEMORY_HISTORY_LOAD_LIMIT = int(os.getenv('MEMORY_HISTORY_LOAD_LIMIT', '100'))
+
 # Chroma host
 CHROMA_HOST = os.getenv('CHROMA_HOST', 'localhost')
 CHROMA_PORT = os.getenv('CHROMA_PORT', '8000')
@@ -55,9 +65,79 @@ SYSTEM_PROMPT_ID = 'financial_agent_system_prompt_v1'
 # LLM caching configuration
 LLM_CACHE_ENABLED = True if os.getenv('LLM_CACHE_ENABLED', 'false').lower() in ['true', '1'] else False
 LLM_CACHE_TYPE = os.getenv('LLM_CACHE_TYPE', 'gptcache')
+# Exact-match tier checked before the gptcache/redis agent cache
+LLM_CACHE_EXACT_TIER_ENABLED = True if os.getenv('LLM_CACHE_EXACT_TIER_ENABLED', 'true').lower() in ['true', '1'] else False
+LLM_CACHE_EXACT_TIER_MAX_ENTRIES = int(os.getenv('LLM_CACHE_EXACT_TIER_MAX_ENTRIES', '1000'))
+LLM_CACHE_EXACT_TIER_REDIS_ENABLED = True if os.getenv('LLM_CACHE_EXACT_TIER_REDIS_ENABLED', 'false').lower() in ['true', '1'] else False
+LLM_CACHE_EXACT_TIER_REDIS_TTL = int(os.getenv('LLM_CACHE_EXACT_TIER_REDIS_TTL', '86400'))
+# Freshness of cached agent answers: tools without `cache_ttl_seconds` in the registry
+# use the default tool TTL, answers produced without any tool use the no-tool TTL
+LLM_CACHE_DEFAULT_TOOL_TTL = int(os.getenv('LLM_CACHE_DEFAULT_TOOL_TTL', '300'))
+LLM_CACHE_NO_TOOL_TTL = int(os.getenv('LLM_CACHE_NO_TOOL_TTL', '86400'))
+
+# Tool response cache, shared by all sessions; tools are cached for their `cache_ttl_seconds`
+# from the registry, or TOOL_CACHE_DEFAULT_TTL if they have none (0 disables caching a tool)
+TOOL_CACHE_ENABLED = True if os.getenv('TOOL_CACHE_ENABLED', 'true').lower() in ['true', '1'] else False
+TOOL_CACHE_TYPE = os.getenv('TOOL_CACHE_TYPE', 'in-memory')
+TOOL_CACHE_MAX_ENTRIES = int(os.getenv('TOOL_CACHE_MAX_ENTRIES', '2000'))
+TOOL_CACHE_DEFAULT_TTL = int(os.getenv('TOOL_CACHE_DEFAULT_TTL', '300'))
 
 # Embedding
 EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'intfloat/multilingual-e5-small')
+# Embedding cache shared by the memory retriever and the semantic cache
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', '10000'))
+EMBEDDING_CACHE_REDIS_ENABLED = True if os.getenv('EMBEDDING_CACHE_REDIS_ENABLED', 'false').lower() in ['true', '1'] else False
+EMBEDDING_CACHE_TTL = int(os.getenv('EMBEDDING_CACHE_TTL', '86400'))
 
 # MCP Servers registry URL for tool discovery
-MCP_SERVERS_REGISTRY_URL = os.getenv("MCP_SERVERS_REGISTRY_URL")
\ No newline at end of file
+MCP_SERVERS_REGISTRY_URL = os.getenv("MCP_SERVERS_REGISTRY_URL")
+
+# Default HTTP settings of tool calls, overridable per provider in the registry's providers.yaml
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '3'))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', '30'))
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '20'))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '10'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30'))
+
+# Startup: attempts of each component (embedding model, LLM client, tools, caches) before the process
+# exits, and seconds before the first retry, doubled after each failure
+STARTUP_MAX_ATTEMPTS = int(os.getenv('STARTUP_MAX_ATTEMPTS', '5'))
+STARTUP_RETRY_BACKOFF = float(os.getenv('STARTUP_RETRY_BACKOFF', '2'))
+
+# Registry filters on the tools this host fetches: comma-separated provider names, tool names
+# and tags, empty for no restriction
+TOOL_FILTER_PROVIDERS = os.getenv('TOOL_FILTER_PROVIDERS', '')
+TOOL_FILTER_NAMES = os.getenv('TOOL_FILTER_NAMES', '')
+TOOL_FILTER_TAGS = os.getenv('TOOL_FILTER_TAGS', '')
+# Seconds between polls of the registry for tool changes, 0 to load the tools only at startup
+TOOL_REFRESH_INTERVAL = int(os.getenv('TOOL_REFRESH_INTERVAL', '60'))
+
+# Maximum number of tool calls of one agent step executed concurrently
+TOOL_MAX_CONCURRENCY = int(os.getenv('TOOL_MAX_CONCURRENCY', '4'))
+# Tool routing: bind only the TOOL_ROUTING_TOP_K tools whose descriptions are most similar to
+# the user message, plus the comma-separated TOOL_ROUTING_ALWAYS_INCLUDE tools, instead of every tool
+TOOL_ROUTING_ENABLED = True if os.getenv('TOOL_ROUTING_ENABLED', 'false').lower() in ['true', '1'] else False
+TOOL_ROUTING_TOP_K = int(os.getenv('TOOL_ROUTING_TOP_K', '3'))
+TOOL_ROUTING_ALWAYS_INCLUDE = [name.strip() for name in os.getenv('TOOL_ROUTING_ALWAYS_INCLUDE', '').split(',') if name.strip()]
+# Maximum number of tool subsets whose agent executors are kept for reuse
+TOOL_ROUTING_MAX_EXECUTORS = int(os.getenv('TOOL_ROUTING_MAX_EXECUTORS', '32'))
+
+# Compact tool responses with the `output_projection` of their registry specification
+TOOL_OUTPUT_PROJECTION_ENABLED = True if os.getenv('TOOL_OUTPUT_PROJECTION_ENABLED', 'true').lower() in ['true', '1'] else False
+# tiktoken encoding used to count prompt tokens; the length / 4 estimate is used without tiktoken
+TOKENIZER_ENCODING = os.getenv('TOKENIZER_ENCODING', 'cl100k_base')
+
+# Retrieved memory: total token budget of the context, maximum tokens of one turn pair (longer
+# pairs are truncated) and cosine similarity above which two pairs count as duplicates
+MEMORY_CONTEXT_MAX_TOKENS = int(os.getenv('MEMORY_CONTEXT_MAX_TOKENS', '1500'))
+MEMORY_TURN_MAX_TOKENS = int(os.getenv('MEMORY_TURN_MAX_TOKENS', '500'))
+MEMORY_DEDUPE_SIMILARITY = float(os.getenv('MEMORY_DEDUPE_SIMILARITY', '0.95'))
+
+# Rolling summaries: once a session has more than MEMORY_SUMMARY_MAX_TURNS turns, its oldest turns
+# are folded into a stored summary and only the MEMORY_SUMMARY_KEEP_TURNS most recent stay in the history.
+# Folded messages are archived for MEMORY_ARCHIVE_TTL seconds (0 discards them)
+MEMORY_SUMMARY_ENABLED = True if os.getenv('MEMORY_SUMMARY_ENABLED', 'true').lower() in ['true', '1'] else False
+MEMORY_SUMMARY_MAX_TURNS = int(os.getenv('MEMORY_SUMMARY_MAX_TURNS', '20'))
+MEMORY_SUMMARY_KEEP_TURNS = int(os.getenv('MEMORY_SUMMARY_KEEP_TURNS', '10'))
+MEMORY_ARCHIVE_TTL = int(os.getenv('MEMORY_ARCHIVE_TTL', '604800'))
+SUMMARY_PROMPT_ID = 'conversation_summary_prompt_v1'
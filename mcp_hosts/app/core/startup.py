@@ -0,0 +1,143 @@
+"""
+Startup pipeline for the MCP Financial Agent.
+
+Loading the embedding model, discovering tools from the registry and building
+the LLM client take many seconds. This module runs them in the background
+after the server has bound its port: independent components are warmed up in
+parallel threads, then the agent is built from them. The state and timing of
+every component is recorded for the `/ready` endpoint and logged once startup
+finishes. A failing component (e.g. a transient error downloading the model or
+reaching the registry) is retried with exponential backoff; if it still fails,
+the process stops so that its supervisor restarts it. Once ready, the tools are
+periodically refreshed from the registry and the agent is rebuilt when they change.
+"""
+import asyncio
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import app.core.config as cfg
+
+class StartupState:
+    """Status and timing of each startup component."""
+    def __init__(self):
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.ready = False
+        self.started_at = time.perf_counter()
+        self.finished_in: Optional[float] = None
+
+    def set(self, component: str, status: str, seconds: Optional[float] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._components[component] = {'status': status, 'seconds': seconds, 'error': error}
+
+    def snapshot(self) -> dict:
+        """Return the overall readiness and the state of every component."""
+        with self._lock:
+            components = {name: dict(state) for name, state in self._components.items()}
+        return {'ready': self.ready, 'startup_seconds': self.finished_in, 'components': components}
+
+# Shared with the readiness endpoint
+STARTUP_STATE = StartupState()
+
+async def _run_component(name: str, init: Callable[[], Any]) -> Any:
+    """
+    Run one blocking initialization step in a worker thread, recording its status and duration.
+
+    The step is attempted up to `STARTUP_MAX_ATTEMPTS` times, waiting
+    `STARTUP_RETRY_BACKOFF` seconds after the first failure and twice as long after each next one.
+    """
+    STARTUP_STATE.set(name, 'initializing')
+    start_time = time.perf_counter()
+    delay = cfg.STARTUP_RETRY_BACKOFF
+    for attempt in range(1, max(cfg.STARTUP_MAX_ATTEMPTS, 1) + 1):
+        try:
+            result = await asyncio.to_thread(init)
+            break
+        except Exception as e:
+            if attempt >= cfg.STARTUP_MAX_ATTEMPTS:
+                STARTUP_STATE.set(name, 'failed', round(time.perf_counter() - start_time, 3), str(e))
+                print(f"ERROR:    Startup component '{name}' failed after {attempt} attempts: {e}")
+                raise
+            STARTUP_STATE.set(name, 'retrying', round(time.perf_counter() - start_time, 3), str(e))
+            print(f"WARNING:  Startup component '{name}' failed (attempt {attempt}), retrying in {delay:.0f}s: {e}")
+            await asyncio.sleep(delay)
+            delay *= 2
+    STARTUP_STATE.set(name, 'ready', round(time.perf_counter() - start_time, 3))
+    return result
+
+def _init_embedding_model():
+    from app.embeddings import get_embedding_service
+    return get_embedding_service()
+
+def _init_llm_client():
+    from app.llms import get_llm_client
+    return get_llm_client()
+
+def _init_tools():
+    from app.clients.tools_discovery import discover_tools
+    return discover_tools()
+
+def _init_agent_cache():
+    from app.cache import get_agent_cache
+    return get_agent_cache()
+
+async def warm_up() -> None:
+    """
+    Initialize every heavy component and build the agent.
+
+    The embedding model, the LLM client, the tools and the agent cache are
+    initialized concurrently (each import included in its timing); the agent
+    is built once all of them are ready. If a component still fails after its
+    retries, the process is stopped rather than left running without an agent.
+    """
+    try:
+        _, llm_client, tools, _ = await asyncio.gather(
+            _run_component('embedding_model', _init_embedding_model),
+            _run_component('llm_client', _init_llm_client),
+            _run_component('tools', _init_tools),
+            _run_component('agent_cache', _init_agent_cache),
+        )
+
+        def _init_agent():
+            from app.agent import init_agent
+            init_agent(llm_client, tools)
+
+        await _run_component('agent', _init_agent)
+        STARTUP_STATE.ready = True
+    except Exception as e:
+        print(f"ERROR:    Startup failed, stopping the process so it can be restarted: {e}")
+        # Graceful shutdown through the server's signal handler, as on `docker stop`
+        os.kill(os.getpid(), signal.SIGTERM)
+    finally:
+        STARTUP_STATE.finished_in = round(time.perf_counter() - STARTUP_STATE.started_at, 3)
+        breakdown = ", ".join(
+            f"{name}={state['seconds']}s ({state['status']})"
+            for name, state in STARTUP_STATE.snapshot()['components'].items()
+        )
+        print(f"INFO:     Startup finished in {STARTUP_STATE.finished_in}s: {breakdown}")
+
+async def refresh_tools_periodically() -> None:
+    """
+    Poll the registry for tool changes and swap in a rebuilt agent when they changed.
+
+    Runs until cancelled; does nothing if `TOOL_REFRESH_INTERVAL` is 0. Requests
+    already running keep the executor they started with.
+    """
+    if cfg.TOOL_REFRESH_INTERVAL <= 0:
+        return
+    from app.agent import rebuild_agent
+    from app.clients.tools_discovery import refresh_tools
+
+    while True:
+        await asyncio.sleep(cfg.TOOL_REFRESH_INTERVAL)
+        if not STARTUP_STATE.ready:
+            continue
+        try:
+            tools = await asyncio.to_thread(refresh_tools)
+            if tools is not None:
+                await asyncio.to_thread(rebuild_agent, tools)
+        except Exception as e:
+            print(f"WARNING:  Tool refresh failed, keeping the current tools: {e}")
@@ -0,0 +1,71 @@
+"""
+Token counting for the MCP Financial Agent.
+
+Prompt budgets (tool outputs, retrieved memory) are expressed in tokens. When
+`tiktoken` is installed, text is counted with the `TOKENIZER_ENCODING`
+encoding, which approximates the tokenizers of the supported chat models;
+otherwise, or if the encoding cannot be loaded, one token is estimated per
+four characters.
+"""
+import threading
+
+import app.core.config as cfg
+
+# Characters per token of the fallback estimate
+CHARS_PER_TOKEN = 4
+
+_ENCODING = None
+_ENCODING_LOADED = False
+_ENCODING_LOCK = threading.Lock()
+
+def _get_encoding():
+    """Return the tiktoken encoding, or None if tiktoken or the encoding is unavailable."""
+    global _ENCODING, _ENCODING_LOADED
+    if not _ENCODING_LOADED:
+        with _ENCODING_LOCK:
+            if not _ENCODING_LOADED:
+                try:
+                    import tiktoken
+                    _ENCODING = tiktoken.get_encoding(cfg.TOKENIZER_ENCODING)
+                except Exception as e:
+                    print(f"WARNING:  Tokenizer '{cfg.TOKENIZER_ENCODING}' unavailable, estimating tokens from length: {e}")
+                _ENCODING_LOADED = True
+    return _ENCODING
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a text.
+
+    Args:
+        text (str): The text to count
+
+    Returns:
+        int: Number of tokens, estimated from the length if no tokenizer is available
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut a text to at most `max_tokens` tokens.
+
+    Args:
+        text (str): The text to cut
+        max_tokens (int): Maximum number of tokens to keep
+
+    Returns:
+        str: The text itself if it fits, otherwise its longest prefix within the budget
+    """
+    if max_tokens <= 0:
+        return ''
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
@@ -0,0 +1 @@
+from ._service import CachedEmbeddingService, get_embedding_service, is_embedding_service_loaded
\ No newline at end of file
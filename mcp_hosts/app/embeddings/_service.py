@@ -0,0 +1,177 @@
+"""
+Shared embedding service for the MCP Financial Agent.
+
+This module provides a single process-wide embedding service used by both the
+memory retriever and the semantic agent cache. The HuggingFace model configured
+by `EMBEDDING_MODEL` is loaded once, and every embedded string is cached by the
+hash of its content in a bounded in-memory LRU, with an optional Redis tier
+shared between processes.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import redis
+from langchain_core.embeddings import Embeddings
+
+import app.core.config as cfg
+
+class CachedEmbeddingService(Embeddings):
+    """
+    LangChain-compatible embeddings with a content-hash keyed cache.
+
+    Lookups go through the in-memory LRU first, then the Redis tier if enabled;
+    only strings missing from both are sent to the model, in a single batch.
+    The service also exposes `to_embeddings` and `dimension` so it can be used
+    directly as a GPTCache embedding function.
+    """
+    def __init__(self,
+                 model_name: str,
+                 max_entries: int = 10000,
+                 redis_client: Optional[redis.Redis] = None,
+                 redis_ttl: Optional[int] = None):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        # Imported here: it pulls in torch and sentence-transformers
+        from langchain_huggingface import HuggingFaceEmbeddings
+        self._model = HuggingFaceEmbeddings(model_name=model_name)
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dimension: Optional[int] = None
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\x00{text}".encode('utf-8')).hexdigest()
+
+    def _lru_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+            return vector
+
+    def _lru_put(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def _redis_get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        if not self.redis_client or not keys:
+            return [None] * len(keys)
+        try:
+            raws = self.redis_client.mget([f'embedding:{key}' for key in keys])
+        except Exception as e:
+            print(f"WARNING:  Embedding cache Redis lookup failed: {e}")
+            return [None] * len(keys)
+        return [np.frombuffer(raw, dtype=np.float32) if raw else None for raw in raws]
+
+    def _redis_put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not self.redis_client or not items:
+            return
+        try:
+            with self.redis_client.pipeline() as pipe:
+                for key, vector in items.items():
+                    pipe.set(f'embedding:{key}', vector.tobytes(), ex=self.redis_ttl)
+                pipe.execute()
+        except Exception as e:
+            print(f"WARNING:  Embedding cache Redis update failed: {e}")
+
+    def _embed(self, texts: List[str], embed_fn: Callable[[List[str]], List[List[float]]]) -> List[np.ndarray]:
+        keys = [self._key(text) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [self._lru_get(key) for key in keys]
+        hits = sum(vector is not None for vector in vectors)
+
+        # Second tier: Redis, for everything the local LRU does not have
+        pending = [i for i, vector in enumerate(vectors) if vector is None]
+        redis_hits = 0
+        for i, vector in zip(pending, self._redis_get_many([keys[i] for i in pending])):
+            if vector is not None:
+                vectors[i] = vector
+                redis_hits += 1
+                self._lru_put(keys[i], vector)
+
+        # Embed each distinct missing string once, in one batch
+        missing: Dict[str, str] = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], texts[i])
+        if missing:
+            computed = embed_fn(list(missing.values()))
+            fresh = {key: np.asarray(vector, dtype=np.float32) for key, vector in zip(missing, computed)}
+            for key, vector in fresh.items():
+                self._lru_put(key, vector)
+            self._redis_put_many(fresh)
+            vectors = [vector if vector is not None else fresh[keys[i]] for i, vector in enumerate(vectors)]
+
+        with self._lock:
+            self.hits += hits
+            self.redis_hits += redis_hits
+            self.misses += len(missing)
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [vector.tolist() for vector in self._embed(list(texts), self._model.embed_documents)]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], self._model.embed_documents)[0].tolist()
+
+    def to_embeddings(self, data: str, **_) -> np.ndarray:
+        """GPTCache embedding function: embed one string through the shared cache."""
+        return self._embed([data], self._model.embed_documents)[0]
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the embedding vectors produced by the model."""
+        if self._dimension is None:
+            # Straight to the model: the probe must not enter the caches or the hit counters
+            self._dimension = len(self._model.embed_documents(['dimension probe'])[0])
+        return self._dimension
+
+    def stats(self) -> dict:
+        """Return cache counters and the current size of the in-memory LRU."""
+        with self._lock:
+            lookups = self.hits + self.redis_hits + self.misses
+            return {
+                'hits': self.hits,
+                'redis_hits': self.redis_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+                'size': len(self._lru),
+                'max_entries': self.max_entries,
+            }
+
+# Process-wide embedding service, created on first use
+_EMBEDDING_SERVICE: CachedEmbeddingService = None
+_EMBEDDING_SERVICE_LOCK = threading.Lock()
+
+def is_embedding_service_loaded() -> bool:
+    """Tell whether the embedding model has already been loaded."""
+    return _EMBEDDING_SERVICE is not None
+
+def get_embedding_service() -> CachedEmbeddingService:
+    """
+    Get the process-wide embedding service, loading the model on first use.
+
+    Returns:
+        CachedEmbeddingService: The shared embedding service
+    """
+    global _EMBEDDING_SERVICE
+    with _EMBEDDING_SERVICE_LOCK:
+        if _EMBEDDING_SERVICE is None:
+            redis_client = redis.from_url(cfg.REDIS_URL) if cfg.EMBEDDING_CACHE_REDIS_ENABLED else None
+            _EMBEDDING_SERVICE = CachedEmbeddingService(
+                model_name=cfg.EMBEDDING_MODEL,
+                max_entries=cfg.EMBEDDING_CACHE_MAX_ENTRIES,
+                redis_client=redis_client,
+                redis_ttl=cfg.EMBEDDING_CACHE_TTL
+            )
+            print(f"INFO:     Embedding service initialized with model '{cfg.EMBEDDING_MODEL}'.")
+    return _EMBEDDING_SERVICE
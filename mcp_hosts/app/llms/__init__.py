@@ -1,2 +1 @@
-from ._factory import get_llm_client
-llm_client = get_llm_client()
\ No newline at end of file
+from ._factory import get_llm_client
\ No newline at end of file
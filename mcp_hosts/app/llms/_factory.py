@@ -5,10 +5,18 @@ This module provides a factory pattern implementation for creating
 language model clients based on configuration. It supports multiple
 LLM providers and handles caching configuration.
 """
+import importlib
 from langchain_core.language_models.chat_models import BaseChatModel
-from . import google, openai, openrouter, ollama
 import app.core.config as cfg
 
+# Provider modules, imported only when selected so unused provider SDKs are never loaded
+_PROVIDER_MODULES = {
+    'google': 'google',
+    'openai': 'openai',
+    'openrouter': 'openrouter',
+    'ollama': 'ollama',
+}
+
 def get_llm_client() -> BaseChatModel:
     """
     Factory function to create and return an LLM client based on configuration.
@@ -29,16 +37,9 @@ def get_llm_client() -> BaseChatModel:
     Raises:
         ValueError: If the provider is not supported
     """
-    if cfg.LLM_PROVIDER == "google":
-        module_to_load = google
-    elif cfg.LLM_PROVIDER == "openai":
-        module_to_load = openai
-    elif cfg.LLM_PROVIDER == 'openrouter':
-        module_to_load = openrouter
-    elif cfg.LLM_PROVIDER == 'ollama':
-        module_to_load = ollama
-    else:
+    if cfg.LLM_PROVIDER not in _PROVIDER_MODULES:
         raise ValueError(f"Unsupported LLM provider: {cfg.LLM_PROVIDER}")
+    module_to_load = importlib.import_module(f".{_PROVIDER_MODULES[cfg.LLM_PROVIDER]}", __package__)
     
     client = module_to_load.get_model()
     return client
\ No newline at end of file
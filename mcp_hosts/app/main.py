@@ -2,17 +2,45 @@
 Main application module for the MCP Financial Agent.
 
 This module initializes the FastAPI application and sets up the API routes.
+Heavy components (embedding model, LLM client, tools, caches) are initialized
+in the background after startup, so the server accepts connections right away
+and reports readiness through `/ready`.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from app.api import health, interact
+from app.api import health, interact, stats
+from app.clients.http_pool import aclose_http_clients
+from app.core.startup import warm_up, refresh_tools_periodically
 
 from app.core.config import API_V1_BASE_ROUTE
 
+def _report_task_failure(task: asyncio.Task) -> None:
+    """Log the exception of a background task, which would otherwise be dropped silently."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"ERROR:    Background task '{task.get_name()}' failed: {task.exception()!r}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the background warm-up and tool refresh, then release pooled connections on shutdown."""
+    warm_up_task = asyncio.create_task(warm_up(), name='warm_up')
+    refresh_task = asyncio.create_task(refresh_tools_periodically(), name='refresh_tools')
+    for task in (warm_up_task, refresh_task):
+        task.add_done_callback(_report_task_failure)
+    yield
+    for task in (warm_up_task, refresh_task):
+        if not task.done():
+            task.cancel()
+    # Release the pooled connections used by tool calls
+    await aclose_http_clients()
+
 app = FastAPI(
     title='MCP Financial Agent',
     description='An AI-powered financial agent built on the Model-Context-Protocol for stock analysis',
-    version='0.0.1'
+    version='0.0.1',
+    lifespan=lifespan
 )
 
 # Include the health check endpoint for monitoring application status
@@ -20,3 +48,7 @@ app.include_router(health.router, prefix=API_V1_BASE_ROUTE, tags=['HEALTH'])
 
 # Include the main interaction endpoint for the financial agent
 app.include_router(interact.router, prefix=API_V1_BASE_ROUTE, tags=['INTERACT'])
+
+# Include the statistics endpoint exposing cache hit rates
+app.include_router(stats.router, prefix=API_V1_BASE_ROUTE, tags=['STATS'])
+
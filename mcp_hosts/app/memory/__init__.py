@@ -1 +1 @@
-from ._factory import get_chat_message_history
\ No newline at end of file
+from ._factory import get_chat_message_history, get_session_vector_index, get_session_summary_store, get_memory_stats
\ No newline at end of file
@@ -5,9 +5,17 @@ This module provides a factory pattern implementation for creating
 chat message history instances. It supports both in-memory and Redis
 backends for storing conversation history.
 """
-from langchain_community.chat_message_histories import ChatMessageHistory, RedisChatMessageHistory
+from langchain_community.chat_message_histories import ChatMessageHistory
 import app.core.config as cfg 
 from .in_memory import get_or_create as get_or_create_in_memory_chat_history
+from .in_memory import get_or_create_vector_index as get_or_create_in_memory_vector_index
+from .in_memory import get_session_store as get_in_memory_session_store
+from .redis_history import PooledRedisChatMessageHistory, get_async_redis_client, get_redis_client
+from .vector_index import SessionVectorIndex, get_redis_vector_index
+from .summary import SessionSummaryStore
+
+# Summary store of the configured backend, created on first use
+_SUMMARY_STORE: SessionSummaryStore = None
 
 def get_chat_message_history(session_id: str) -> ChatMessageHistory:
     """
@@ -18,7 +26,7 @@ def get_chat_message_history(session_id: str) -> ChatMessageHistory:
     instance for the given session ID.
     
     Supported memory types:
-    - 'redis': Persistent storage using Redis
+    - 'redis': Persistent storage using Redis, through the process-wide connection pools
     - 'in-memory': Temporary storage in application memory
     
     Args:
@@ -32,8 +40,77 @@ def get_chat_message_history(session_id: str) -> ChatMessageHistory:
     """
     memory_type = cfg.MEMORY_TYPE
     if memory_type == 'redis':
-        return RedisChatMessageHistory(session_id, url=cfg.REDIS_URL, ttl=cfg.REDIS_TTL)
+        return PooledRedisChatMessageHistory(
+            session_id, get_redis_client(), get_async_redis_client(),
+            ttl=cfg.REDIS_TTL, max_messages=cfg.MEMORY_HISTORY_LOAD_LIMIT
+        )
     elif memory_type == "in-memory":
         return get_or_create_in_memory_chat_history(session_id)
     else:
-        raise TypeError(f'Unsupported memory type: {memory_type}')
\ No newline at end of file
+        raise TypeError(f'Unsupported memory type: {memory_type}')
+
+def get_session_vector_index(session_id: str) -> SessionVectorIndex:
+    """
+    Factory function to get or create the vector index of a session's past turns.
+    
+    The index uses the same backend as the chat history (see `MEMORY_TYPE`) so
+    embeddings are stored and evicted together with the messages they describe.
+    
+    Args:
+        session_id (str): Unique identifier for the conversation session
+        
+    Returns:
+        SessionVectorIndex: The vector index for the specified session
+        
+    Raises:
+        TypeError: If the configured memory type is not supported
+    """
+    memory_type = cfg.MEMORY_TYPE
+    if memory_type == 'redis':
+        return get_redis_vector_index(session_id)
+    elif memory_type == "in-memory":
+        return get_or_create_in_memory_vector_index(session_id)
+    else:
+        raise TypeError(f'Unsupported memory type: {memory_type}')
+
+def get_session_summary_store() -> SessionSummaryStore:
+    """
+    Factory function to get the store of rolling session summaries.
+    
+    The store uses the same backend as the chat history (see `MEMORY_TYPE`),
+    since folding a summary also moves the oldest messages out of the history
+    and drops their entries from the session vector index.
+    
+    Returns:
+        SessionSummaryStore: The summary store of the configured backend
+        
+    Raises:
+        TypeError: If the configured memory type is not supported
+    """
+    global _SUMMARY_STORE
+    if _SUMMARY_STORE is None:
+        memory_type = cfg.MEMORY_TYPE
+        if memory_type == 'redis':
+            from .summary import RedisSessionSummaryStore
+            _SUMMARY_STORE = RedisSessionSummaryStore(
+                get_redis_client(), get_redis_vector_index,
+                ttl=cfg.REDIS_TTL, archive_ttl=cfg.MEMORY_ARCHIVE_TTL
+            )
+        elif memory_type == "in-memory":
+            from .summary import InMemorySessionSummaryStore
+            _SUMMARY_STORE = InMemorySessionSummaryStore(get_in_memory_session_store())
+        else:
+            raise TypeError(f'Unsupported memory type: {memory_type}')
+    return _SUMMARY_STORE
+
+def get_memory_stats() -> dict:
+    """
+    Gauges of the sessions held by this process.
+    
+    Returns:
+        dict: Sessions, messages and bytes held with the eviction counters, or None
+            for the Redis backend, whose memory is held by Redis
+    """
+    if cfg.MEMORY_TYPE == "in-memory":
+        return get_in_memory_session_store().stats()
+    return None
\ No newline at end of file
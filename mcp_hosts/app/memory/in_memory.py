@@ -1,31 +1,168 @@
 """
 In-memory chat history implementation for the MCP Financial Agent.
 
-This module provides an in-memory implementation for storing chat histories
-using a dictionary keyed by session ID. This is useful for development
-and testing but not recommended for production deployments.
+This module provides an in-memory store for chat histories keyed by session
+ID. Each session keeps its chat history, its vector index of past turns and
+its running summary together, and they are evicted together: the store holds
+at most `MEMORY_MAX_SESSIONS` sessions (least recently used first out),
+forgets sessions idle for longer than `MEMORY_SESSION_TTL` seconds, like the
+Redis TTL, and optionally caps the number of messages kept per session.
 """
-from typing import Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence
+
 from langchain_community.chat_message_histories.in_memory import ChatMessageHistory as InMemoryChatMessageHistory
+from langchain_core.messages import BaseMessage
+from pydantic import PrivateAttr
+import app.core.config as cfg
+from .vector_index import InMemorySessionVectorIndex
+
+class CappedChatMessageHistory(InMemoryChatMessageHistory):
+    """In-memory chat history calling its store back after every write, to apply the message cap."""
+    _on_add: Optional[Callable[[], None]] = PrivateAttr(default=None)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        super().add_messages(messages)
+        if self._on_add is not None:
+            self._on_add()
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.add_messages(messages)
+
+class InMemorySession:
+    """Everything stored for one session."""
+    __slots__ = ('history', 'index', 'summary', 'last_access')
+
+    def __init__(self):
+        self.history = CappedChatMessageHistory()
+        self.index = InMemorySessionVectorIndex()
+        self.summary = ''
+        self.last_access = time.monotonic()
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the session's messages, vectors and summary."""
+        size = len(self.summary.encode('utf-8'))
+        size += sum(len(str(message.content).encode('utf-8')) for message in self.history.messages)
+        size += sum(len(content.encode('utf-8')) + vector.nbytes for content, vector in self.index.entries())
+        return size
+
+class InMemorySessionStore:
+    """
+    Bounded store of in-memory sessions with LRU eviction and an idle TTL.
+
+    Args:
+        max_sessions (int): Maximum number of sessions held, 0 for no limit
+        idle_ttl (int): Seconds after the last access before a session expires, 0 to never expire
+        max_messages (int): Maximum number of messages kept per session, 0 for no limit
+    """
+    def __init__(self, max_sessions: int, idle_ttl: int, max_messages: int = 0):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_messages = max_messages
+        self._sessions: "OrderedDict[str, InMemorySession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+        self.expired = 0
+
+    def _expire(self, now: float) -> None:
+        # Sessions are ordered by last access, so the expired ones are at the front
+        while self.idle_ttl > 0 and self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_access <= self.idle_ttl:
+                break
+            del self._sessions[session_id]
+            self.expired += 1
+
+    def _cap_messages(self, session: InMemorySession) -> None:
+        # Called after every write to the history: whole turns are dropped (oldest first),
+        # together with their index entries
+        with self._lock:
+            overflow = len(session.history.messages) - self.max_messages
+            if self.max_messages > 0 and overflow > 0:
+                overflow += overflow % 2
+                del session.history.messages[:overflow]
+                session.index.drop_oldest(overflow // 2)
+
+    def get(self, session_id: str) -> InMemorySession:
+        """
+        Get a session, creating it if it does not exist, and mark it as recently used.
+
+        Args:
+            session_id (str): Unique identifier for the conversation session
 
-# In-memory storage for chat histories, keyed by session ID
-# This dictionary maintains conversation history for all active sessions
-_INMEMORY_DICT: Dict[str, InMemoryChatMessageHistory] = {}
+        Returns:
+            InMemorySession: The session's history, vector index and summary
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = InMemorySession()
+                session.history._on_add = lambda: self._cap_messages(session)
+                while self.max_sessions > 0 and len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self._sessions.move_to_end(session_id)
+            session.last_access = now
+            return session
+
+    def peek(self, session_id: str) -> Optional[InMemorySession]:
+        """Return a session if it is held, without creating it or marking it as used."""
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def stats(self) -> dict:
+        """Return gauges of the sessions, messages and bytes held, and the eviction counters."""
+        with self._lock:
+            self._expire(time.monotonic())
+            sessions = list(self._sessions.values())
+            evicted, expired = self.evicted, self.expired
+        return {
+            'sessions': len(sessions),
+            'messages': sum(len(session.history.messages) for session in sessions),
+            'bytes': sum(session.nbytes() for session in sessions),
+            'max_sessions': self.max_sessions,
+            'evicted': evicted,
+            'expired': expired,
+        }
+
+# Process-wide store of in-memory sessions
+_SESSION_STORE = InMemorySessionStore(
+    max_sessions=cfg.MEMORY_MAX_SESSIONS,
+    idle_ttl=cfg.MEMORY_SESSION_TTL,
+    max_messages=cfg.MEMORY_MAX_MESSAGES_PER_SESSION
+)
+
+def get_session_store() -> InMemorySessionStore:
+    """Get the process-wide store of in-memory sessions."""
+    return _SESSION_STORE
 
 def get_or_create(session_id: str) -> InMemoryChatMessageHistory:
     """
     Get an existing chat history for a session or create a new one if it doesn't exist.
-    
-    This function maintains an in-memory dictionary of chat histories to ensure
-    that each session gets its own persistent history throughout the application's
-    lifetime.
-    
+
+    The session is marked as recently used, so it is evicted last.
+
     Args:
         session_id (str): Unique identifier for the conversation session
-        
+
     Returns:
         InMemoryChatMessageHistory: The chat history for the specified session
     """
-    if session_id not in _INMEMORY_DICT:
-        _INMEMORY_DICT[session_id] = InMemoryChatMessageHistory()
-    return _INMEMORY_DICT[session_id]
\ No newline at end of file
+    return _SESSION_STORE.get(session_id).history
+
+def get_or_create_vector_index(session_id: str) -> InMemorySessionVectorIndex:
+    """
+    Get an existing vector index for a session or create a new one if it doesn't exist.
+
+    Args:
+        session_id (str): Unique identifier for the conversation session
+
+    Returns:
+        InMemorySessionVectorIndex: The vector index for the specified session
+    """
+    return _SESSION_STORE.get(session_id).index
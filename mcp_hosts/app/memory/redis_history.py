@@ -0,0 +1,123 @@
+"""
+Redis chat history for the MCP Financial Agent.
+
+LangChain's `RedisChatMessageHistory` creates a new Redis client (and
+connection pool) for every history object, i.e. for every request, loads the
+whole history on each turn and writes each message and the TTL refresh in
+separate round trips. This module provides a history with the same storage
+layout (a `message_store:<session_id>` list written with LPUSH, newest message
+first, each item the JSON of `message_to_dict`), so existing sessions stay
+readable, but which:
+
+- shares one process-wide connection pool, sync and async, with the other Redis memory structures
+- loads only the `MEMORY_HISTORY_LOAD_LIMIT` most recent messages with LRANGE
+- writes a whole turn and refreshes the TTL in a single pipeline
+- implements the async methods natively for the async request path
+"""
+import json
+import threading
+from typing import List, Optional, Sequence
+
+import redis
+import redis.asyncio as aredis
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+import app.core.config as cfg
+
+# Process-wide connection pools, created on first use
+_REDIS_CLIENT: redis.Redis = None
+_ASYNC_REDIS_CLIENT: aredis.Redis = None
+_REDIS_CLIENT_LOCK = threading.Lock()
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get the Redis client shared by the chat histories, vector indexes and summaries of this process.
+
+    Returns:
+        redis.Redis: Client backed by one process-wide connection pool
+    """
+    global _REDIS_CLIENT
+    with _REDIS_CLIENT_LOCK:
+        if _REDIS_CLIENT is None:
+            _REDIS_CLIENT = redis.Redis(connection_pool=redis.ConnectionPool.from_url(cfg.REDIS_URL))
+    return _REDIS_CLIENT
+
+def get_async_redis_client() -> aredis.Redis:
+    """
+    Get the async Redis client shared by the chat histories of this process.
+
+    Its connections belong to the event loop serving the requests, which is
+    the only loop using it.
+
+    Returns:
+        redis.asyncio.Redis: Client backed by one process-wide async connection pool
+    """
+    global _ASYNC_REDIS_CLIENT
+    with _REDIS_CLIENT_LOCK:
+        if _ASYNC_REDIS_CLIENT is None:
+            _ASYNC_REDIS_CLIENT = aredis.Redis(connection_pool=aredis.ConnectionPool.from_url(cfg.REDIS_URL))
+    return _ASYNC_REDIS_CLIENT
+
+class PooledRedisChatMessageHistory(BaseChatMessageHistory):
+    """
+    Chat history of one session stored in Redis, compatible with `RedisChatMessageHistory`.
+
+    Args:
+        session_id (str): Unique identifier for the conversation session
+        redis_client (redis.Redis): Shared sync client
+        async_redis_client (redis.asyncio.Redis): Shared async client
+        ttl (Optional[int]): Expiry in seconds, refreshed on every write
+        max_messages (int): Number of most recent messages loaded, 0 to load the whole history
+        key_prefix (str): Prefix of the Redis key
+    """
+    def __init__(self, session_id: str, redis_client: redis.Redis, async_redis_client: aredis.Redis,
+                 ttl: Optional[int] = None, max_messages: int = 0, key_prefix: str = 'message_store:'):
+        self.session_id = session_id
+        self.redis_client = redis_client
+        self.async_redis_client = async_redis_client
+        self.ttl = ttl
+        # Whole turns only, so the loaded history starts with a human message
+        self.max_messages = max_messages + max_messages % 2
+        self.key = f'{key_prefix}{session_id}'
+
+    def _load(self, items: List[bytes]) -> List[BaseMessage]:
+        # Stored newest first: reverse to chronological order
+        return messages_from_dict([json.loads(item.decode('utf-8')) for item in items[::-1]])
+
+    def _dump(self, messages: Sequence[BaseMessage]) -> List[str]:
+        return [json.dumps(message_to_dict(message)) for message in messages]
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """The most recent messages of the session, oldest first."""
+        return self._load(self.redis_client.lrange(self.key, 0, self.max_messages - 1))
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        return self._load(await self.async_redis_client.lrange(self.key, 0, self.max_messages - 1))
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Append messages and refresh the TTL in one round trip."""
+        if not messages:
+            return
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            # LPUSH of several values pushes them in order, the last one ending up first
+            pipe.lpush(self.key, *self._dump(messages))
+            if self.ttl:
+                pipe.expire(self.key, self.ttl)
+            pipe.execute()
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        async with self.async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.lpush(self.key, *self._dump(messages))
+            if self.ttl:
+                pipe.expire(self.key, self.ttl)
+            await pipe.execute()
+
+    def clear(self) -> None:
+        self.redis_client.delete(self.key)
+
+    async def aclear(self) -> None:
+        await self.async_redis_client.delete(self.key)
@@ -1,59 +1,162 @@
-from typing import List
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from langchain_community.vectorstores import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_core.documents import Document
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 import app.core.config as cfg
+from app.core.tokens import count_tokens, truncate_to_tokens
+from app.embeddings import get_embedding_service
+from .vector_index import RankedEntry, SessionVectorIndex
+
+CONTEXT_PREFIX = "[Context from past conversation]:\n"
+SUMMARY_PREFIX = "[Summary of earlier conversation]:\n"
+TRUNCATION_MARKER = " ... [truncated]"
+
+def format_turn_pair(human: BaseMessage, ai: BaseMessage) -> str:
+    """Nối cặp câu hỏi-trả lời lại với nhau để giữ ngữ cảnh."""
+    return f"User asked: {human.content}\nAI answered: {ai.content}"
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    norm = (np.linalg.norm(a) * np.linalg.norm(b)) or 1.0
+    return float(np.dot(a, b) / norm)
+
+def _pair_history(history: List[BaseMessage]) -> List[str]:
+    """Chuyển lịch sử chat thành danh sách các cặp Human/AI đã được nối."""
+    pairs = []
+    for i in range(0, len(history), 2):
+        if i + 1 < len(history) and isinstance(history[i], HumanMessage) and isinstance(history[i+1], AIMessage):
+            pairs.append(format_turn_pair(history[i], history[i+1]))
+    return pairs
 
 class MemoryRetriever:
     """
     Sử dụng vector search để truy xuất những phần liên quan nhất từ lịch sử chat.
-    Nó không lưu trữ trạng thái lâu dài.
+    Embedding của mỗi cặp hội thoại được lưu trong một index riêng cho từng session,
+    nên mỗi lượt chỉ cần embed cặp mới và câu hỏi hiện tại.
+    
+    Ngữ cảnh trả về bị giới hạn theo số token: lượt gần nhất luôn được giữ, các cặp quá dài
+    bị cắt bớt, các cặp gần như trùng lặp bị bỏ qua, và tổng số token không vượt quá ngân sách.
     """
-    def __init__(self, top_k: int = 5):
-        # Khởi tạo model embedding một lần duy nhất. 
-        # Model này khá nhẹ và có thể tái sử dụng.
-        self.embedding_model = HuggingFaceEmbeddings(
-            model_name=cfg.EMBEDDING_MODEL
-        )
+    def __init__(self, index_getter: Callable[[str], SessionVectorIndex], top_k: int = 5,
+                 max_tokens: Optional[int] = None, turn_max_tokens: Optional[int] = None,
+                 dedupe_similarity: Optional[float] = None,
+                 summary_getter: Optional[Callable[[str], str]] = None):
+        # Dùng chung embedding service của cả process (model chỉ được load một lần,
+        # và mỗi chuỗi chỉ được embed một lần nhờ cache theo hash nội dung)
+        self.embedding_model = get_embedding_service()
+        self.index_getter = index_getter
         self.top_k = top_k
-        print("INFO:     MemoryRetriever initialized with HuggingFace embeddings.")
+        self.max_tokens = cfg.MEMORY_CONTEXT_MAX_TOKENS if max_tokens is None else max_tokens
+        self.turn_max_tokens = cfg.MEMORY_TURN_MAX_TOKENS if turn_max_tokens is None else turn_max_tokens
+        self.dedupe_similarity = cfg.MEMORY_DEDUPE_SIMILARITY if dedupe_similarity is None else dedupe_similarity
+        # Bản tóm tắt liên tục của các lượt cũ đã bị gộp khỏi lịch sử (nếu bật rolling summary)
+        self.summary_getter = summary_getter
+        print("INFO:     MemoryRetriever initialized with the shared embedding service.")
+
+    def _index_contents(self, index: SessionVectorIndex, contents: List[str]) -> None:
+        if contents:
+            index.add(contents, self.embedding_model.embed_documents(contents))
+
+    def _fit(self, content: str, max_tokens: int) -> Tuple[str, int]:
+        """Cắt một cặp hội thoại xuống tối đa `max_tokens` token (phần câu trả lời dài bị cắt trước)."""
+        if count_tokens(content) <= max_tokens:
+            return content, count_tokens(content)
+        text = truncate_to_tokens(content, max(max_tokens - count_tokens(TRUNCATION_MARKER), 0)) + TRUNCATION_MARKER
+        return text, count_tokens(text)
+
+    def _fit_summary(self, summary_messages: List[BaseMessage]) -> Tuple[List[BaseMessage], int]:
+        """
+        Trả về bản tóm tắt và ngân sách token còn lại cho các lượt hội thoại.
+        Bản tóm tắt quá dài bị cắt bớt để luôn chừa chỗ cho lượt gần nhất
+        (tối đa `turn_max_tokens`, và không quá nửa tổng ngân sách).
+        """
+        reserved = min(self.turn_max_tokens, self.max_tokens // 2)
+        summary_tokens = sum(count_tokens(m.content) for m in summary_messages)
+        if not summary_messages or self.max_tokens - summary_tokens >= reserved:
+            return summary_messages, self.max_tokens - summary_tokens
+        summary = summary_messages[0].content[len(SUMMARY_PREFIX):]
+        text, _ = self._fit(summary, max(self.max_tokens - reserved - count_tokens(SUMMARY_PREFIX), 1))
+        fitted = [SystemMessage(content=f"{SUMMARY_PREFIX}{text}")]
+        return fitted, self.max_tokens - count_tokens(fitted[0].content)
+
+    def _assemble(self, ranked: List[RankedEntry], last_position: int, max_tokens: int) -> List[str]:
+        """
+        Chọn ngữ cảnh trong ngân sách token từ các cặp đã xếp hạng theo độ liên quan.
+        Lượt gần nhất luôn được chọn trước; kết quả được sắp theo thứ tự thời gian.
+        """
+        recent = [entry for entry in ranked if entry[0] == last_position]
+        candidates = recent + [entry for entry in ranked if entry[0] != last_position]
+
+        selected: List[Tuple[int, str, np.ndarray]] = []
+        used_tokens = 0
+        for position, content, vector in candidates:
+            if len(selected) >= self.top_k:
+                break
+            # Bỏ qua các cặp gần như trùng với một cặp đã chọn
+            if any(_cosine(vector, chosen) >= self.dedupe_similarity for _, _, chosen in selected):
+                continue
+            # Mỗi tin nhắn ngữ cảnh còn tốn thêm token cho phần tiền tố
+            remaining = max_tokens - used_tokens - count_tokens(CONTEXT_PREFIX)
+            # Lượt gần nhất luôn được giữ (bị cắt cho vừa); các cặp khác chỉ được thêm khi còn ngân sách
+            if selected and remaining <= count_tokens(TRUNCATION_MARKER):
+                break
+            text, tokens = self._fit(content, max(min(self.turn_max_tokens, remaining), 1))
+            selected.append((position, text, vector))
+            used_tokens += tokens + count_tokens(CONTEXT_PREFIX)
 
-    def retrieve(self, message: HumanMessage, history: List[BaseMessage]) -> List[BaseMessage]:
+        print(f"INFO:     Assembled {len(selected)} memory turns in {used_tokens} tokens (budget {max_tokens}).")
+        return [text for _, text, _ in sorted(selected, key=lambda entry: entry[0])]
+
+    def add_turn(self, session_id: str, human: HumanMessage, ai: AIMessage) -> None:
         """
-        Nhận vào câu hỏi hiện tại và toàn bộ lịch sử, trả về các tin nhắn liên quan nhất.
+        Embed cặp hội thoại vừa được thêm vào lịch sử và lưu vào index của session.
         """
+        try:
+            self._index_contents(self.index_getter(session_id), [format_turn_pair(human, ai)])
+        except Exception as e:
+            print(f"ERROR:    Could not index new turn for session '{session_id}': {e}")
+
+    def retrieve(self, message: HumanMessage, session_id: str, history: List[BaseMessage]) -> List[BaseMessage]:
+        """
+        Nhận vào câu hỏi hiện tại và lịch sử của session, trả về các tin nhắn liên quan nhất,
+        đứng sau bản tóm tắt các lượt cũ (nếu có).
+        """
+        summary_messages = []
+        if self.summary_getter:
+            summary = self.summary_getter(session_id)
+            if summary:
+                summary_messages = [SystemMessage(content=f"{SUMMARY_PREFIX}{summary}")]
+
         if not history:
-            return [] # Trả về list rỗng nếu không có lịch sử
-
-        # 1. Chuyển đổi lịch sử thành các 'Documents' mà vector store có thể hiểu
-        # Chúng ta sẽ nối cặp câu hỏi-trả lời lại với nhau để giữ ngữ cảnh
-        docs = []
-        for i in range(0, len(history), 2):
-            if i + 1 < len(history) and isinstance(history[i], HumanMessage) and isinstance(history[i+1], AIMessage):
-                combined_content = f"User asked: {history[i].content}\nAI answered: {history[i+1].content}"
-                docs.append(Document(page_content=combined_content))
-        
-        if not docs:
-            return []
-
-        # 2. Xây dựng một vector store Chroma tạm thời trong bộ nhớ RAM
+            return summary_messages # Chỉ còn bản tóm tắt (hoặc list rỗng) nếu không có lịch sử
+
         try:
-            vector_store = Chroma.from_documents(
-                documents=docs, 
-                embedding=self.embedding_model
-            )
+            index = self.index_getter(session_id)
+
+            # 1. Bổ sung các cặp chưa được index (ví dụ: session có từ trước khi bật index,
+            # hoặc lượt trước bị lỗi khi index). Bình thường bước này không embed gì cả.
+            # So theo nội dung chứ không theo số lượng, vì index có thể giữ các lượt nằm ngoài
+            # cửa sổ lịch sử được load: chỉ embed đúng các cặp còn thiếu, không embed lại cặp đã có.
+            pairs = _pair_history(history)
+            if len(index) < len(pairs):
+                indexed = {content for content, _ in index.entries()}
+                self._index_contents(index, [pair for pair in pairs if pair not in indexed])
+
+            # 2. Chỉ embed câu hỏi hiện tại rồi xếp hạng toàn bộ index (lượt gần nhất luôn
+            # phải có mặt, và cần thêm ứng viên để thay cho các cặp bị loại do trùng lặp)
+            print(f"DEBUG:    Searching relevant history for query: '{message.content}'")
+            query_vector = self.embedding_model.embed_query(message.content)
+            size = len(index)
+            ranked = index.search_entries(query_vector, k=size)
+
+            # 3. Ghép ngữ cảnh trong giới hạn token
+            # (bản tóm tắt cũng được tính vào ngân sách token, nhưng không được lấn phần của lượt gần nhất)
+            summary_messages, budget = self._fit_summary(summary_messages)
+            results = self._assemble(ranked, last_position=size - 1, max_tokens=budget)
         except Exception as e:
-            print(f"ERROR:    Could not create in-memory Chroma store: {e}")
-            return []
-
-        # 3. Thực hiện tìm kiếm tương đồng
-        print(f"DEBUG:    Searching relevant history for query: '{message.content}'")
-        results = vector_store.similarity_search(message.content, k=self.top_k)
-        
-        # 4. Chuyển đổi kết quả tìm kiếm trở lại thành BaseMessage
-        # (Sử dụng AIMessage hoặc một loại message tùy chỉnh để biểu thị đây là context)
-        from langchain_core.messages import SystemMessage
-        retrieved_messages = [SystemMessage(content=f"[Context from past conversation]:\n{doc.page_content}") for doc in results]
-
-        return retrieved_messages
\ No newline at end of file
+            print(f"ERROR:    Could not search session vector index: {e}")
+            return summary_messages
+
+        # 4. Chuyển đổi kết quả trở lại thành BaseMessage
+        # (Sử dụng SystemMessage để biểu thị đây là context)
+        retrieved_messages = summary_messages + [SystemMessage(content=f"{CONTEXT_PREFIX}{content}") for content in results]
+
+        return retrieved_messages
@@ -0,0 +1,221 @@
+"""
+Rolling conversation summaries for the MCP Financial Agent.
+
+Without compaction, a session's chat history and vector index grow with every
+turn, and each turn loads the whole history. Once a session exceeds
+`MEMORY_SUMMARY_MAX_TURNS` turns, its oldest turns are folded by the LLM into a
+stored running summary; their raw messages are moved from the hot history to
+an archive and their entries are dropped from the vector index, so only the
+`MEMORY_SUMMARY_KEEP_TURNS` most recent turns stay hot. The summary is given to
+the agent as context on every turn.
+
+Compaction works on the history as loaded for the turn, which may be limited
+to the `MEMORY_HISTORY_LOAD_LIMIT` most recent messages: older messages outside
+that window were never visible to the agent and are archived with the folded
+ones, so the hot history and the index always end with the same turns.
+
+Two backends are provided, mirroring the chat history backends.
+"""
+import threading
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+import redis
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage, message_to_dict
+
+import app.core.config as cfg
+from app.core.tokens import truncate_to_tokens
+
+class SessionSummaryStore(ABC):
+    """Running summaries of sessions, and the compaction of their hot history."""
+    @abstractmethod
+    def get_summary(self, session_id: str) -> str:
+        """Return the running summary of a session, or an empty string if it has none."""
+
+    @abstractmethod
+    def history_length(self, session_id: str) -> int:
+        """Return the number of messages in the session's hot history."""
+
+    @abstractmethod
+    def fold(self, session_id: str, summary: str, keep_count: int, history_length: int) -> None:
+        """
+        Store the new summary and keep only the most recent messages in the hot history.
+
+        Messages appended after the history was read are kept as well: the
+        history keeps `keep_count` messages plus those appended since it had
+        `history_length` messages. The session vector index keeps the entries
+        of the same turns.
+
+        Args:
+            session_id (str): Unique identifier for the conversation session
+            summary (str): Summary now covering the removed messages
+            keep_count (int): Number of most recent messages left in the hot history
+            history_length (int): Length of the hot history when it was read for the summary
+        """
+
+def _keep_index_turns(index, turns: int) -> None:
+    """Drop the oldest entries of a session vector index so only `turns` entries remain."""
+    index.drop_oldest(max(len(index) - turns, 0))
+
+class InMemorySessionSummaryStore(SessionSummaryStore):
+    """
+    Summaries kept in the in-memory session store, next to the chat history and
+    vector index of each session and evicted together with them.
+
+    Folded messages are discarded rather than archived, since an in-memory
+    archive would grow as much as the history it replaces.
+
+    Args:
+        session_store (InMemorySessionStore): The process-wide store of in-memory sessions
+    """
+    def __init__(self, session_store):
+        self.session_store = session_store
+        self._lock = threading.Lock()
+
+    def get_summary(self, session_id: str) -> str:
+        session = self.session_store.peek(session_id)
+        return session.summary if session else ''
+
+    def history_length(self, session_id: str) -> int:
+        session = self.session_store.peek(session_id)
+        return len(session.history.messages) if session else 0
+
+    def fold(self, session_id: str, summary: str, keep_count: int, history_length: int) -> None:
+        session = self.session_store.get(session_id)
+        with self._lock:
+            # In place: messages appended meanwhile by a concurrent turn are kept
+            messages = session.history.messages
+            keep_count += max(len(messages) - history_length, 0)
+            del messages[:max(len(messages) - keep_count, 0)]
+            session.summary = summary
+        _keep_index_turns(session.index, keep_count // 2)
+
+class RedisSessionSummaryStore(SessionSummaryStore):
+    """
+    Summaries stored in Redis next to the session's chat history.
+
+    The chat history is the `message_store:<session_id>` list written with
+    LPUSH (newest message first). Folding moves every message but the most
+    recent ones with LMOVE to the head of `message_archive:<session_id>` and
+    sets `summary:<session_id>` in one transaction; the history is watched, so
+    messages appended by a concurrent turn are counted and never lost.
+    """
+    def __init__(self, redis_client: redis.Redis, index_getter, ttl: Optional[int] = None,
+                 archive_ttl: int = 0, history_prefix: str = 'message_store:'):
+        self.redis_client = redis_client
+        self.index_getter = index_getter
+        self.ttl = ttl
+        self.archive_ttl = archive_ttl
+        self.history_prefix = history_prefix
+
+    def get_summary(self, session_id: str) -> str:
+        # Read on every turn: refresh the TTL so the summary expires together with the history
+        raw = self.redis_client.getex(f'summary:{session_id}', ex=self.ttl) if self.ttl else self.redis_client.get(f'summary:{session_id}')
+        return raw.decode('utf-8') if raw else ''
+
+    def history_length(self, session_id: str) -> int:
+        return self.redis_client.llen(f'{self.history_prefix}{session_id}')
+
+    def fold(self, session_id: str, summary: str, keep_count: int, history_length: int) -> None:
+        history_key = f'{self.history_prefix}{session_id}'
+        archive_key = f'message_archive:{session_id}'
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    pipe.watch(history_key)
+                    length = pipe.llen(history_key)
+                    keep = keep_count + max(length - history_length, 0)
+                    pipe.multi()
+                    if self.archive_ttl > 0:
+                        # The oldest messages are at the tail of the list
+                        for _ in range(max(length - keep, 0)):
+                            pipe.lmove(history_key, archive_key, 'RIGHT', 'LEFT')
+                        pipe.expire(archive_key, self.archive_ttl)
+                    elif keep > 0:
+                        pipe.ltrim(history_key, 0, keep - 1)
+                    else:
+                        pipe.delete(history_key)
+                    pipe.set(f'summary:{session_id}', summary, ex=self.ttl or None)
+                    pipe.execute()
+                    break
+                except redis.WatchError:
+                    # A turn was appended meanwhile: count it and retry
+                    continue
+        _keep_index_turns(self.index_getter(session_id), keep // 2)
+
+def _format_turns(messages: List[BaseMessage], max_tokens: int) -> str:
+    lines = []
+    for message in messages:
+        role = message_to_dict(message)['type']
+        lines.append(f"{role}: {truncate_to_tokens(str(message.content), max_tokens)}")
+    return "\n".join(lines)
+
+class ConversationSummarizer:
+    """
+    Fold the oldest turns of long sessions into their running summary.
+
+    Args:
+        llm_client (BaseChatModel): Chat model writing the summaries
+        store (SessionSummaryStore): Where summaries are stored and histories compacted
+        prompt_template (str): Template with the `summary` and `conversation` variables
+        max_turns (int): Number of turns above which a session is compacted
+        keep_turns (int): Number of most recent turns left in the hot history after compaction
+    """
+    def __init__(self, llm_client: BaseChatModel, store: SessionSummaryStore, prompt_template: str,
+                 max_turns: int, keep_turns: int):
+        # Summaries are unique per session: keep them out of the (semantic) LLM cache
+        self.llm_client = llm_client.model_copy(update={'cache': False})
+        self.store = store
+        self.prompt_template = prompt_template
+        self.max_turns = max_turns
+        self.keep_turns = min(keep_turns, max_turns)
+        self._in_progress: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_summary(self, session_id: str) -> str:
+        """Return the running summary of a session, or an empty string if it has none."""
+        try:
+            return self.store.get_summary(session_id)
+        except Exception as e:
+            print(f"WARNING:  Cannot load the summary of session '{session_id}': {e}")
+            return ''
+
+    def compact(self, session_id: str, chat_history: BaseChatMessageHistory) -> bool:
+        """
+        Fold the oldest turns of a session into its summary if it has more than `max_turns` turns.
+
+        Args:
+            session_id (str): Unique identifier for the conversation session
+            chat_history (BaseChatMessageHistory): The session's hot history, loaded as for a turn
+
+        Returns:
+            bool: True if the session was compacted
+        """
+        # Read the length first: a turn appended in between is then kept rather than lost
+        history_length = self.store.history_length(session_id)
+        messages = list(chat_history.messages)
+        turns = len(messages) // 2
+        if turns <= self.max_turns:
+            return False
+        with self._lock:
+            if session_id in self._in_progress:
+                return False
+            self._in_progress.add(session_id)
+        try:
+            message_count = (turns - self.keep_turns) * 2
+            prompt = self.prompt_template.format(
+                summary=self.get_summary(session_id) or "(chưa có)",
+                conversation=_format_turns(messages[:message_count], cfg.MEMORY_TURN_MAX_TOKENS)
+            )
+            summary = self.llm_client.invoke(prompt).content
+            self.store.fold(session_id, summary, len(messages) - message_count, history_length)
+            print(f"INFO:     Folded {message_count // 2} turns of session '{session_id}' into its summary.")
+            return True
+        except Exception as e:
+            print(f"ERROR:    Could not summarize session '{session_id}', keeping its full history: {e}")
+            return False
+        finally:
+            with self._lock:
+                self._in_progress.discard(session_id)
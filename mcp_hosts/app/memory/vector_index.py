@@ -0,0 +1,170 @@
+"""
+Per-session vector index for the MCP Financial Agent.
+
+This module stores the embeddings of past Human/AI turn pairs for each session
+so the memory retriever only has to embed newly appended turns. Two backends
+are provided, mirroring the chat history backends: an in-memory index kept
+next to the in-memory chat history and a Redis index stored next to the Redis
+chat history and expiring with the same session TTL.
+"""
+import base64
+import json
+from abc import ABC, abstractmethod
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import redis
+
+import app.core.config as cfg
+from .redis_history import get_redis_client
+
+# A stored entry: the turn pair text and its embedding vector
+IndexEntry = Tuple[str, np.ndarray]
+# A search result: the entry's position in the index, its content and its vector
+RankedEntry = Tuple[int, str, np.ndarray]
+
+class SessionVectorIndex(ABC):
+    """
+    Base class for an append-only vector index of one session's turn pairs.
+
+    Subclasses only implement storage; similarity search is shared and runs
+    as a single matrix product over the stored vectors.
+    """
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of indexed turn pairs."""
+
+    @abstractmethod
+    def add(self, contents: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Append turn pairs and their embedding vectors to the index."""
+
+    @abstractmethod
+    def entries(self) -> List[IndexEntry]:
+        """Return every indexed entry in insertion order."""
+
+    @abstractmethod
+    def drop_oldest(self, count: int) -> None:
+        """Remove the `count` oldest entries, e.g. once their turns are folded into the session summary."""
+
+    def search_entries(self, query_vector: Sequence[float], k: int) -> List[RankedEntry]:
+        """
+        Return the `k` entries most similar to the query vector, with their positions.
+
+        Args:
+            query_vector (Sequence[float]): Embedding of the current user question
+            k (int): Maximum number of entries to return
+
+        Returns:
+            List[RankedEntry]: (position, content, vector) ordered by decreasing cosine similarity
+        """
+        entries = self.entries()
+        if not entries or k <= 0:
+            return []
+
+        matrix = np.vstack([vector for _, vector in entries])
+        query = np.asarray(query_vector, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query) or 1.0)
+        scores = matrix @ query / np.where(norms == 0, 1.0, norms)
+
+        top = np.argsort(-scores)[:k]
+        return [(int(i), entries[i][0], entries[i][1]) for i in top]
+
+    def search(self, query_vector: Sequence[float], k: int) -> List[str]:
+        """
+        Return the contents of the `k` entries most similar to the query vector.
+
+        Args:
+            query_vector (Sequence[float]): Embedding of the current user question
+            k (int): Maximum number of entries to return
+
+        Returns:
+            List[str]: Entry contents ordered by decreasing cosine similarity
+        """
+        return [content for _, content, _ in self.search_entries(query_vector, k)]
+
+class InMemorySessionVectorIndex(SessionVectorIndex):
+    """Vector index kept in application memory, living as long as the in-memory chat history."""
+    def __init__(self):
+        self._contents: List[str] = []
+        self._vectors: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def add(self, contents: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        for content, vector in zip(contents, vectors):
+            self._contents.append(content)
+            self._vectors.append(np.asarray(vector, dtype=np.float32))
+
+    def entries(self) -> List[IndexEntry]:
+        return list(zip(self._contents, self._vectors))
+
+    def drop_oldest(self, count: int) -> None:
+        del self._contents[:count]
+        del self._vectors[:count]
+
+class RedisSessionVectorIndex(SessionVectorIndex):
+    """
+    Vector index stored in a Redis list next to the session's chat history.
+
+    Vectors are stored as base64-encoded float32 bytes and the key's TTL is
+    refreshed on every write, so the index is evicted together with the history.
+    At most `max_entries` entries are kept (oldest dropped first), so the index
+    stays bounded even when summaries do not compact the session.
+    """
+    def __init__(self, session_id: str, redis_client: redis.Redis,
+                 key_prefix: str = 'vector_index:', ttl: int = None, max_entries: int = 0):
+        self.redis_client = redis_client
+        self.key = f'{key_prefix}{session_id}'
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def __len__(self) -> int:
+        return self.redis_client.llen(self.key)
+
+    def add(self, contents: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        items = [
+            json.dumps({
+                'content': content,
+                'vector': base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode('ascii')
+            })
+            for content, vector in zip(contents, vectors)
+        ]
+        if not items:
+            return
+        with self.redis_client.pipeline() as pipe:
+            pipe.rpush(self.key, *items)
+            if self.max_entries > 0:
+                pipe.ltrim(self.key, -self.max_entries, -1)
+            if self.ttl:
+                pipe.expire(self.key, self.ttl)
+            pipe.execute()
+
+    def entries(self) -> List[IndexEntry]:
+        entries = []
+        for raw in self.redis_client.lrange(self.key, 0, -1):
+            item = json.loads(raw)
+            vector = np.frombuffer(base64.b64decode(item['vector']), dtype=np.float32)
+            entries.append((item['content'], vector))
+        return entries
+
+    def drop_oldest(self, count: int) -> None:
+        # Entries are appended with RPUSH, so the oldest ones are at the head of the list
+        if count > 0:
+            self.redis_client.ltrim(self.key, count, -1)
+
+def get_redis_vector_index(session_id: str) -> RedisSessionVectorIndex:
+    """
+    Get the Redis vector index for a session, using the process-wide Redis connection pool.
+
+    The index holds one entry per turn of the loaded history window
+    (`MEMORY_HISTORY_LOAD_LIMIT` messages), unbounded if the whole history is loaded.
+
+    Args:
+        session_id (str): Unique identifier for the conversation session
+
+    Returns:
+        RedisSessionVectorIndex: The vector index for the specified session
+    """
+    return RedisSessionVectorIndex(session_id, get_redis_client(), ttl=cfg.REDIS_TTL,
+                                   max_entries=(cfg.MEMORY_HISTORY_LOAD_LIMIT + 1) // 2)
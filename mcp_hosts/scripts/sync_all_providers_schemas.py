@@ -1,45 +1,102 @@
 # /scripts/sync_all_providers_schemas.py
 import os
 import requests
-import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from sync_schemas import compute_openapi_hash, generate_schema, get_api_content, read_schema_hash
+
 # Lấy các cấu hình cần thiết. Trong Docker, bạn có thể truyền chúng qua biến môi trường.
 REGISTRY_URL = os.getenv('MCP_SERVERS_REGISTRY_URL')
-SYNC_SCRIPT_PATH = Path(__file__).parent / "sync_schemas.py"
 OUTPUT_DIR = Path(__file__).parent.parent / "app" / "mcp_schemas"
+# Thời gian tối đa (giây) chờ mỗi provider sẵn sàng; các provider được chờ song song
+WAIT_TIMEOUT = int(os.getenv('SCHEMA_SYNC_WAIT_TIMEOUT', '60'))
+# Bỏ qua so sánh hash và luôn sinh lại schema
+FORCE_REGENERATE = os.getenv('SCHEMA_SYNC_FORCE', 'false').lower() in ['true', '1']
+# Chỉ giữ lại các model được tools.yaml tham chiếu (qua `schemas_name`) và các model mà chúng cần
+PRUNE_SCHEMAS = os.getenv('SCHEMA_SYNC_PRUNE', 'true').lower() in ['true', '1']
+
+def get_referenced_models(tool_specs: list[dict]) -> dict[str, list[str]]:
+    """Gom các model được tham chiếu qua `schemas_name` trong đặc tả tool, theo provider."""
+    models: dict[str, set[str]] = {}
+    for spec in tool_specs:
+        properties = spec.get('args_schema', {}).get('properties', {})
+        for details in properties.values():
+            if details.get('schemas_name'):
+                models.setdefault(spec.get('provider'), set()).add(details['schemas_name'])
+    return {provider: sorted(names) for provider, names in models.items()}
+
+def fetch_openapi(provider: dict) -> tuple[str, str | None, float]:
+    """Lấy nội dung openapi.json của một provider, trả về (tên, nội dung, thời gian lấy)."""
+    start_time = time.perf_counter()
+    api_content = get_api_content(f"{provider['base_url']}/openapi.json", WAIT_TIMEOUT)
+    return provider['name'], api_content, time.perf_counter() - start_time
+
+def sync_provider(name: str, api_content: str, models: list[str] | None) -> tuple[str, float]:
+    """
+    Sinh lại schema của một provider nếu đặc tả OpenAPI (hoặc danh sách model cần giữ) đã thay đổi.
+    Trả về (trạng thái, thời gian sinh schema).
+    """
+    output_file = OUTPUT_DIR / f"{name}.py"
+    if not FORCE_REGENERATE and read_schema_hash(output_file) == compute_openapi_hash(api_content, models):
+        return "unchanged", 0.0
+
+    start_time = time.perf_counter()
+    generate_schema(api_content, output_file, models)
+    return "regenerated", time.perf_counter() - start_time
 
 def main():
     print(f"Bắt đầu đồng bộ schema từ Registry: {REGISTRY_URL}")
+    total_start_time = time.perf_counter()
     try:
         # Lấy danh sách providers
         providers_response = requests.get(f"{REGISTRY_URL}/providers")
         providers_response.raise_for_status()
         providers = providers_response.json()
-        
+
         print(f"Tìm thấy {len(providers)} provider: {[p['name'] for p in providers]}")
 
-        # Đồng bộ cho mỗi provider
-        for provider in providers:
-            name = provider['name']
-            base_url = provider['base_url']
-            openapi_url = f"{base_url}/openapi.json"
-            output_file = OUTPUT_DIR / f"{name}.py"
-            
-            print(f"--- Đang đồng bộ cho provider '{name}' ---")
-            command = [
-                "python", str(SYNC_SCRIPT_PATH),
-                "--url", openapi_url,
-                "--output", str(output_file)
-            ]
-            subprocess.run(command, check=True)
-            
-        print("✅ Đồng bộ tất cả schema thành công!")
-        
+        referenced_models = None
+        if PRUNE_SCHEMAS:
+            # Cùng bộ lọc tool với host, để chỉ giữ model của các tool thực sự được dùng
+            tool_filters = {
+                key: os.getenv(env_name)
+                for key, env_name in [('provider', 'TOOL_FILTER_PROVIDERS'), ('name', 'TOOL_FILTER_NAMES'), ('tag', 'TOOL_FILTER_TAGS')]
+                if os.getenv(env_name)
+            }
+            tools_response = requests.get(f"{REGISTRY_URL}/tools", params=tool_filters)
+            tools_response.raise_for_status()
+            referenced_models = get_referenced_models(tools_response.json())
+
+        # Lấy openapi.json của tất cả provider song song
+        with ThreadPoolExecutor(max_workers=max(1, len(providers))) as pool:
+            fetched = list(pool.map(fetch_openapi, providers))
+
+        # Sinh schema ngay trong process (tuần tự) cho các provider có thay đổi
+        failed = []
+        for name, api_content, fetch_elapsed in fetched:
+            if not api_content:
+                print(f"❌ [{name}] Không lấy được openapi.json (fetch {fetch_elapsed:.2f}s)", file=sys.stderr)
+                failed.append(name)
+                continue
+            try:
+                models = referenced_models.get(name, []) if referenced_models is not None else None
+                status, generate_elapsed = sync_provider(name, api_content, models)
+                print(f"--- [{name}] {status} (fetch {fetch_elapsed:.2f}s, generate {generate_elapsed:.2f}s)")
+            except Exception as e:
+                print(f"❌ [{name}] Lỗi khi tạo schema: {e}", file=sys.stderr)
+                failed.append(name)
+
+        if failed:
+            raise RuntimeError(f"Không thể đồng bộ schema cho provider: {failed}")
+
+        print(f"✅ Đồng bộ tất cả schema thành công trong {time.perf_counter() - total_start_time:.2f}s!")
+
     except Exception as e:
         print(f"❌ Lỗi trong quá trình đồng bộ: {e}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,11 @@
 import argparse
+import ast
+import hashlib
 import sys
 import time
+from collections import deque
 from pathlib import Path
+from typing import Iterable
 import requests
 from datamodel_code_generator import DataModelType, PythonVersion, generate, InputFileType
 
@@ -20,6 +24,12 @@ def parse_args():
         required=True,
         help="Đường dẫn đến file Python đầu ra cho các schema.",
     )
+    parser.add_argument(
+        "--models",
+        nargs="*",
+        default=None,
+        help="Chỉ giữ lại các model này và các model mà chúng tham chiếu tới (mặc định: giữ tất cả).",
+    )
     parser.add_argument(
         "--wait-timeout",
         type=int,
@@ -48,6 +58,126 @@ def get_api_content(url: str, timeout: int) -> str | None:
     print(f"❌ Không thể kết nối tới API sau {timeout} giây.", file=sys.stderr)
     return None
 
+# Dòng header lưu hash của đặc tả OpenAPI đã dùng để sinh file schema
+HASH_HEADER_PREFIX = "# openapi-sha256: "
+
+def compute_openapi_hash(api_content: str, models: Iterable[str] | None = None) -> str:
+    """
+    Tính hash SHA-256 của nội dung đặc tả OpenAPI, kèm danh sách model được giữ lại
+    (nếu có) để file được sinh lại khi tools.yaml tham chiếu tới model khác.
+    """
+    content = api_content if models is None else f"{api_content}\n{','.join(sorted(set(models)))}"
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def read_schema_hash(output_path: Path) -> str | None:
+    """
+    Đọc hash OpenAPI được lưu ở header của file schema đã sinh.
+    Trả về None nếu file chưa tồn tại hoặc không có header.
+    """
+    try:
+        with open(output_path, "r", encoding="utf-8") as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+    if first_line.startswith(HASH_HEADER_PREFIX):
+        return first_line[len(HASH_HEADER_PREFIX):]
+    return None
+
+def _defined_names(node: ast.stmt) -> list[str]:
+    """Tên được định nghĩa bởi một câu lệnh top-level (class hoặc phép gán alias)."""
+    if isinstance(node, ast.ClassDef):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        return [t.id for t in node.targets if isinstance(t, ast.Name)]
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return []
+
+def _referenced_names(node: ast.AST) -> set[str]:
+    """Các tên được tham chiếu trong một câu lệnh, kể cả forward reference dạng chuỗi."""
+    names = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            names.add(child.id)
+        elif isinstance(child, ast.Constant) and isinstance(child.value, str) and child.value.isidentifier():
+            names.add(child.value)
+    return names
+
+def prune_schema_source(source: str, models: Iterable[str]) -> str:
+    """
+    Chỉ giữ lại trong module đã sinh các model trong `models` và những model
+    mà chúng tham chiếu tới (trực tiếp hoặc gián tiếp). Các import được giữ nguyên.
+    """
+    tree = ast.parse(source)
+    definitions: dict[str, ast.stmt] = {}
+    for node in tree.body:
+        for name in _defined_names(node):
+            definitions[name] = node
+
+    missing = [name for name in models if name not in definitions]
+    if missing:
+        print(f"⚠️ Không tìm thấy model trong schema đã sinh: {missing}", file=sys.stderr)
+
+    # Duyệt đồ thị tham chiếu bắt đầu từ các model được yêu cầu
+    reachable: set[str] = set()
+    queue = deque(name for name in models if name in definitions)
+    while queue:
+        name = queue.popleft()
+        if name in reachable:
+            continue
+        reachable.add(name)
+        queue.extend(n for n in _referenced_names(definitions[name]) if n in definitions and n not in reachable)
+
+    kept_nodes = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            kept_nodes.append(node)
+        elif _defined_names(node):
+            if any(name in reachable for name in _defined_names(node)):
+                kept_nodes.append(node)
+        # Các lời gọi như `Model.model_rebuild()` chỉ giữ lại nếu model còn tồn tại
+        elif _referenced_names(node) & set(definitions) <= reachable:
+            kept_nodes.append(node)
+
+    # Giữ nguyên định dạng gốc (docstring của field, comment) bằng cách cắt theo số dòng
+    lines = source.splitlines(keepends=True)
+
+    def _source_of(node: ast.stmt) -> str:
+        start = node.lineno - 1
+        if getattr(node, "decorator_list", None):
+            start = min(d.lineno for d in node.decorator_list) - 1
+        return "".join(lines[start:node.end_lineno])
+
+    leading_comments = "".join(lines[:tree.body[0].lineno - 1]) if tree.body else "#"
+    imports = "".join(_source_of(n) for n in kept_nodes if isinstance(n, (ast.Import, ast.ImportFrom)))
+    body = "\n\n".join(_source_of(n) for n in kept_nodes if not isinstance(n, (ast.Import, ast.ImportFrom)))
+    return (
+        f"{leading_comments.rstrip()}\n#   pruned to models reachable from: {', '.join(sorted(set(models)))}\n\n"
+        f"{imports}\n\n{body}"
+    )
+
+def generate_schema(api_content: str, output_path: Path, models: Iterable[str] | None = None) -> None:
+    """
+    Sinh Pydantic models từ nội dung OpenAPI vào `output_path`, kèm header chứa hash của nội dung.
+    Nếu có `models`, module được thu gọn chỉ còn các model đó và các model mà chúng cần.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Truyền trực tiếp nội dung chuỗi (string) và chỉ định rõ loại input là OpenAPI.
+    generate(
+        input_=api_content,
+        input_file_type=InputFileType.OpenAPI,
+        output=output_path,
+        output_model_type=DataModelType.PydanticV2BaseModel,
+        target_python_version=PythonVersion.PY_311,
+        keep_model_order=True,
+        use_field_description=True,
+        field_constraints=True,
+    )
+    generated = output_path.read_text(encoding="utf-8")
+    if models is not None:
+        generated = prune_schema_source(generated, models)
+    output_path.write_text(f"{HASH_HEADER_PREFIX}{compute_openapi_hash(api_content, models)}\n{generated}", encoding="utf-8")
+
 def main():
     """Hàm thực thi chính của script."""
     args = parse_args()
@@ -64,19 +194,7 @@ def main():
     try:
         print(f"Đang tạo Pydantic models từ nội dung của '{args.url}'...")
         
-        # --- THAY ĐỔI QUAN TRỌNG ---
-        # Thay vì truyền URL, chúng ta truyền trực tiếp nội dung chuỗi (string)
-        # và chỉ định rõ loại input là OpenAPI.
-        generate(
-            input_=api_content,
-            input_file_type=InputFileType.OpenAPI,
-            output=output_path,
-            output_model_type=DataModelType.PydanticV2BaseModel,
-            target_python_version=PythonVersion.PY_311,
-            keep_model_order=True,
-            use_field_description=True,
-            field_constraints=True,
-        )
+        generate_schema(api_content, output_path, args.models)
         
         print(f"✅ Đã tạo thành công schema tại: '{output_path}'")
     except Exception as e:
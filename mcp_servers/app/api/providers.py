@@ -3,33 +3,39 @@ Providers API endpoint for the MCP Servers.
 
 This module defines the endpoint for providing provider configurations to agent hosts.
 """
-from typing import Any, Dict, List
-from fastapi import APIRouter, HTTPException
-from app.dependencies import get_providers as get_providers_dp
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.core.http import snapshot_response
+from app.dependencies import get_providers_snapshot
 
 router = APIRouter()
 
 @router.get("/providers", 
          summary="Get All Provider Configurations",
-         response_model=List[Dict[str, str]])
-def get_providers():
+         response_class=Response,
+         responses={200: {'content': {'application/json': {}}}, 304: {'description': 'Not Modified'}})
+def get_providers(request: Request):
     """
     Provide a list of all available provider configurations.
     
     Agent hosts will call this endpoint when starting up to discover capabilities.
+    The pre-serialized body is served with an `ETag`; a request whose
+    `If-None-Match` matches it gets an empty `304 Not Modified`.
+    
+    Args:
+        request (Request): The incoming request, checked for `If-None-Match`
     
     Returns:
-        List[Dict[str, str]]: List of provider configurations
+        Response: JSON list of provider configurations, or 304 if unchanged
         
     Raises:
         HTTPException: If provider configurations are unavailable or invalid
     """
-    providers = get_providers_dp()
+    snapshot = get_providers_snapshot()
     
-    if not providers:
+    if snapshot is None:
         raise HTTPException(
             status_code=503, 
             detail="Provider configurations are currently unavailable or invalid."
         )
         
-    return providers
\ No newline at end of file
+    return snapshot_response(request, snapshot)
\ No newline at end of file
@@ -1,35 +1,90 @@
 """
 Tools API endpoint for the MCP Servers.
 
-This module defines the endpoint for providing tool specifications to agent hosts.
+This module defines the endpoints for providing tool specifications to agent hosts,
+either all of them, a filtered subset or a single tool by name.
 """
-from typing import Any, Dict, List
-from fastapi import APIRouter, HTTPException
-from app.dependencies import get_tools as get_tools_dp
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from app.core.http import snapshot_response
+from app.dependencies import get_tools_snapshot
 
 router = APIRouter()
 
+def _split(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Flatten repeated and comma-separated query values."""
+    if not values:
+        return None
+    return [value.strip() for item in values for value in item.split(',') if value.strip()]
+
 @router.get("/tools", 
          summary="Get All Tool Specifications",
-         response_model=List[Dict[str, Any]])
-def get_tools():
+         response_class=Response,
+         responses={200: {'content': {'application/json': {}}}, 304: {'description': 'Not Modified'}})
+def get_tools(request: Request,
+              provider: Optional[List[str]] = Query(None, description="Only tools of these providers"),
+              name: Optional[List[str]] = Query(None, description="Only tools with these names"),
+              tag: Optional[List[str]] = Query(None, description="Only tools having any of these tags")):
     """
-    Provide a list of all available tool specifications.
+    Provide a list of all available tool specifications, optionally filtered.
     
     Agent hosts will call this endpoint when starting up to discover capabilities.
+    Filters may be repeated or comma-separated (e.g. `?provider=yf&tag=price,news`);
+    a tool must match every given filter. They are answered from the index built
+    when the specifications were loaded. The pre-serialized body is served with an
+    `ETag`; a request whose `If-None-Match` matches it gets an empty `304 Not Modified`.
+    
+    Args:
+        request (Request): The incoming request, checked for `If-None-Match`
+        provider (Optional[List[str]]): Provider names to keep
+        name (Optional[List[str]]): Tool names to keep
+        tag (Optional[List[str]]): Tags to keep
     
     Returns:
-        List[Dict[str, Any]]: List of tool specifications
+        Response: JSON list of tool specifications, or 304 if unchanged
         
     Raises:
         HTTPException: If tool configurations are unavailable or invalid
     """
-    tools = get_tools_dp()
+    snapshot = get_tools_snapshot()
+    
+    if snapshot is None:
+        raise HTTPException(
+            status_code=503, 
+            detail="Tool configurations are currently unavailable or invalid."
+        )
+        
+    if not (provider or name or tag):
+        return snapshot_response(request, snapshot)
+    positions = snapshot.index.select(names=_split(name), providers=_split(provider), tags=_split(tag))
+    return snapshot_response(request, snapshot, body=snapshot.index.join(positions))
+
+@router.get("/tools/{name}",
+         summary="Get One Tool Specification",
+         response_class=Response,
+         responses={200: {'content': {'application/json': {}}}, 304: {'description': 'Not Modified'}, 404: {'description': 'Unknown tool'}})
+def get_tool(request: Request, name: str):
+    """
+    Provide the specification of a single tool.
+    
+    Args:
+        request (Request): The incoming request, checked for `If-None-Match`
+        name (str): Name of the tool
+    
+    Returns:
+        Response: JSON tool specification, or 304 if unchanged
+        
+    Raises:
+        HTTPException: If tool configurations are unavailable or the tool does not exist
+    """
+    snapshot = get_tools_snapshot()
     
-    if not tools:
+    if snapshot is None:
         raise HTTPException(
             status_code=503, 
             detail="Tool configurations are currently unavailable or invalid."
         )
+    if name not in snapshot.index.by_name:
+        raise HTTPException(status_code=404, detail=f"Tool '{name}' not found.")
         
-    return tools
\ No newline at end of file
+    return snapshot_response(request, snapshot, body=snapshot.index.item_bodies[snapshot.index.by_name[name]])
\ No newline at end of file
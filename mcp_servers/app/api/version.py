@@ -0,0 +1,28 @@
+"""
+Version API endpoint for the MCP Servers.
+
+This module exposes the version of the specification snapshots currently served,
+so operators and agent hosts can tell which edit of the spec files is live.
+"""
+from fastapi import APIRouter
+from app.dependencies import get_providers_snapshot, get_tools_snapshot
+
+router = APIRouter()
+
+def _describe(snapshot) -> dict:
+    if snapshot is None:
+        return {'version': None, 'etag': None, 'loaded_at': None, 'count': 0}
+    return {'version': snapshot.version, 'etag': snapshot.etag, 'loaded_at': snapshot.loaded_at, 'count': len(snapshot.data)}
+
+@router.get('/version', status_code=200)
+def get_version():
+    """
+    Specification version endpoint.
+    
+    Returns:
+        dict: Version number, ETag, load time and entry count of the tools and providers snapshots
+    """
+    return {
+        'tools': _describe(get_tools_snapshot()),
+        'providers': _describe(get_providers_snapshot()),
+    }
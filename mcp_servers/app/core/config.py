@@ -16,3 +16,9 @@ API_V1_BASE_ROUTE = os.getenv('API_V1_BASE_ROUTE', '/api/v1')
 # Configuration file paths
 TOOLS_FILE = os.getenv('TOOLS_FILE', 'spec/tools.yaml')
 PROVIDERS_FILE = os.getenv("PROVIDERS_FILE", 'spec/providers.yaml')
+
+# Seconds hosts may reuse their copy of the specifications before revalidating with If-None-Match
+SPEC_CACHE_MAX_AGE = int(os.getenv('SPEC_CACHE_MAX_AGE', '0'))
+
+# Seconds between two checks of the specification files for changes (0 disables hot reloading)
+SPEC_WATCH_INTERVAL = float(os.getenv('SPEC_WATCH_INTERVAL', '2'))
\ No newline at end of file
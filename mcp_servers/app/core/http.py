@@ -0,0 +1,44 @@
+"""
+HTTP helpers for the MCP Servers.
+
+This module builds responses for specification snapshots with validators, so
+agent hosts polling the registry receive a `304 Not Modified` with no body when
+their copy is still current.
+"""
+from typing import Optional
+
+from fastapi import Request, Response
+
+import app.core.config as cfg
+from app.core.snapshot import SpecSnapshot, compute_etag
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Tell whether an `If-None-Match` header matches the ETag (weak comparison, as for GET)."""
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [candidate.strip() for candidate in if_none_match.split(',')]
+    return any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+def snapshot_response(request: Request, snapshot: SpecSnapshot, body: Optional[bytes] = None) -> Response:
+    """
+    Serve a specification snapshot, or a subset of it, honouring `If-None-Match`.
+
+    Args:
+        request (Request): The incoming request
+        snapshot (SpecSnapshot): The snapshot to serve
+        body (Optional[bytes]): Pre-serialized subset of the snapshot; the whole snapshot if None
+
+    Returns:
+        Response: 304 if the client's copy is current, otherwise the pre-serialized JSON body
+    """
+    etag = snapshot.etag if body is None else compute_etag(body)
+    body = snapshot.body if body is None else body
+    headers = {
+        'ETag': etag,
+        'Cache-Control': f'max-age={cfg.SPEC_CACHE_MAX_AGE}, must-revalidate',
+        'X-Spec-Version': str(snapshot.version),
+    }
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
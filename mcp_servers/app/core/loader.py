@@ -2,31 +2,38 @@
 YAML loader module for the MCP Servers.
 
 This module provides functionality to safely load and parse YAML configuration files.
-It handles error cases such as missing files or invalid YAML format.
+It reports error cases such as missing files or invalid YAML format with a
+`SpecLoadError`, so callers can keep serving the last valid configuration.
 """
 from typing import List, Dict, Any
 import yaml
 
+class SpecLoadError(Exception):
+    """Raised when a specification file cannot be read, parsed or validated."""
+
 def load_yaml_file(file_path: str) -> List[Dict[str, Any]]:
     """
     Safely load and parse a YAML file.
     
     This function attempts to load a YAML file and returns its contents as a list of dictionaries.
-    It handles common error cases such as missing files or invalid YAML format.
     
     Args:
         file_path (str): Path to the YAML file to load
         
     Returns:
-        List[Dict[str, Any]]: Parsed YAML content as a list of dictionaries, 
-                             or a list containing an empty dictionary if an error occurs
+        List[Dict[str, Any]]: Parsed YAML content as a list of dictionaries
+        
+    Raises:
+        SpecLoadError: If the file is missing, is not valid YAML or is not a list of mappings
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        print(f"ERROR: Configuration file not found at {file_path}")
-        return [{}]
+            content = yaml.safe_load(f)
+    except FileNotFoundError as e:
+        raise SpecLoadError(f"Configuration file not found at {file_path}") from e
     except yaml.YAMLError as e:
-        print(f"ERROR: Invalid YAML format in {file_path}: {e}")
-        return [{}]
\ No newline at end of file
+        raise SpecLoadError(f"Invalid YAML format in {file_path}: {e}") from e
+
+    if not isinstance(content, list) or not all(isinstance(item, dict) for item in content):
+        raise SpecLoadError(f"Configuration file {file_path} must contain a list of mappings")
+    return content
\ No newline at end of file
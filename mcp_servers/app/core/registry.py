@@ -0,0 +1,174 @@
+"""
+Hot-reloading specification registry for the MCP Servers.
+
+Each specification file is held as an immutable, versioned snapshot. A
+background watcher polls the files and, when one changes, loads and validates
+it and atomically swaps in a new snapshot with the next version number. If the
+new content is invalid, the error is logged and the previous snapshot keeps
+being served, so a bad edit never takes the registry down.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.loader import SpecLoadError, load_yaml_file
+from app.core.snapshot import SpecSnapshot, build_snapshot
+
+def _require_fields(items: List[Dict[str, Any]], fields: Tuple[str, ...], kind: str) -> None:
+    names = set()
+    for index, item in enumerate(items):
+        missing = [field for field in fields if not item.get(field)]
+        if missing:
+            raise SpecLoadError(f"{kind} #{index} is missing required fields: {missing}")
+        if item['name'] in names:
+            raise SpecLoadError(f"Duplicate {kind} name '{item['name']}'")
+        names.add(item['name'])
+
+def _validate_output_projection(tool: Dict[str, Any]) -> None:
+    projection = tool.get('output_projection')
+    if projection is None:
+        return
+    if not isinstance(projection, dict):
+        raise SpecLoadError(f"Tool '{tool['name']}' has an invalid output_projection, expected a mapping")
+    unknown = set(projection) - {'fields', 'exclude_fields', 'max_list_items', 'float_digits', 'max_tokens'}
+    if unknown:
+        raise SpecLoadError(f"Tool '{tool['name']}' has unknown output_projection keys: {sorted(unknown)}")
+    for key in ('fields', 'exclude_fields'):
+        paths = projection.get(key, [])
+        if not isinstance(paths, list) or not all(isinstance(path, str) and path for path in paths):
+            raise SpecLoadError(f"Tool '{tool['name']}' has invalid output_projection.{key}, expected a list of dotted paths")
+    for key in ('max_list_items', 'float_digits', 'max_tokens'):
+        value = projection.get(key)
+        if value is not None and (not isinstance(value, int) or value < 0 or (key != 'float_digits' and value == 0)):
+            raise SpecLoadError(f"Tool '{tool['name']}' has an invalid output_projection.{key}: {value}")
+
+def validate_tools(tools: List[Dict[str, Any]]) -> None:
+    """
+    Check tool specifications before they are served.
+
+    Raises:
+        SpecLoadError: If the list is empty, a tool lacks a required field or names are duplicated
+    """
+    if not tools:
+        raise SpecLoadError("No tool specifications defined")
+    _require_fields(tools, ('name', 'provider', 'description', 'endpoint', 'method'), 'tool')
+    for tool in tools:
+        if not isinstance(tool.get('args_schema', {}), dict):
+            raise SpecLoadError(f"Tool '{tool['name']}' has an invalid args_schema")
+        tags = tool.get('tags', [])
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise SpecLoadError(f"Tool '{tool['name']}' has invalid tags, expected a list of strings")
+        ttl = tool.get('cache_ttl_seconds')
+        if ttl is not None and (not isinstance(ttl, int) or ttl < 0):
+            raise SpecLoadError(f"Tool '{tool['name']}' has an invalid cache_ttl_seconds: {ttl}")
+        _validate_output_projection(tool)
+
+def validate_providers(providers: List[Dict[str, Any]]) -> None:
+    """
+    Check provider configurations before they are served.
+
+    Raises:
+        SpecLoadError: If the list is empty, a provider lacks a required field or names are duplicated
+    """
+    if not providers:
+        raise SpecLoadError("No provider configurations defined")
+    _require_fields(providers, ('name', 'base_url'), 'provider')
+    for provider in providers:
+        if not isinstance(provider.get('http', {}), dict):
+            raise SpecLoadError(f"Provider '{provider['name']}' has an invalid http section")
+
+class SpecRegistry:
+    """
+    Versioned snapshots of one specification file.
+
+    Args:
+        file_path (str): Path to the YAML file
+        validator (Callable[[List[Dict[str, Any]]], None]): Raises `SpecLoadError` on invalid content
+    """
+    def __init__(self, file_path: str, validator: Callable[[List[Dict[str, Any]]], None]):
+        self.file_path = file_path
+        self.validator = validator
+        self._snapshot: Optional[SpecSnapshot] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    @property
+    def snapshot(self) -> Optional[SpecSnapshot]:
+        """The current snapshot, loading the file on first access; None if it never loaded successfully."""
+        if self._snapshot is None:
+            self.reload()
+        return self._snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Load the file if it changed since the last check and swap in a new snapshot.
+
+        Args:
+            force (bool): Load even if the file's modification time and size are unchanged
+
+        Returns:
+            bool: True if a new snapshot was published
+        """
+        with self._lock:
+            signature = self._signature()
+            if not force and signature == self._file_signature:
+                return False
+            self._file_signature = signature
+            try:
+                data = load_yaml_file(self.file_path)
+                self.validator(data)
+            except SpecLoadError as e:
+                version = self._snapshot.version if self._snapshot else None
+                print(f"ERROR:    Cannot load {self.file_path}, keeping snapshot version {version}: {e}")
+                return False
+
+            current = self._snapshot
+            candidate = build_snapshot(data, version=current.version + 1 if current else 1)
+            if current is not None and candidate.etag == current.etag:
+                return False
+            # Readers take a reference to the snapshot, so assigning a new one is an atomic swap
+            self._snapshot = candidate
+            print(f"INFO:     Loaded {self.file_path} as snapshot version {candidate.version} ({len(data)} entries).")
+            return True
+
+class SpecWatcher:
+    """
+    Background thread polling specification files for changes.
+
+    Args:
+        registries (List[SpecRegistry]): Registries to reload
+        interval (float): Seconds between two polls
+    """
+    def __init__(self, registries: List[SpecRegistry], interval: float):
+        self.registries = registries
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for registry in self.registries:
+                try:
+                    registry.reload()
+                except Exception as e:
+                    print(f"ERROR:    Spec watcher failed for {registry.file_path}: {e}")
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='spec-watcher', daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
@@ -0,0 +1,111 @@
+"""
+Serialized specification snapshots for the MCP Servers.
+
+A snapshot holds the parsed content of a specification file together with its
+pre-serialized JSON body and an ETag derived from that body, so endpoints can
+serve the same bytes on every request and answer conditional requests without
+serializing or validating the specifications again. Each entry is also
+serialized on its own and indexed by name, provider and tag, so filtered
+queries are answered by joining pre-serialized entries.
+"""
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+def compute_etag(body: bytes) -> str:
+    """Return the strong ETag (quoted SHA-256) of a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+@dataclass(frozen=True)
+class SpecIndex:
+    """
+    Lookup tables over the entries of a snapshot, built once when it is loaded.
+
+    Attributes:
+        item_bodies (Tuple[bytes, ...]): JSON serialization of each entry, in file order
+        by_name (Dict[str, int]): Entry position by `name`
+        by_provider (Dict[str, Tuple[int, ...]]): Entry positions by `provider`
+        by_tag (Dict[str, Tuple[int, ...]]): Entry positions by each value of `tags`
+    """
+    item_bodies: Tuple[bytes, ...] = ()
+    by_name: Dict[str, int] = field(default_factory=dict)
+    by_provider: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+    by_tag: Dict[str, Tuple[int, ...]] = field(default_factory=dict)
+
+    def select(self,
+               names: Optional[Iterable[str]] = None,
+               providers: Optional[Iterable[str]] = None,
+               tags: Optional[Iterable[str]] = None) -> List[int]:
+        """
+        Return the positions of the entries matching every given filter, in file order.
+
+        Within one filter any value may match (e.g. any of the tags); filters left
+        empty are not applied.
+        """
+        selected = set(range(len(self.item_bodies)))
+        if names:
+            selected &= {self.by_name[name] for name in names if name in self.by_name}
+        if providers:
+            selected &= {i for provider in providers for i in self.by_provider.get(provider, ())}
+        if tags:
+            selected &= {i for tag in tags for i in self.by_tag.get(tag, ())}
+        return sorted(selected)
+
+    def join(self, positions: Iterable[int]) -> bytes:
+        """Serialize the selected entries as a JSON list."""
+        return b'[' + b','.join(self.item_bodies[i] for i in positions) + b']'
+
+def build_index(data: List[Dict[str, Any]]) -> SpecIndex:
+    """Serialize each entry and index them by name, provider and tag."""
+    by_provider: Dict[str, List[int]] = {}
+    by_tag: Dict[str, List[int]] = {}
+    for i, item in enumerate(data):
+        if item.get('provider'):
+            by_provider.setdefault(item['provider'], []).append(i)
+        for tag in item.get('tags') or []:
+            by_tag.setdefault(tag, []).append(i)
+    return SpecIndex(
+        item_bodies=tuple(json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8') for item in data),
+        by_name={item['name']: i for i, item in enumerate(data) if item.get('name')},
+        by_provider={k: tuple(v) for k, v in by_provider.items()},
+        by_tag={k: tuple(v) for k, v in by_tag.items()},
+    )
+
+@dataclass(frozen=True)
+class SpecSnapshot:
+    """
+    Immutable view of one loaded specification file.
+
+    Attributes:
+        data (List[Dict[str, Any]]): Parsed specifications
+        body (bytes): JSON serialization of `data`, served as is
+        etag (str): Strong ETag (quoted content hash of `body`)
+        version (int): Incremented each time a changed file is loaded, starting at 1
+        loaded_at (float): UNIX time the snapshot was loaded
+        index (SpecIndex): Per-entry bodies and lookup tables for filtered queries
+    """
+    data: List[Dict[str, Any]]
+    body: bytes
+    etag: str
+    version: int = 1
+    loaded_at: float = 0.0
+    index: SpecIndex = field(default_factory=SpecIndex)
+
+def build_snapshot(data: List[Dict[str, Any]], version: int = 1) -> SpecSnapshot:
+    """
+    Serialize specifications and compute their ETag.
+
+    Args:
+        data (List[Dict[str, Any]]): Parsed specifications
+        version (int): Version number of the snapshot
+
+    Returns:
+        SpecSnapshot: The snapshot of `data`
+    """
+    index = build_index(data)
+    # Same bytes as serializing the whole list at once
+    body = index.join(range(len(data)))
+    return SpecSnapshot(data=data, body=body, etag=compute_etag(body), version=version,
+                        loaded_at=time.time(), index=index)
@@ -2,44 +2,74 @@
 Dependency management module for the MCP Servers.
 
 This module handles the loading and caching of configuration data such as
-tools and providers. It ensures that configuration files are only loaded once
-and reused across the application.
+tools and providers. Each configuration file is served from a versioned
+snapshot which is swapped atomically when the file changes on disk, so spec
+edits take effect without restarting the server.
 """
-from typing import Any, Dict, List
+from typing import Optional
 import app.core.config as cfg
-from app.core.loader import load_yaml_file
+from app.core.registry import SpecRegistry, SpecWatcher, validate_providers, validate_tools
+from app.core.snapshot import SpecSnapshot
 
-# Global variables to cache loaded configuration data
-# This ensures we only load files once and reuse the data
-_TOOLS: List[Dict[str, Any]] = None
-_PROVIDERS: List[Dict[str, Any]] = None
+# Global registries holding the current snapshot of each configuration file
+_TOOLS = SpecRegistry(cfg.TOOLS_FILE, validate_tools)
+_PROVIDERS = SpecRegistry(cfg.PROVIDERS_FILE, validate_providers)
+
+# Watcher reloading both files on change, started with the application
+_WATCHER: SpecWatcher = None
+
+def get_tools_snapshot() -> Optional[SpecSnapshot]:
+    """
+    Get tool specifications with their pre-serialized JSON body, ETag and version.
+    
+    Returns:
+        Optional[SpecSnapshot]: Current snapshot of the tools configuration file,
+            or None if it has never been loaded successfully
+    """
+    return _TOOLS.snapshot
+
+def get_providers_snapshot() -> Optional[SpecSnapshot]:
+    """
+    Get provider configurations with their pre-serialized JSON body, ETag and version.
+    
+    Returns:
+        Optional[SpecSnapshot]: Current snapshot of the providers configuration file,
+            or None if it has never been loaded successfully
+    """
+    return _PROVIDERS.snapshot
 
 def get_tools():
     """
     Get tool specifications from the configuration file.
     
-    This function loads the tools configuration file if it hasn't been loaded yet,
-    and returns the parsed tool specifications. The result is cached for future calls.
-    
     Returns:
-        List[Dict[str, Any]]: List of tool specifications
+        List[Dict[str, Any]]: List of tool specifications (empty if unavailable)
     """
-    global _TOOLS
-    if _TOOLS is None:
-        _TOOLS = load_yaml_file(cfg.TOOLS_FILE)
-    return _TOOLS
+    snapshot = get_tools_snapshot()
+    return snapshot.data if snapshot else []
 
 def get_providers():
     """
     Get provider configurations from the configuration file.
     
-    This function loads the providers configuration file if it hasn't been loaded yet,
-    and returns the parsed provider configurations. The result is cached for future calls.
-    
     Returns:
-        List[Dict[str, Any]]: List of provider configurations
+        List[Dict[str, Any]]: List of provider configurations (empty if unavailable)
     """
-    global _PROVIDERS
-    if _PROVIDERS is None:
-        _PROVIDERS = load_yaml_file(cfg.PROVIDERS_FILE)
-    return _PROVIDERS
\ No newline at end of file
+    snapshot = get_providers_snapshot()
+    return snapshot.data if snapshot else []
+
+def start_spec_watcher() -> None:
+    """Load both configuration files and start watching them for changes, if enabled."""
+    global _WATCHER
+    get_tools_snapshot()
+    get_providers_snapshot()
+    if cfg.SPEC_WATCH_INTERVAL > 0 and _WATCHER is None:
+        _WATCHER = SpecWatcher([_TOOLS, _PROVIDERS], interval=cfg.SPEC_WATCH_INTERVAL)
+        _WATCHER.start()
+
+def stop_spec_watcher() -> None:
+    """Stop watching the configuration files."""
+    global _WATCHER
+    if _WATCHER is not None:
+        _WATCHER.stop()
+        _WATCHER = None
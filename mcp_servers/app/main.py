@@ -2,18 +2,30 @@
 Main application module for the MCP Servers.
 
 This module initializes the FastAPI application and sets up the API routes
-for tools and providers endpoints.
+for tools and providers endpoints. The specification files are watched for
+changes for as long as the application runs.
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from app.api import health, tools, providers
+from app.api import health, tools, providers, version
+from app.dependencies import start_spec_watcher, stop_spec_watcher
 
 from app.core.config import API_V1_BASE_ROUTE
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the specification files and hot-reload them while the application runs."""
+    start_spec_watcher()
+    yield
+    stop_spec_watcher()
+
 app = FastAPI(
     title='MCP Servers for Financial Tools',
     description='MCP Servers that provides tool specifications and provider configurations for financial data',
-    version='0.0.1'
+    version='0.0.1',
+    lifespan=lifespan
 )
 
 # Include the health check endpoint for monitoring application status
@@ -24,3 +36,6 @@ app.include_router(tools.router, prefix=API_V1_BASE_ROUTE, tags=['tools'])
 
 # Include the providers endpoint for providing provider configurations
 app.include_router(providers.router, prefix=API_V1_BASE_ROUTE, tags=['providers'])
+
+# Include the version endpoint exposing the live specification snapshots
+app.include_router(version.router, prefix=API_V1_BASE_ROUTE, tags=['version'])
\ No newline at end of file
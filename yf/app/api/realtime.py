@@ -3,9 +3,10 @@ Real-time price API endpoint for the Yahoo Finance service.
 
 This module defines the endpoint for retrieving real-time stock prices from Yahoo Finance.
 """
+from typing import List
 from fastapi import APIRouter
-from app.schemas import StockRealtimePrice
-from app.tools.fetch_realtime_stock import fetch_stock_realtime_price
+from app.schemas import StockRealtimePrice, StockRealtimePriceBatchRequest
+from app.tools.fetch_realtime_stock import fetch_stock_realtime_price, fetch_stocks_realtime_price
 
 router = APIRouter()
 
@@ -24,4 +25,28 @@ def get_stock_realtime_price(ticker: str) -> StockRealtimePrice:
     Returns:
         StockRealtimePrice: Real-time price data or error information
     """
-    return fetch_stock_realtime_price(ticker)
\ No newline at end of file
+    return fetch_stock_realtime_price(ticker)
+
+@router.post('/market/tickers/price/realtime',
+             response_model=List[StockRealtimePrice])
+def get_stocks_realtime_price(request: StockRealtimePriceBatchRequest) -> List[StockRealtimePrice]:
+    """
+    Get real-time stock price data for several tickers in one request.
+    
+    Tickers are fetched concurrently from Yahoo Finance with a bounded worker pool,
+    so a whole watchlist costs a single round trip.
+    
+    Example request:
+    ```
+    {
+        "tickers": ["AAPL", "NVDA", "FPT.VN"]
+    }
+    ```
+    
+    Args:
+        request (StockRealtimePriceBatchRequest): Contains the list of ticker symbols
+        
+    Returns:
+        List[StockRealtimePrice]: Real-time price data or error information, in request order
+    """
+    return fetch_stocks_realtime_price(request.tickers)
@@ -10,4 +10,17 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # API base route configuration
-API_V1_BASE_ROUTE = os.getenv('API_V1_BASE_ROUTE', '/api/v1')
\ No newline at end of file
+API_V1_BASE_ROUTE = os.getenv('API_V1_BASE_ROUTE', '/api/v1')
+# Batch real-time price configuration
+# Maximum number of tickers accepted in one batch request
+REALTIME_BATCH_MAX_TICKERS = int(os.getenv('REALTIME_BATCH_MAX_TICKERS', '50'))
+# Size of the worker pool shared by all batch requests to bound upstream concurrency
+REALTIME_BATCH_MAX_WORKERS = int(os.getenv('REALTIME_BATCH_MAX_WORKERS', '8'))
+
+# Real-time quote cache configuration
+QUOTE_CACHE_ENABLED = True if os.getenv('QUOTE_CACHE_ENABLED', 'true').lower() in ['true', '1'] else False
+# Freshness window (seconds) of a cached quote while the market is open / closed
+QUOTE_CACHE_TTL_OPEN_SECONDS = float(os.getenv('QUOTE_CACHE_TTL_OPEN_SECONDS', '5'))
+QUOTE_CACHE_TTL_CLOSED_SECONDS = float(os.getenv('QUOTE_CACHE_TTL_CLOSED_SECONDS', '300'))
+# Maximum number of tickers kept in the cache
+QUOTE_CACHE_MAX_ENTRIES = int(os.getenv('QUOTE_CACHE_MAX_ENTRIES', '5000'))
@@ -5,7 +5,9 @@ This module defines the data models used for validating and serializing
 real-time stock price data.
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+
+import app.core.config as cfg
 
 class StockRealtimePrice(BaseModel):
     """
@@ -20,5 +22,15 @@ class StockRealtimePrice(BaseModel):
     day_low: Optional[float] = Field(None, description="Lowest price of the day")
     last_price: Optional[float] = Field(None, description="Price at the time of API call")
     last_volume: Optional[float] = Field(None, description="Trading volume at the time of API call")
-    ts: int = Field(..., description="Timestamp when the response was generated")
+    ts: int = Field(..., description="Timestamp when the quote was fetched from Yahoo Finance")
+    cache_age_seconds: Optional[float] = Field(None, description="Seconds elapsed since the quote was fetched; 0 if fetched for this request")
     error: Optional[str] = Field(None, description="Error message if data could not be retrieved")
+
+class StockRealtimePriceBatchRequest(BaseModel):
+    """
+    Schema for batch real-time stock price requests.
+    """
+    tickers: List[str] = Field(...,
+                               min_length=1,
+                               max_length=cfg.REALTIME_BATCH_MAX_TICKERS,
+                               description='Stock ticker symbols to fetch, e.g. ["AAPL", "NVDA", "FPT.VN"]')
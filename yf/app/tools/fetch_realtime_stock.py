@@ -4,37 +4,62 @@ Yahoo Finance real-time stock price fetcher.
 This module provides functionality to fetch real-time stock price data from Yahoo Finance
 using the yfinance library. It handles error cases and returns structured data.
 """
+import time
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
+import app.core.config as cfg
 from app.schemas import StockRealtimePrice
+from app.tools.quote_cache import QuoteCache
 
-def fetch_stock_realtime_price(ticker: str) -> StockRealtimePrice:
+# Process-wide quote cache shared by single and batch requests
+_QUOTE_CACHE = QuoteCache(
+    ttl_open=cfg.QUOTE_CACHE_TTL_OPEN_SECONDS,
+    ttl_closed=cfg.QUOTE_CACHE_TTL_CLOSED_SECONDS,
+    max_entries=cfg.QUOTE_CACHE_MAX_ENTRIES
+)
+
+# Worker pool shared by all batch requests, so the total number of concurrent
+# upstream calls stays bounded regardless of how many batches are in flight
+_BATCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=cfg.REALTIME_BATCH_MAX_WORKERS,
+    thread_name_prefix='yf-realtime'
+)
+
+def _is_market_open(yf_ticker: yf.Ticker) -> Optional[bool]:
     """
-    Fetch real-time stock price data from Yahoo Finance API.
+    Tell whether the ticker's exchange is in its regular trading session.
     
-    This function retrieves current price information for a specified stock ticker
-    from Yahoo Finance's API using the yfinance library.
-    
-    Usage scenarios:
-    - When users ask about "current price", "today's price", "current value"
-    - When users want to know intraday movements like "opening price", "highest", "lowest"
-    - Examples: "What's FPT's price today?", "What's VNM going for?", "Check Apple's price"
-    
-    Limitations:
-    - This tool does NOT fetch historical data (e.g., last week's price)
-    - This tool does NOT fetch news or financial reports
+    Uses the trading period from the price history metadata, which is already
+    loaded by `fast_info`. Returns None if the market state cannot be determined.
+    """
+    try:
+        regular = yf_ticker.get_history_metadata().get('currentTradingPeriod', {}).get('regular', {})
+        start, end = regular.get('start'), regular.get('end')
+        if start is None or end is None:
+            return None
+        return start <= time.time() < end
+    except Exception:
+        return None
+
+def _fetch_from_yahoo(ticker: str) -> Tuple[StockRealtimePrice, Optional[bool]]:
+    """
+    Fetch real-time stock price data from Yahoo Finance API, bypassing the quote cache.
     
     Args:
         ticker (str): Stock ticker symbol to fetch data for
         
     Returns:
-        StockRealtimePrice: Contains real-time price data or error information
+        Tuple[StockRealtimePrice, Optional[bool]]: The quote (or error information) and
+            whether the market is currently open (None if unknown)
     """
     current_ts = int(datetime.now(timezone.utc).timestamp())
     try:
         # fast_info is a good choice for performance
-        info = yf.Ticker(ticker).fast_info
+        yf_ticker = yf.Ticker(ticker)
+        info = yf_ticker.fast_info
         
         # Check if price data is available
         if not info or info.last_price is None:
@@ -42,7 +67,7 @@ def fetch_stock_realtime_price(ticker: str) -> StockRealtimePrice:
                 ticker=ticker,
                 ts=current_ts,
                 error=f"No real-time trading data found for ticker '{ticker}'."
-            )
+            ), None
 
         return StockRealtimePrice(
             ticker=ticker,
@@ -52,11 +77,61 @@ def fetch_stock_realtime_price(ticker: str) -> StockRealtimePrice:
             day_low=info.day_low,
             last_price=info.last_price,
             last_volume=info.last_volume
-        )
+        ), _is_market_open(yf_ticker)
     except Exception as e:
         # Catch other errors (e.g., network, non-existent ticker)
         return StockRealtimePrice(
             ticker=ticker,
             ts=current_ts,
             error=f"An error occurred while querying data for ticker {ticker}: {e}"
-        )
\ No newline at end of file
+        ), None
+
+def fetch_stock_realtime_price(ticker: str) -> StockRealtimePrice:
+    """
+    Fetch real-time stock price data from Yahoo Finance API.
+    
+    This function retrieves current price information for a specified stock ticker
+    from Yahoo Finance's API using the yfinance library. Successful quotes are cached
+    for a freshness window that depends on whether the market is open, and concurrent
+    requests for the same ticker share one upstream fetch. `ts` is the time the quote
+    was fetched and `cache_age_seconds` tells how long ago that was.
+    
+    Usage scenarios:
+    - When users ask about "current price", "today's price", "current value"
+    - When users want to know intraday movements like "opening price", "highest", "lowest"
+    - Examples: "What's FPT's price today?", "What's VNM going for?", "Check Apple's price"
+    
+    Limitations:
+    - This tool does NOT fetch historical data (e.g., last week's price)
+    - This tool does NOT fetch news or financial reports
+    
+    Args:
+        ticker (str): Stock ticker symbol to fetch data for
+        
+    Returns:
+        StockRealtimePrice: Contains real-time price data or error information
+    """
+    key = ticker.strip().upper()
+    if not cfg.QUOTE_CACHE_ENABLED:
+        quote, _ = _fetch_from_yahoo(key)
+        return quote.model_copy(update={'cache_age_seconds': 0.0})
+    return _QUOTE_CACHE.get_or_fetch(key, lambda: _fetch_from_yahoo(key))
+
+def fetch_stocks_realtime_price(tickers: List[str]) -> List[StockRealtimePrice]:
+    """
+    Fetch real-time stock price data for several tickers concurrently.
+    
+    Each distinct ticker is fetched once on the shared bounded worker pool,
+    and results are returned in the same order as the requested tickers.
+    
+    Args:
+        tickers (List[str]): Stock ticker symbols to fetch data for
+        
+    Returns:
+        List[StockRealtimePrice]: One entry per requested ticker, with price data or error information
+    """
+    unique_tickers = list(dict.fromkeys(tickers))
+    results: Dict[str, StockRealtimePrice] = dict(
+        zip(unique_tickers, _BATCH_EXECUTOR.map(fetch_stock_realtime_price, unique_tickers))
+    )
+    return [results[ticker] for ticker in tickers]
@@ -0,0 +1,88 @@
+"""
+In-process real-time quote cache for the Yahoo Finance service.
+
+This module keeps recently fetched quotes in memory with a freshness window that
+depends on the market state (short while the market is open, longer while it is
+closed), and coalesces concurrent requests for the same ticker so that a burst
+of requests shares a single upstream fetch.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from app.schemas import StockRealtimePrice
+
+# A fetch function returns the quote and whether the market is open (None if unknown)
+QuoteFetcher = Callable[[], Tuple[StockRealtimePrice, Optional[bool]]]
+
+class QuoteCache:
+    """
+    TTL cache of real-time quotes with single-flight request coalescing.
+
+    Only successful quotes are cached; error responses are returned to every
+    coalesced caller but never served from the cache afterwards.
+    """
+    def __init__(self, ttl_open: float, ttl_closed: float, max_entries: int):
+        self.ttl_open = ttl_open
+        self.ttl_closed = ttl_closed
+        self.max_entries = max_entries
+        # ticker -> (quote, fetched_at (monotonic), market_open)
+        self._entries: "OrderedDict[str, Tuple[StockRealtimePrice, float, Optional[bool]]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _ttl(self, market_open: Optional[bool]) -> float:
+        # Unknown market state is treated as open, the conservative choice
+        return self.ttl_closed if market_open is False else self.ttl_open
+
+    def _with_age(self, quote: StockRealtimePrice, fetched_at: float) -> StockRealtimePrice:
+        return quote.model_copy(update={'cache_age_seconds': round(time.monotonic() - fetched_at, 3)})
+
+    def get_or_fetch(self, key: str, fetch: QuoteFetcher) -> StockRealtimePrice:
+        """
+        Return a fresh cached quote for `key`, or fetch it once for all concurrent callers.
+
+        Args:
+            key (str): Normalized ticker symbol
+            fetch (QuoteFetcher): Function fetching the quote from upstream
+
+        Returns:
+            StockRealtimePrice: The quote with `cache_age_seconds` set
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                quote, fetched_at, market_open = entry
+                if time.monotonic() - fetched_at < self._ttl(market_open):
+                    # Least recently used quotes are evicted first
+                    self._entries.move_to_end(key)
+                    return self._with_age(quote, fetched_at)
+                del self._entries[key]
+
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if is_leader:
+            try:
+                quote, market_open = fetch()
+                fetched_at = time.monotonic()
+                if quote.error is None:
+                    with self._lock:
+                        self._entries[key] = (quote, fetched_at, market_open)
+                        while len(self._entries) > self.max_entries:
+                            self._entries.popitem(last=False)
+                future.set_result((quote, fetched_at))
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+        quote, fetched_at = future.result()
+        return self._with_age(quote, fetched_at)